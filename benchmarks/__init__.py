@@ -0,0 +1,6 @@
+"""Benchmarks for HWP Helper hot paths.
+
+Run a benchmark from the repository root, for example::
+
+    python -m benchmarks.bench_render_pool
+"""
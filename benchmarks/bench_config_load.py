@@ -0,0 +1,86 @@
+"""Measure configuration load time with many saved font styles.
+
+Writes a configuration holding copies of a real CharShape/ParaShape style
+(500 by default) and times ``ConfigManager`` loading it through the pure
+Python YAML loader, the libyaml loader and the marshal cache::
+
+    python -m benchmarks.bench_config_load --styles 500
+"""
+
+import argparse
+import copy
+import tempfile
+import uuid
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable, Dict
+
+import yaml
+
+from hwp_helper.core import config as config_module
+from hwp_helper.core.config import ConfigManager
+
+SETTING_FILE = Path(__file__).resolve().parent.parent / "setting.yaml"
+
+
+def make_settings(styles: int) -> Dict[str, Any]:
+    """Settings with ``styles`` copies of the first style in setting.yaml."""
+    with open(SETTING_FILE, 'r', encoding='utf-8') as f:
+        settings = yaml.safe_load(f)
+    style = next(iter(settings["font_styles"].values()))
+    settings["font_styles"] = {
+        str(uuid.uuid1()): copy.deepcopy(style) for _ in range(styles)
+    }
+    return settings
+
+
+def time_load(path: Path, repeat: int, setup: Callable[[], None]) -> float:
+    """Median seconds to construct a ConfigManager for ``path``."""
+    times = []
+    for _ in range(repeat):
+        setup()
+        start = perf_counter()
+        ConfigManager(str(path))
+        times.append(perf_counter() - start)
+    return median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--styles", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        path = Path(root) / "setting.yaml"
+        with open(path, 'w', encoding='utf-8') as f:
+            yaml.safe_dump(make_settings(args.styles), f, allow_unicode=True)
+        cache = path.with_name(path.name + ".cache")
+
+        def no_cache() -> None:
+            cache.unlink(missing_ok=True)
+
+        loader = config_module.SafeLoader
+        results = {}
+        try:
+            config_module.SafeLoader = yaml.SafeLoader
+            results["python yaml"] = time_load(path, args.repeat, no_cache)
+            if yaml.__with_libyaml__:
+                config_module.SafeLoader = yaml.CSafeLoader
+                results["libyaml"] = time_load(path, args.repeat, no_cache)
+        finally:
+            config_module.SafeLoader = loader
+        ConfigManager(str(path))
+        results["cache"] = time_load(path, args.repeat, lambda: None)
+        size = path.stat().st_size
+
+    baseline = results["python yaml"]
+    print(f"{args.styles} styles, {size / 1024:.0f} KiB of YAML")
+    print(f"{'loader':>12} {'ms':>9} {'speedup':>8}")
+    for name, elapsed in results.items():
+        print(f"{name:>12} {elapsed * 1000:>9.2f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Compare crop_background against the previous ImageChops implementation.
+
+Runs over a folder of page renders (PNG files). Without a folder, synthetic
+A4 pages at 150 dpi are generated::
+
+    python -m benchmarks.bench_crop_background [pages_dir]
+
+Each implementation runs in its own process so peak memory is measured
+independently. Peak memory is the process peak RSS where the ``resource``
+module exists, otherwise the tracemalloc peak.
+"""
+
+import argparse
+import multiprocessing
+import tempfile
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+from PIL import Image, ImageChops, ImageDraw
+
+
+def legacy_crop_background(image_path: str) -> Optional[Image.Image]:
+    """The ImageChops implementation crop_background replaced."""
+    img = Image.open(image_path)
+    bg = Image.new(img.mode, img.size, img.getpixel((0, 0)))
+    diff = ImageChops.difference(img, bg)
+    diff = ImageChops.add(diff, diff, 2.0, -100)
+    bbox = diff.getbbox()
+    if not bbox:
+        return None
+    if bbox[2] - bbox[0] < 300:
+        bbox = (bbox[0], bbox[1], bbox[0] + 300, bbox[3])
+    bbox = (bbox[0]-2, bbox[1]-2, bbox[2]+2, bbox[3]+2)
+    return img.crop(bbox)
+
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def _peak_memory_mb() -> float:
+    if resource is None:
+        return tracemalloc.get_traced_memory()[1] / 2 ** 20
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _measure(name: str, paths: List[str], queue: "multiprocessing.Queue") -> None:
+    from hwp_helper.utils.image_utils import crop_background
+
+    func = crop_background if name == "numpy" else legacy_crop_background
+    if resource is None:
+        # tracemalloc slows allocation down, so it is only a fallback
+        tracemalloc.start()
+    start = perf_counter()
+    sizes = []
+    for path in paths:
+        cropped = func(path)
+        sizes.append(cropped.size if cropped else None)
+    elapsed = perf_counter() - start
+    queue.put((elapsed, _peak_memory_mb(), sizes))
+
+
+def run(name: str, paths: List[str]) -> Tuple[float, float, list]:
+    """Run one implementation in a fresh process."""
+    queue: "multiprocessing.Queue" = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_measure, args=(name, paths, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def make_pages(folder: Path, count: int = 20) -> List[str]:
+    """Write synthetic page renders with content in the upper part."""
+    paths = []
+    for i in range(count):
+        page = Image.new("RGB", (1240, 1754), "white")
+        draw = ImageDraw.Draw(page)
+        draw.rectangle((120, 140, 1120, 160 + 20 * i), outline="black", width=2)
+        draw.text((140, 170), f"Template {i}", fill="black")
+        path = folder / f"page_{i}.png"
+        page.save(path)
+        paths.append(str(path))
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("pages_dir", nargs="?", help="folder of PNG page renders")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp:
+        if args.pages_dir:
+            paths = sorted(str(p) for p in Path(args.pages_dir).glob("*.png"))
+        else:
+            paths = make_pages(Path(temp))
+
+        results = {name: run(name, paths) for name in ("legacy", "numpy")}
+
+    assert results["legacy"][2] == results["numpy"][2], "crop results differ"
+    print(f"{len(paths)} pages")
+    print(f"{'impl':>8} {'seconds':>9} {'ms/page':>8} {'peak MB':>8}")
+    for name, (elapsed, peak, _) in results.items():
+        print(f"{name:>8} {elapsed:>9.3f} {elapsed / len(paths) * 1000:>8.1f} {peak:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
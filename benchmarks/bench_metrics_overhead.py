@@ -0,0 +1,54 @@
+"""Measure the cost latency metrics, tracing and call recording add to each HWP operation.
+
+Runs an operation making one action call through ``HwpAppManager.run`` on
+the simulated engine with instrumentation off, with metrics, with tracing
+and with call recording::
+
+    python -m benchmarks.bench_metrics_overhead --calls 20000
+"""
+
+import argparse
+from time import perf_counter
+
+from hwp_helper.core.app_manager import HwpAppManager
+from hwp_helper.core.simulated import SimulatedApp
+
+
+def time_calls(manager: HwpAppManager, calls: int) -> float:
+    """Microseconds per ``run`` of the operation."""
+    start = perf_counter()
+    for _ in range(calls):
+        manager.run(lambda app: app.actions.Cancel().run(), foreground=False, name="cancel")
+    return (perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    app = SimulatedApp()
+    manager = HwpAppManager(connector=lambda: app)
+    try:
+        manager.get_or_create_app()
+        disabled = time_calls(manager, args.calls)
+        manager.metrics.enabled = True
+        metrics = time_calls(manager, args.calls)
+        manager.metrics.enabled = False
+        manager.tracer.enabled = True
+        tracing = time_calls(manager, args.calls)
+        manager.tracer.enabled = False
+        manager.recorder.enabled = True
+        recording = time_calls(manager, args.calls)
+    finally:
+        manager.cleanup()
+    print(f"disabled: {disabled:.2f} us/call")
+    print(f"metrics:  {metrics:.2f} us/call (+{metrics - disabled:.2f})")
+    print(f"tracing:  {tracing:.2f} us/call (+{tracing - disabled:.2f}), "
+          f"{len(manager.tracer)} events kept of {manager.tracer.capacity}")
+    print(f"recording: {recording:.2f} us/call (+{recording - disabled:.2f}), "
+          f"{len(manager.recorder)} calls kept")
+
+
+if __name__ == "__main__":
+    main()
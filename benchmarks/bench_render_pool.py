@@ -0,0 +1,58 @@
+"""Measure template rendering throughput against the number of engine workers.
+
+Uses the simulated HWP engine, so it runs without HWP installed::
+
+    python -m benchmarks.bench_render_pool --templates 100 --latency 0.02
+"""
+
+import argparse
+import os
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from hwp_helper.core.simulated import SimulatedApp
+from hwp_helper.services.template_service import TemplateService
+
+
+def run(templates: int, latency: float, workers: int) -> float:
+    """Render ``templates`` fake templates and return the elapsed seconds."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as root:
+        os.chdir(root)
+        try:
+            Path("templates").mkdir()
+            for i in range(templates):
+                (Path("templates") / f"bench_{i}.hwp").write_bytes(b"x" * i)
+
+            service = TemplateService(
+                app_factory=lambda: SimulatedApp(latency=latency), workers=workers
+            )
+            start = perf_counter()
+            for _ in service.update_templates():
+                pass
+            elapsed = perf_counter() - start
+            assert service.last_report.rendered == templates
+            return elapsed
+        finally:
+            os.chdir(cwd)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--templates", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.02,
+                        help="simulated seconds per COM call")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    baseline = None
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8}")
+    for workers in args.workers:
+        elapsed = run(args.templates, args.latency, workers)
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>9.2f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
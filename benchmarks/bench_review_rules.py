@@ -0,0 +1,65 @@
+"""Compare running review rules one pass each with the compiled plan.
+
+Runs the double-space and KoPub font rule sets against the simulated
+engine, whose ``replace_all`` passes take ``--pass-seconds`` each, with the
+fonts of each saved HWP file inventoried for the plan. ``--rules`` also
+prints the per-rule report of each plan run::
+
+    python -m benchmarks.bench_review_rules test.hwp --pass-seconds 0.05
+"""
+
+import argparse
+from pathlib import Path
+from time import perf_counter
+from typing import List, Tuple
+
+from hwp_helper.core.simulated import SimulatedApp
+from hwp_helper.services.font_inventory import read_font_usage
+from hwp_helper.services.review_rules import (
+    COLOR_DOUBLE_SPACE_RULES, UNCOLOR_DOUBLE_SPACE_RULES, ReviewPlan, ReviewReport, ReviewRule,
+    kopub_font_rules,
+)
+
+RULE_SETS = {
+    "color": COLOR_DOUBLE_SPACE_RULES,
+    "uncolor": UNCOLOR_DOUBLE_SPACE_RULES,
+    "fonts": kopub_font_rules(),
+}
+
+
+def run(path: Path, rules: List[ReviewRule], pass_seconds: float) -> Tuple[float, float, ReviewReport]:
+    """Return (inventory ms, one-pass-per-rule seconds, plan report)."""
+    start = perf_counter()
+    usage = read_font_usage(path)
+    inventory_ms = (perf_counter() - start) * 1000
+
+    legacy = SimulatedApp(replace_seconds=pass_seconds)
+    start = perf_counter()
+    for rule in rules:
+        ReviewPlan([rule]).run(legacy)
+    legacy_seconds = perf_counter() - start
+
+    app = SimulatedApp(replace_seconds=pass_seconds)
+    return inventory_ms, legacy_seconds, ReviewPlan(rules, usage=usage).run(app)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("paths", type=Path, nargs="+")
+    parser.add_argument("--pass-seconds", type=float, default=0.05,
+                        help="simulated seconds per replace_all pass")
+    parser.add_argument("--rules", action="store_true", help="print the per-rule reports")
+    args = parser.parse_args()
+
+    print(f"{'file':>20} {'rules':>8} {'inventory ms':>13} {'passes':>7} {'legacy s':>9} {'plan s':>7}")
+    for path in args.paths:
+        for name, rules in RULE_SETS.items():
+            inventory_ms, legacy, report = run(path, rules, args.pass_seconds)
+            print(f"{path.name[-20:]:>20} {name:>8} {inventory_ms:>13.2f} {report.passes:>3}/{len(rules):<3} "
+                  f"{legacy:>9.2f} {report.elapsed:>7.2f}")
+            if args.rules:
+                print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Run the hot paths against the simulated HWP engine.
+
+Covers template rendering, template insertion, the review commands and
+acquiring the app, from a cold HWP start to reconnecting after HWP was
+closed. Every scenario reports its COM round trips and wall time per run::
+
+    python -m benchmarks.bench_simulated_suite --latency 0.001
+    python -m benchmarks.bench_simulated_suite --failure-rate 0.01 --seed 1
+
+With ``--failure-rate`` calls fail with ``com_error`` at random; runs that
+still fail after the app manager's retry are counted as errors.
+"""
+
+import argparse
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+from hwp_helper.callbacks.hwp_callbacks import color_double_space, process_font
+from hwp_helper.core.app_manager import HwpAppManager
+from hwp_helper.core.simulated import SimulatedApp, SimulatedEngines
+from hwp_helper.services.hwp_operations import HwpOperationService
+from hwp_helper.services.template_service import TemplateService
+from hwp_helper.utils.com_utils import com_error
+
+SAMPLE_DOCUMENT = Path(__file__).resolve().parent.parent / "test.hwp"
+
+
+@dataclass
+class ScenarioResult:
+    """Totals of one scenario over all its runs."""
+
+    name: str
+    runs: int
+    calls: int
+    failures: int
+    errors: int
+    seconds: float
+
+
+def _manager(engines: SimulatedEngines, **options: Any) -> HwpAppManager:
+    return HwpAppManager(connector=engines.connect, launcher=engines.launch,
+                         discover=lambda: Path("hwp.exe"), **options)
+
+
+def _timed_runs(name: str, engines: SimulatedEngines, repeat: int,
+                run: Callable[[], Any]) -> ScenarioResult:
+    """Call ``run`` ``repeat`` times, counting runs that raise ``com_error``."""
+    calls, failures = engines.calls, engines.failures
+    errors = 0
+    start = perf_counter()
+    for _ in range(repeat):
+        try:
+            run()
+        except com_error:
+            errors += 1
+    elapsed = perf_counter() - start
+    return ScenarioResult(name, repeat, engines.calls - calls,
+                          engines.failures - failures, errors, elapsed)
+
+
+def render_templates(options: Dict[str, Any], repeat: int) -> ScenarioResult:
+    """Render ``repeat`` templates with one hidden engine."""
+    apps: List[SimulatedApp] = []
+
+    def factory() -> SimulatedApp:
+        apps.append(SimulatedApp(**options))
+        return apps[-1]
+
+    Path("templates").mkdir()
+    for i in range(repeat):
+        (Path("templates") / f"분류_서식{i}.hwp").write_bytes(b"x" * (i + 1))
+    service = TemplateService(app_factory=factory, workers=1)
+    start = perf_counter()
+    for _ in service.update_templates():
+        pass
+    elapsed = perf_counter() - start
+    return ScenarioResult("render templates", repeat, sum(app.calls for app in apps),
+                          sum(app.failures for app in apps), service.last_report.failed, elapsed)
+
+
+def insert_template(options: Dict[str, Any], repeat: int) -> ScenarioResult:
+    """Insert a template and move past it, through ``HwpOperationService``."""
+    engines = SimulatedEngines(running=1, **options)
+    operations = HwpOperationService(_manager(engines))
+    template = Path("template.hwp")
+    template.write_bytes(b"x")
+    operations.app_manager.get_or_create_app()
+    return _timed_runs("insert template", engines, repeat,
+                       lambda: operations.insert_template(str(template), move_count=3))
+
+
+def review_commands(options: Dict[str, Any], repeat: int) -> List[ScenarioResult]:
+    """Run the double-space and KoPub font commands on the sample document."""
+    results = []
+    for name, command in (("review double spaces", color_double_space),
+                          ("review fonts", process_font)):
+        engines = SimulatedEngines(running=1, **options)
+        manager = _manager(engines)
+        manager.get_or_create_app().open(SAMPLE_DOCUMENT)
+        results.append(_timed_runs(name, engines, repeat, lambda: command(manager)))
+    return results
+
+
+def acquire_app(options: Dict[str, Any], repeat: int, startup: float) -> List[ScenarioResult]:
+    """Acquire the app from a cold start, a running HWP, the cache and after a restart."""
+    results = []
+    cold_engines: List[SimulatedEngines] = []
+
+    def cold() -> None:
+        engines = SimulatedEngines(startup=startup, **options)
+        _manager(engines).get_or_create_app()
+        cold_engines.append(engines)
+
+    start = perf_counter()
+    for _ in range(repeat):
+        cold()
+    results.append(ScenarioResult(
+        "acquire: launch HWP", repeat, sum(e.calls for e in cold_engines),
+        sum(e.failures for e in cold_engines), 0, perf_counter() - start
+    ))
+
+    engines = SimulatedEngines(running=1, **options)
+    results.append(_timed_runs("acquire: running HWP", engines, repeat,
+                               lambda: _manager(engines).get_or_create_app()))
+
+    manager = _manager(engines)
+    manager.get_or_create_app()
+    results.append(_timed_runs("acquire: cached", engines, repeat, manager.get_or_create_app))
+
+    manager = _manager(engines, liveness_ttl=0.0)
+    manager.get_or_create_app()
+    results.append(_timed_runs("acquire: probed", engines, repeat, manager.get_or_create_app))
+
+    def after_restart() -> None:
+        # HWP was closed and started again since the last operation
+        engines.close()
+        engines.launch()
+        manager.run(lambda app: app.api.GetPos(), foreground=False)
+
+    engines = SimulatedEngines(running=1, **options)
+    manager = _manager(engines)
+    manager.get_or_create_app()
+    results.append(_timed_runs("acquire: after restart", engines, repeat, after_restart))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.001,
+                        help="simulated seconds per COM call")
+    parser.add_argument("--pass-seconds", type=float, default=0.01,
+                        help="simulated seconds per replace_all pass")
+    parser.add_argument("--startup", type=float, default=0.5,
+                        help="simulated seconds for HWP to start")
+    parser.add_argument("--failure-rate", type=float, default=0.0,
+                        help="probability of any call failing with com_error")
+    parser.add_argument("--seed", type=int, help="seed for the injected failures")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    options = dict(latency=args.latency, replace_seconds=args.pass_seconds,
+                   failure_rate=args.failure_rate, seed=args.seed)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as root:
+        os.chdir(root)
+        try:
+            results = [render_templates(options, args.repeat),
+                       insert_template(options, args.repeat),
+                       *review_commands(options, args.repeat),
+                       *acquire_app(options, args.repeat, args.startup)]
+        finally:
+            os.chdir(cwd)
+
+    print(f"{'scenario':>24} {'runs':>5} {'calls/run':>10} {'failures':>9} {'errors':>7} {'ms/run':>9}")
+    for result in results:
+        print(f"{result.name:>24} {result.runs:>5} {result.calls / result.runs:>10.1f} "
+              f"{result.failures:>9} {result.errors:>7} {result.seconds / result.runs * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
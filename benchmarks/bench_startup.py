@@ -0,0 +1,105 @@
+"""Measure the time to interactive of the main window with a large template library.
+
+Creates a library of empty templates and previews (5,000 by default) in a
+temporary folder and builds ``MainWindow`` against a page stand-in::
+
+    python -m benchmarks.bench_startup --templates 5000
+
+"eager" builds the templates page before the window is returned, as the
+window used to. "lazy" returns once the features page is built and builds
+the templates page on a background thread. For lazy, the time until that
+page is ready is reported too.
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+from typing import List, Tuple
+
+
+class BenchPage:
+    """Just enough of ``ft.Page`` for ``MainWindow`` to be built headless."""
+
+    def __init__(self):
+        self.title = ""
+        self.threads: List[threading.Thread] = []
+
+    def add(self, *controls) -> None:
+        pass
+
+    def update(self, *controls) -> None:
+        pass
+
+    def run_thread(self, handler, *args, **kwargs) -> None:
+        thread = threading.Thread(target=handler, args=args, kwargs=kwargs, daemon=True)
+        self.threads.append(thread)
+        thread.start()
+
+
+def make_library(templates: int, categories: int = 50) -> None:
+    """Write empty templates and previews and index them in the catalog."""
+    from hwp_helper.services.template_catalog import TemplateCatalog
+
+    Path("templates").mkdir()
+    Path("images").mkdir()
+    for i in range(templates):
+        stem = f"분류{i % categories}_서식{i}"
+        (Path("templates") / f"{stem}.hwp").touch()
+        (Path("images") / f"{stem}_{i % 7}.png").touch()
+    TemplateCatalog().rebuild()
+
+
+def run(lazy: bool) -> Tuple[float, float]:
+    """Build the window once and return (interactive, templates ready) seconds."""
+    from hwp_helper.core.helper import HwpHelper
+    from hwp_helper.ui.main_window import MainWindow
+
+    page = BenchPage()
+    start = perf_counter()
+    helper = HwpHelper(page)
+    window = MainWindow(helper, prebuild_pages=lazy)
+    if not lazy:
+        window.templates_page
+    interactive = perf_counter() - start
+    for thread in page.threads:
+        thread.join()
+    ready = perf_counter() - start
+    helper.app_manager.cleanup()
+    helper.config.close()
+    return interactive, ready
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--templates", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as root:
+        os.chdir(root)
+        try:
+            make_library(args.templates)
+            # Warm up imports so both modes measure window construction only
+            run(lazy=False)
+            results = {
+                mode: [run(lazy=mode == "lazy") for _ in range(args.repeat)]
+                for mode in ("eager", "lazy")
+            }
+        finally:
+            os.chdir(cwd)
+
+    print(f"{args.templates} templates, median of {args.repeat} runs")
+    print(f"{'mode':>6} {'interactive ms':>15} {'templates ready ms':>19}")
+    for mode, times in results.items():
+        interactive = median(t[0] for t in times) * 1000
+        ready = median(t[1] for t in times) * 1000
+        print(f"{mode:>6} {interactive:>15.1f} {ready:>19.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Compare COM traffic of applying a saved style in full and as a delta.
+
+Uses the first style saved in setting.yaml and the simulated engine, whose
+selection starts out identical to the style, with some properties changed,
+or entirely different::
+
+    python -m benchmarks.bench_style_apply --latency 0.001
+"""
+
+import argparse
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Tuple
+
+import yaml
+
+from hwp_helper.core.simulated import SimulatedApp, _SimulatedShape
+from hwp_helper.services.style_service import StyleService
+
+SETTING_FILE = Path(__file__).resolve().parent.parent / "setting.yaml"
+
+
+def load_style() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """First saved (charshape, parashape) style."""
+    with open(SETTING_FILE, 'r', encoding='utf-8') as f:
+        styles = yaml.safe_load(f)["font_styles"]
+    char_dict, para_dict = next(iter(styles.values()))
+    return char_dict, para_dict
+
+
+def selection(style: Dict[str, Any], changed: int) -> Dict[str, Any]:
+    """Copy of ``style`` with the first ``changed`` properties altered."""
+    shape = dict(style)
+    for key in list(shape)[:changed]:
+        shape[key] = f"other {shape[key]}"
+    return shape
+
+
+def run(mode: str, char_dict: Dict[str, Any], para_dict: Dict[str, Any],
+        changed: int, latency: float) -> Tuple[int, int, float]:
+    """Apply the style once; return (property writes, round trips, seconds)."""
+    app = SimulatedApp(
+        latency=latency,
+        char_shape=selection(char_dict, changed),
+        para_shape=selection(para_dict, changed),
+    )
+    start = perf_counter()
+    if mode == "full":
+        app.set_charshape(_SimulatedShape(char_dict))
+        app.set_parashape(_SimulatedShape(para_dict))
+    else:
+        StyleService(app_manager=None).apply(app, char_dict, para_dict)
+    elapsed = perf_counter() - start
+    assert app.char_shape == char_dict and app.para_shape == para_dict
+    return app.property_writes, app.calls, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.001,
+                        help="simulated seconds per COM call")
+    args = parser.parse_args()
+
+    char_dict, para_dict = load_style()
+    print(f"style: {len(char_dict)} char and {len(para_dict)} para properties")
+    print(f"{'changed':>8} {'mode':>6} {'writes':>7} {'calls':>6} {'ms':>8}")
+    for changed in (0, 1, 5, max(len(char_dict), len(para_dict))):
+        for mode in ("full", "delta"):
+            writes, calls, elapsed = run(mode, char_dict, para_dict, changed, args.latency)
+            print(f"{changed:>8} {mode:>6} {writes:>7} {calls:>6} {elapsed * 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
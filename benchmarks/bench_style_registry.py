@@ -0,0 +1,122 @@
+"""Measure saved-style refresh time and memory as the style list grows.
+
+Saves copies of the styles in setting.yaml, with ``--distinct`` different
+shapes among them, and compares adding one style the old way with the
+``StyleRegistry``. The old way re-parses every style and rebuilds every row;
+the registry parses and adds one row::
+
+    python -m benchmarks.bench_style_registry --sizes 50 100 200 400 800
+"""
+
+import argparse
+import copy
+import tracemalloc
+import uuid
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any, Dict, Tuple
+
+import flet as ft
+import yaml
+
+from hwp_helper.services.style_registry import StyleRegistry, _parse_charshape, _parse_parashape
+from hwp_helper.ui.components.font_manager import FontStyleManager
+
+SETTING_FILE = Path(__file__).resolve().parent.parent / "setting.yaml"
+
+
+class BenchConfig(dict):
+    """Configuration stand-in without persistence."""
+
+    def set(self, key: str, value: Any) -> None:
+        self[key] = value
+
+
+def make_styles(count: int, distinct: int) -> Dict[str, Tuple[dict, dict]]:
+    """``count`` styles as loaded from YAML, cycling through ``distinct`` shapes."""
+    with open(SETTING_FILE, 'r', encoding='utf-8') as f:
+        char_dict, para_dict = next(iter(yaml.safe_load(f)["font_styles"].values()))
+    styles = {}
+    for i in range(count):
+        char_shape, para_shape = copy.deepcopy(char_dict), copy.deepcopy(para_dict)
+        char_shape["Height"] = 1000 + i % distinct * 100
+        styles[str(uuid.uuid1())] = (char_shape, para_shape)
+    return styles
+
+
+def legacy_refresh(manager: FontStyleManager, styles: Dict[str, Tuple[dict, dict]]) -> list:
+    """Parse every style and create every row, as the manager used to."""
+    rows = []
+    for idx, (char_dict, para_dict) in styles.items():
+        charshape = _parse_charshape(char_dict)
+        _parse_parashape(para_dict)
+        rows.append(ft.Row([
+            ft.ElevatedButton(content=ft.Text("둘다적용")),
+            ft.ElevatedButton(content=ft.Text("글자적용")),
+            ft.ElevatedButton(content=ft.Text("문단적용")),
+            ft.ElevatedButton(content=ft.Text("삭제하기")),
+            ft.Text(f"{charshape.hangul_font} {charshape.fontsize}pt")
+        ]))
+    return rows
+
+
+def measure_memory(build) -> float:
+    """KiB still allocated by what ``build`` returns."""
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size / 1024
+
+
+def run(count: int, distinct: int, repeat: int) -> Tuple[float, float, float, float]:
+    """Return (legacy ms, registry ms, legacy KiB, registry KiB) for one size."""
+    styles = make_styles(count, distinct)
+    new_style = next(iter(make_styles(1, 1).values()))
+    manager = FontStyleManager({
+        "app_manager": SimpleNamespace(executor=None),
+        "config": BenchConfig(font_styles=styles),
+    })
+    manager._load_styles()
+
+    legacy_times, registry_times = [], []
+    for _ in range(repeat):
+        style_id = str(uuid.uuid1())
+        start = perf_counter()
+        legacy_refresh(manager, {**styles, style_id: new_style})
+        legacy_times.append(perf_counter() - start)
+
+        start = perf_counter()
+        style = manager.registry.add(style_id, *new_style)
+        manager._create_font_style_button(style)
+        registry_times.append(perf_counter() - start)
+        manager.registry.remove(style_id)
+
+    legacy_memory = measure_memory(lambda: [
+        (_parse_charshape(c), _parse_parashape(p), c, p)
+        for c, p in make_styles(count, distinct).values()
+    ])
+    registry_memory = measure_memory(lambda: StyleRegistry(make_styles(count, distinct)))
+    return (median(legacy_times) * 1000, median(registry_times) * 1000,
+            legacy_memory, registry_memory)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 200, 400, 800])
+    parser.add_argument("--distinct", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"adding one style, {args.distinct} distinct shapes")
+    print(f"{'styles':>7} {'legacy ms':>10} {'registry ms':>12} {'legacy KiB':>11} {'registry KiB':>13}")
+    for count in args.sizes:
+        legacy_ms, registry_ms, legacy_kib, registry_kib = run(count, args.distinct, args.repeat)
+        print(f"{count:>7} {legacy_ms:>10.2f} {registry_ms:>12.2f} {legacy_kib:>11.0f} {registry_kib:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
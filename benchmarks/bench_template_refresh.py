@@ -0,0 +1,120 @@
+"""Measure the templates page refresh after renaming a single template.
+
+Builds libraries of empty templates and previews, expands one category and
+renames one of its templates. Then compares a full rebuild with patching
+from the service's change set::
+
+    python -m benchmarks.bench_template_refresh --sizes 1000 5000 20000
+
+"controls sent" counts the controls in the subtrees passed to ``update()``,
+which is what the page ships to the client.
+"""
+
+import argparse
+import os
+import tempfile
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+from types import SimpleNamespace
+from typing import List, Tuple
+
+import flet as ft
+
+CATEGORIES = 20
+
+
+def count_controls(control: ft.Control) -> int:
+    """Number of controls in a subtree."""
+    return 1 + sum(count_controls(child) for child in control._get_children())
+
+
+class UpdateRecorder:
+    """Replaces ``Control.update`` to record what would be sent."""
+
+    def __init__(self):
+        self.sent = 0
+
+    def __enter__(self) -> "UpdateRecorder":
+        self._update, self._page = ft.Control.update, ft.Control.page
+        recorder = self
+
+        def update(control: ft.Control) -> None:
+            recorder.sent += count_controls(control)
+
+        ft.Control.update = update
+        # Every control counts as mounted
+        ft.Control.page = property(lambda control: True)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        ft.Control.update, ft.Control.page = self._update, self._page
+
+
+def make_library(templates: int) -> None:
+    """Write empty templates and previews."""
+    Path("templates").mkdir()
+    Path("images").mkdir()
+    for i in range(templates):
+        stem = f"분류{i % CATEGORIES}_서식{i}"
+        (Path("templates") / f"{stem}.hwp").touch()
+        (Path("images") / f"{stem}_1.png").touch()
+
+
+def run(templates: int, repeat: int) -> List[Tuple[str, float, int]]:
+    """Time full and diff refreshes for one library size."""
+    from hwp_helper.services.template_service import TemplateService
+    from hwp_helper.ui.pages.templates import TemplatesPage
+
+    make_library(templates)
+    service = TemplateService()
+    context = {
+        "page": None,
+        "template_service": service,
+        "app_manager": SimpleNamespace(executor=None),
+    }
+    page = TemplatesPage(context)
+    results = []
+    with UpdateRecorder() as recorder:
+        page._on_panel_change(SimpleNamespace(control=page._panel_list, data="0"))
+        category = page._panel_list.controls[0].data
+        first = min(t[2] for t in page._categories[category]).split("_", 1)[1]
+        for mode in ("full", "diff"):
+            times, sent = [], []
+            for i in range(repeat):
+                # Rename the first template of the expanded category back and forth
+                old, new = (first, f"r{i}") if i % 2 == 0 else (f"r{i - 1}", first)
+                service.rename_template(
+                    f"templates/{category}_{old}.hwp", f"images/{category}_{old}_1.png",
+                    category, new
+                )
+                recorder.sent = 0
+                start = perf_counter()
+                page.refresh(service.last_changes if mode == "diff" else None)
+                times.append(perf_counter() - start)
+                sent.append(recorder.sent)
+            results.append((mode, median(times), max(sent)))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'templates':>10} {'mode':>5} {'ms':>9} {'controls sent':>14}")
+    cwd = os.getcwd()
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as root:
+            os.chdir(root)
+            try:
+                results = run(size, args.repeat)
+            finally:
+                os.chdir(cwd)
+        for mode, elapsed, sent in results:
+            print(f"{size:>10} {mode:>5} {elapsed * 1000:>9.2f} {sent:>14}")
+
+
+if __name__ == "__main__":
+    main()
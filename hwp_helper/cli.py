@@ -0,0 +1,141 @@
+"""Command line entry point.
+
+``hwp-helper`` on its own starts the GUI. ``hwp-helper batch`` applies a
+pipeline of operations to every document in a folder using hidden HWP
+engines, resuming from the report of an interrupted run. ``hwp-helper
+replay`` runs a call log recorded from the diagnostics dialog again and
+reports the calls that behave differently::
+
+    hwp-helper batch reports/ --ops process_font setup_koica_page --workers 2
+    hwp-helper batch reports/ --ops color_double_space --simulate
+    hwp-helper replay calls.jsonl --document report.hwp
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from .core.recorder import CallReplayer, load_calls
+from .services.batch_service import OPERATIONS, BatchRunner
+
+
+def _hidden_app() -> Any:
+    """Create a hidden HWP instance for batch work."""
+    from hwpapi.core import App
+
+    return App(new_app=True, is_visible=False)
+
+
+def _simulated_app_factory(latency: float) -> Callable[[], Any]:
+    from .core.simulated import SimulatedApp
+
+    return lambda: SimulatedApp(latency=latency)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argument parser for ``hwp-helper``."""
+    parser = argparse.ArgumentParser(prog="hwp-helper", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="write a GUI startup profile to startup_profile.txt")
+    commands = parser.add_subparsers(dest="command")
+
+    batch = commands.add_parser("batch", help="apply operations to every document in a folder")
+    batch.add_argument("source", type=Path, help="folder of .hwp documents")
+    batch.add_argument("--ops", nargs="+", required=True, choices=list(OPERATIONS),
+                       help="operations to apply, in order")
+    batch.add_argument("--output", type=Path,
+                       help="folder for processed documents and the report (default: SOURCE/processed)")
+    batch.add_argument("--workers", type=int, default=1, help="number of hidden HWP engines")
+    batch.add_argument("--pattern", default="*.hwp", help="file name pattern (default: *.hwp)")
+    batch.add_argument("--restart", action="store_true",
+                       help="ignore the report of a previous run and process everything")
+    batch.add_argument("--simulate", action="store_true",
+                       help="use the simulated engine instead of HWP")
+    batch.add_argument("--latency", type=float, default=0.0,
+                       help="simulated seconds per COM call with --simulate")
+
+    replay = commands.add_parser("replay", help="replay a recorded call log")
+    replay.add_argument("log", type=Path, help="call log saved from the diagnostics dialog")
+    replay.add_argument("--document", type=Path, help="document to open before replaying")
+    replay.add_argument("--pace", action="store_true",
+                        help="keep the recorded gaps between calls")
+    replay.add_argument("--simulate", action="store_true",
+                        help="use the simulated engine instead of HWP")
+    replay.add_argument("--latency", type=float, default=0.0,
+                        help="simulated seconds per COM call with --simulate")
+    return parser
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """Run the ``batch`` command; returns the exit status."""
+    if not args.source.is_dir():
+        print(f"Error: {args.source} is not a folder")
+        return 2
+    output = args.output or args.source / "processed"
+    app_factory = _simulated_app_factory(args.latency) if args.simulate else _hidden_app
+    runner = BatchRunner(args.source, output, args.ops, app_factory,
+                         workers=args.workers, pattern=args.pattern)
+
+    pending, skipped = runner.pending(resume=not args.restart)
+    print(f"{len(pending)} documents to process, {skipped} already done")
+
+    ok = failed = 0
+    total_seconds = 0.0
+    try:
+        for i, result in enumerate(runner.run(resume=not args.restart), 1):
+            total_seconds += result.seconds
+            steps = ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in result.steps.items())
+            if result.ok:
+                ok += 1
+                print(f"[{i}/{len(pending)}] {result.name}: {result.seconds:.2f}s ({steps})")
+            else:
+                failed += 1
+                print(f"[{i}/{len(pending)}] {result.name}: failed: {result.error}")
+    except KeyboardInterrupt:
+        print("Interrupted; run the same command again to resume")
+        return 130
+
+    print(f"{ok} processed, {failed} failed, {skipped} skipped, "
+          f"{total_seconds:.1f}s of engine time; report: {runner.report_path}")
+    return 1 if failed else 0
+
+
+def run_replay(args: argparse.Namespace) -> int:
+    """Run the ``replay`` command; returns the exit status."""
+    records = load_calls(args.log)
+    app = _simulated_app_factory(args.latency)() if args.simulate else _hidden_app()
+    try:
+        if args.document is not None:
+            app.open(args.document.resolve())
+        report = CallReplayer(app, pace=args.pace).run(records)
+    finally:
+        app.quit()
+    print(report.format())
+    return 1 if report.mismatches else 0
+
+
+def run_gui() -> None:
+    """Start the GUI."""
+    import os
+
+    import flet as ft
+    import main as app
+
+    ft.run(main=app.main, assets_dir=os.path.dirname(os.path.abspath(app.__file__)))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the ``hwp-helper`` script."""
+    args = build_parser().parse_args(argv)
+    if args.command == "batch":
+        return run_batch(args)
+    if args.command == "replay":
+        return run_replay(args)
+    run_gui()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,84 +1,394 @@
 """HWP application management."""
 
+from concurrent.futures import Future
+from contextlib import contextmanager
 from pathlib import Path
 import subprocess
-import pywintypes
-from time import sleep
-from typing import Optional
+import threading
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Iterator, List, Optional, TypeVar
 
-from hwpapi.core import App, Engines
+from .com_executor import ComExecutor
+from .config import ConfigManager
+from .app_proxy import AppCall, AppProxy, Listener
+from .metrics import PHASE_ACQUIRE, PHASE_ACTION, PHASE_FOCUS, LatencyMetrics
+from .recorder import CallRecorder
+from .tracing import CAT_OPERATION, CAT_PHASE, Tracer
+from ..utils.com_utils import com_error
 
-from ..utils.window_utils import set_forewindow, show_window
+if TYPE_CHECKING:
+    from hwpapi.core import App
+
+T = TypeVar("T")
+
+HWP_INSTALL_DIRS = (r"C:\Program Files (x86)\HNC", r"C:\Program Files\HNC")
+
+# Connection progress stages reported to ``progress`` callbacks
+STAGE_DISCONNECTED = "disconnected"
+STAGE_CONNECTING = "connecting"
+STAGE_LAUNCHING = "launching"
+STAGE_WAITING = "waiting"
+STAGE_CONNECTED = "connected"
+STAGE_FAILED = "failed"
+
+ProgressCallback = Callable[[str, str], None]
+
+# Operation name the liveness probes are traced and recorded under
+PROBE_OPERATION = "liveness_probe"
+
+
+class ConnectionCancelled(Exception):
+    """Raised when a pending HWP connection is cancelled."""
+
+
+def find_hwp_executable() -> Optional[Path]:
+    """Search the HNC install folders for ``hwp.exe``."""
+    for install_dir in HWP_INSTALL_DIRS:
+        for path in Path(install_dir).rglob("hwp.exe"):
+            return path
+    return None
 
 
 class HwpAppManager:
-    """Manages HWP application instances and connections."""
+    """Manages HWP application instances and connections.
+    
+    The app is a COM object, so it must only be used on the thread of
+    ``executor``; submit work there instead of calling it from the UI thread.
+    
+    A connection that was checked or used successfully within the last
+    ``liveness_ttl`` seconds is trusted without probing HWP again. A
+    ``com_error`` from an operation invalidates it immediately.
+    
+    When HWP is not running it is launched and polled with exponential
+    backoff until ``connect_timeout``. Executable discovery, launching,
+    connecting and sleeping can be injected to simulate a slow engine.
     
-    def __init__(self, dll_path: str = "bin/FilePathCheckerModuleExample.dll"):
+    Connection attempts are single-flight: ``connect_async`` returns the
+    pending attempt if there is one, and operations queued on the executor
+    behind it reuse the connection it made.
+    """
+    
+    def __init__(self, dll_path: str = "bin/FilePathCheckerModuleExample.dll",
+                 liveness_ttl: float = 5.0,
+                 clock: Callable[[], float] = monotonic,
+                 config: Optional[ConfigManager] = None,
+                 connect_timeout: float = 60.0,
+                 discover: Callable[[], Optional[Path]] = find_hwp_executable,
+                 launcher: Callable[[Path], Any] = subprocess.Popen,
+                 connector: Optional[Callable[[], Optional["App"]]] = None,
+                 sleep: Optional[Callable[[float], Any]] = None):
         self.dll_path = dll_path
-        self._app: Optional[App] = None
+        self.liveness_ttl = liveness_ttl
+        self.config = config
+        self.connect_timeout = connect_timeout
+        self._clock = clock
+        self._discover = discover
+        self._launcher = launcher
+        self._connector = connector or self._connect_to_running_hwp
+        self._cancel = threading.Event()
+        self._sleep = sleep or self._cancel.wait
+        self._app: Optional["App"] = None
+        self._hwnd: Optional[int] = None
+        self._hwnd_at = float("-inf")
+        self._verified_at = float("-inf")
+        self.probe_count = 0
+        self.metrics = LatencyMetrics()
+        self.tracer = Tracer()
+        self.recorder = CallRecorder()
+        self.executor = ComExecutor(tracer=self.tracer)
+        self.status = STAGE_DISCONNECTED
+        self.status_message = ""
+        self._status_listeners: List[ProgressCallback] = []
+        self._connecting: Optional[Future] = None
+        self._connect_lock = threading.Lock()
     
     @property
-    def app(self) -> Optional[App]:
+    def app(self) -> Optional["App"]:
         """Get the current HWP application instance."""
         return self._app
     
-    def get_or_create_app(self) -> App:
+    def get_or_create_app(self, progress: Optional[ProgressCallback] = None) -> "App":
         """Get existing app or create a new one if needed."""
+        if self._app is not None and self._is_fresh():
+            return self._app
         if self._app is None or not self._is_app_valid(self._app):
-            self._app = self._create_or_connect_app()
+            self._app = self._create_or_connect_app(progress)
+            self._hwnd = None
+        self._mark_alive()
         return self._app
     
-    def _is_app_valid(self, app: App) -> bool:
-        """Check if the HWP app instance is still valid."""
+    def connect_async(self, progress: Optional[ProgressCallback] = None) -> Future:
+        """Connect to (or launch) HWP on the executor thread.
+        
+        ``progress(stage, message)`` is called from the executor thread as
+        the connection proceeds. If an attempt is already in flight its
+        future is returned instead of starting another one.
+        """
+        with self._connect_lock:
+            if self._connecting is not None and not self._connecting.done():
+                return self._connecting
+            self._connecting = self.executor.submit(self.get_or_create_app, progress)
+            return self._connecting
+    
+    def cancel_connect(self) -> None:
+        """Cancel a connection that is waiting for HWP to start."""
+        self._cancel.set()
+    
+    def add_status_listener(self, listener: ProgressCallback) -> None:
+        """Call ``listener(stage, message)`` now and on every status change."""
+        self._status_listeners.append(listener)
+        listener(self.status, self.status_message)
+    
+    def remove_status_listener(self, listener: ProgressCallback) -> None:
+        """Stop notifying ``listener`` of status changes."""
+        if listener in self._status_listeners:
+            self._status_listeners.remove(listener)
+    
+    def _set_status(self, stage: str, message: str = "") -> None:
+        """Record the connection status and notify the listeners."""
+        if (stage, message) == (self.status, self.status_message):
+            return
+        self.status = stage
+        self.status_message = message
+        for listener in list(self._status_listeners):
+            try:
+                listener(stage, message)
+            except Exception as e:
+                print(f"Error in status listener: {e}")
+    
+    def run(self, operation: Callable[["App"], T], foreground: bool = True,
+            name: Optional[str] = None) -> T:
+        """Run ``operation(app)``, retrying once on a fresh connection.
+        
+        If the call raises ``com_error`` the cached connection is dropped,
+        a new one is made and the operation is run one more time. When
+        ``metrics`` is enabled runs of named operations are timed, while
+        ``tracer`` is enabled every run is traced and while ``recorder`` is
+        enabled every call made against the app is recorded, including the
+        window lookups made to bring HWP to the foreground.
+        """
+        if (self.tracer.enabled or self.recorder.enabled
+                or (name is not None and self.metrics.enabled)):
+            return self._run_instrumented(operation, foreground, name)
+        acquire = self.ensure_app_ready if foreground else self.get_or_create_app
+        try:
+            result = operation(acquire())
+        except com_error:
+            self.invalidate(drop=True)
+            result = operation(acquire())
+        self._mark_alive()
+        return result
+    
+    def _run_instrumented(self, operation: Callable[["App"], T], foreground: bool,
+                          name: Optional[str]) -> T:
+        """``run`` timing acquire, focus and action into ``metrics`` and ``tracer``.
+        
+        While tracing or recording, the operation gets the app through a
+        proxy that traces and records every call made against it.
+        """
+        sample = self.metrics.sample(name) if name is not None and self.metrics.enabled else None
+        tracer = self.tracer
+        listener = self._app_listener(name or "run")
+        
+        @contextmanager
+        def traced_phase(phase_name: str) -> Iterator[None]:
+            with tracer.span(phase_name, CAT_PHASE), sample.phase(phase_name):
+                yield
+        
+        def phase(phase_name: str) -> ContextManager[None]:
+            if sample is None:
+                return tracer.span(phase_name, CAT_PHASE)
+            if not tracer.enabled:
+                return sample.phase(phase_name)
+            return traced_phase(phase_name)
+        
+        def attempt() -> T:
+            with phase(PHASE_ACQUIRE):
+                app = self.get_or_create_app()
+            if listener is not None:
+                app = AppProxy(app, listener)
+            if foreground:
+                with phase(PHASE_FOCUS):
+                    self.bring_to_foreground(app)
+            with phase(PHASE_ACTION):
+                return operation(app)
+        
+        try:
+            with tracer.span(name or "run", CAT_OPERATION):
+                try:
+                    result = attempt()
+                except com_error:
+                    self.invalidate(drop=True)
+                    result = attempt()
+            self._mark_alive()
+            return result
+        finally:
+            if sample is not None:
+                self.metrics.record(sample)
+    
+    def _app_listener(self, name: str) -> Optional[Listener]:
+        """Listener for the calls of operation ``name``, if any are watched."""
+        if not self.recorder.enabled:
+            return self.tracer.on_app_call if self.tracer.enabled else None
+        record = self.recorder.listener(name)
+        if not self.tracer.enabled:
+            return record
+        
+        def trace_and_record(call: AppCall) -> None:
+            self.tracer.on_app_call(call)
+            record(call)
+        return trace_and_record
+    
+    def invalidate(self, drop: bool = False) -> None:
+        """Forget that the connection is alive, optionally dropping it."""
+        self._verified_at = float("-inf")
+        self._hwnd = None
+        if drop:
+            self._app = None
+            self._set_status(STAGE_DISCONNECTED)
+    
+    def _is_fresh(self) -> bool:
+        """Check whether the connection was verified within the TTL."""
+        return self._clock() - self._verified_at < self.liveness_ttl
+    
+    def _mark_alive(self) -> None:
+        """Record that the connection just worked."""
+        self._verified_at = self._clock()
+    
+    def _is_app_valid(self, app: "App") -> bool:
+        """Check if the HWP app instance is still valid.
+        
+        The probe is a call like any other, so it is traced and recorded
+        under ``PROBE_OPERATION``.
+        """
+        self.probe_count += 1
+        listener = self._app_listener(PROBE_OPERATION)
+        if listener is not None:
+            app = AppProxy(app, listener)
         try:
             _ = app.api.PageCount
             return True
-        except (pywintypes.com_error, AttributeError):
+        except (com_error, AttributeError):
             return False
     
-    def _create_or_connect_app(self) -> App:
+    def _create_or_connect_app(self, progress: Optional[ProgressCallback] = None) -> "App":
         """Create new HWP app or connect to existing one."""
+        def report(stage: str, message: str) -> None:
+            self._set_status(stage, message)
+            if progress:
+                progress(stage, message)
+        
+        self._cancel.clear()
         
         try:
             # Try to connect to existing app first
-            engines = Engines()
-            if engines:
-                app = App(dll_path=self.dll_path)
-                app.engine = engines[0]
+            report(STAGE_CONNECTING, "한글에 연결하는 중")
+            app = self._connector()
+            if app is not None:
+                report(STAGE_CONNECTED, "한글에 연결됨")
                 return app
-        except Exception:
-            pass
-        
-        # Start new HWP instance
-        self._start_hwp()
-        
-        # Wait for HWP to start and create app
+            
+            # Start new HWP instance
+            report(STAGE_LAUNCHING, "한글을 실행하는 중")
+            self._start_hwp()
+            app = self._wait_for_app(report)
+            report(STAGE_CONNECTED, "한글에 연결됨")
+            return app
+        except Exception as e:
+            report(STAGE_FAILED, str(e))
+            raise
+    
+    def _wait_for_app(self, report: ProgressCallback,
+                      initial_delay: float = 0.1, max_delay: float = 2.0) -> "App":
+        """Poll for a started HWP with exponential backoff until the deadline."""
+        deadline = self._clock() + self.connect_timeout
+        delay = initial_delay
+        attempt = 0
         while True:
+            if self._cancel.is_set():
+                raise ConnectionCancelled("HWP connection cancelled")
+            
+            app = self._connector()
+            if app is not None:
+                return app
+            
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"HWP did not start within {self.connect_timeout:.0f} seconds"
+                )
+            
+            attempt += 1
+            report(STAGE_WAITING, f"한글이 시작되기를 기다리는 중 ({attempt})")
+            self._sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+    
+    def _connect_to_running_hwp(self) -> Optional["App"]:
+        """Connect to the first running HWP engine, if any."""
+        try:
+            from hwpapi.core import App, Engines
+            
             engines = Engines()
             if engines:
                 app = App(dll_path=self.dll_path)
                 app.engine = engines[0]
                 return app
-            sleep(1)
+        except Exception:
+            pass
+        return None
     
     def _start_hwp(self) -> None:
         """Start HWP application."""
-        hwp_paths = list(Path(r"C:\Program Files (x86)\HNC").rglob("hwp.exe"))
-        if hwp_paths:
-            subprocess.Popen(hwp_paths[0])
-        else:
+        hwp_path = self._find_hwp_executable()
+        if hwp_path is None:
             raise FileNotFoundError("HWP executable not found")
+        self._launcher(hwp_path)
+    
+    def _find_hwp_executable(self) -> Optional[Path]:
+        """Get the HWP executable, using the path cached in the config."""
+        cached = self.config.get("hwp_executable") if self.config else None
+        if cached and Path(cached).is_file():
+            return Path(cached)
+        
+        hwp_path = self._discover()
+        if hwp_path is not None and self.config is not None:
+            self.config.set("hwp_executable", str(hwp_path))
+        return hwp_path
     
-    def bring_to_foreground(self) -> bool:
-        """Bring HWP window to foreground."""
-        if self._app:
-            set_forewindow(self._app)
-            show_window(self._app)
+    def bring_to_foreground(self, app: Optional["App"] = None) -> bool:
+        """Bring HWP window to foreground.
+        
+        The window handle is cached with the connection, and nothing is done
+        when the window is already in front. Without pywin32 there is no
+        window to manage and ``False`` is returned. ``app`` is the connected
+        app to look the window up through, such as a recording proxy.
+        """
+        if not self._app:
+            return False
+        if app is None:
+            app = self._app
+        
+        try:
+            from ..utils.window_utils import (
+                get_hwnd, is_foreground_window, set_forewindow, show_window
+            )
+        except ImportError:  # pywin32 is only installed on Windows
+            return False
+        
+        if self._hwnd is None or self._clock() - self._hwnd_at >= self.liveness_ttl:
+            try:
+                self._hwnd = get_hwnd(app)
+                self._hwnd_at = self._clock()
+            except AttributeError:
+                self._hwnd = None
+        if self._hwnd is not None and is_foreground_window(self._hwnd):
             return True
-        return False
+        
+        set_forewindow(app, self._hwnd)
+        show_window(app, self._hwnd)
+        return True
     
-    def ensure_app_ready(self) -> App:
+    def ensure_app_ready(self) -> "App":
         """Ensure HWP app is ready and bring to foreground."""
         app = self.get_or_create_app()
         self.bring_to_foreground()
@@ -86,8 +396,12 @@ class HwpAppManager:
     
     def cleanup(self) -> None:
         """Clean up COM resources."""
+        def release():
+            self._app = None
+        
         try:
-            if self._app:
-                self._app = None
+            self.cancel_connect()
+            self.executor.submit(release)
+            self.executor.shutdown()
         except Exception:
             pass  # Ignore cleanup errors
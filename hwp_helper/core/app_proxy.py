@@ -0,0 +1,136 @@
+"""Proxy reporting the calls made against an HWP ``App``.
+
+``AppProxy`` wraps the app and every object reached from it, such as
+``app.actions.CharShape()`` or ``app.api.HAction``. Each call, property
+read and property write then reaches a listener as an ``AppCall``, named
+by its attribute path from the app (``actions.CharShape.run``,
+``api.GetPos``). The tracer and the call recorder are built on it.
+"""
+
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional, Tuple
+
+KIND_CALL = "call"
+KIND_GET = "get"
+KIND_SET = "set"
+
+_PLAIN = (str, int, float, bool, bytes, type(None))
+
+
+@dataclass
+class AppCall:
+    """One call, property read or property write against the app.
+
+    ``args`` and ``kwargs`` are as passed, so arguments that came from the
+    app are still proxies naming where they came from.
+    """
+
+    kind: str
+    path: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    result: Any = None
+    error: Optional[BaseException] = None
+    start: float = 0.0
+    duration: float = 0.0
+
+
+Listener = Callable[[AppCall], None]
+
+
+def is_plain(value: Any) -> bool:
+    """Whether ``value`` is data rather than an object to keep proxying."""
+    if isinstance(value, _PLAIN):
+        return True
+    if isinstance(value, (tuple, list)):
+        return all(is_plain(item) for item in value)
+    if isinstance(value, dict):
+        return all(is_plain(key) and is_plain(item) for key, item in value.items())
+    return False
+
+
+def unwrap(value: Any) -> Any:
+    """The object behind a proxy, or ``value`` itself."""
+    if isinstance(value, AppProxy):
+        return value._target
+    return value
+
+
+class AppProxy:
+    """Forwards attribute access and calls to ``target``, reporting them to ``listener``.
+
+    Plain values (numbers, strings, and tuples, lists or dicts of them) are
+    returned as they are; any other result is wrapped again so calls on it
+    are reported too. Proxies passed as arguments are unwrapped first.
+    """
+
+    __slots__ = ("_target", "_listener", "_path")
+
+    def __init__(self, target: Any, listener: Listener, path: str = ""):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_listener", listener)
+        object.__setattr__(self, "_path", path)
+
+    def _child(self, name: str) -> str:
+        path = self._path
+        return f"{path}.{name}" if path else name
+
+    def _wrap(self, value: Any, path: str) -> Any:
+        if is_plain(value):
+            return value
+        return AppProxy(value, self._listener, path)
+
+    def _report(self, kind: str, path: str, invoke: Callable[[], Any],
+                args: Tuple[Any, ...] = (), kwargs: Optional[Dict[str, Any]] = None) -> Any:
+        call = AppCall(kind, path, args, kwargs or {}, start=perf_counter())
+        try:
+            call.result = invoke()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            call.duration = perf_counter() - call.start
+            self._listener(call)
+
+    def __getattr__(self, name: str) -> Any:
+        target = self._target
+        path = self._child(name)
+        start = perf_counter()
+        try:
+            value = getattr(target, name)
+        except AttributeError:
+            raise
+        except Exception as e:
+            # A failed property read, such as a probe of a closed HWP
+            self._listener(AppCall(
+                KIND_GET, path, error=e, start=start, duration=perf_counter() - start
+            ))
+            raise
+        if is_plain(value):
+            # A property read, which is a round trip on a COM object
+            self._listener(AppCall(
+                KIND_GET, path, result=value, start=start, duration=perf_counter() - start
+            ))
+            return value
+        return self._wrap(value, path)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        target = self._target
+        self._report(KIND_SET, self._child(name),
+                     lambda: setattr(target, name, unwrap(value)), (value,))
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        target = self._target
+        path = self._path
+        result = self._report(
+            KIND_CALL, path,
+            lambda: target(*[unwrap(arg) for arg in args],
+                           **{key: unwrap(value) for key, value in kwargs.items()}),
+            args, kwargs
+        )
+        return self._wrap(result, path)
+
+    def __repr__(self) -> str:
+        return f"AppProxy({self._path or 'app'})"
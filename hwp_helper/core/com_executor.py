@@ -0,0 +1,162 @@
+"""Dedicated thread for COM calls."""
+
+import queue
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional
+
+from ..utils.com_utils import com_apartment
+
+if TYPE_CHECKING:
+    from .tracing import Tracer
+
+
+_STOP = object()
+
+
+@dataclass
+class OperationStats:
+    """Latency totals for one kind of operation, in seconds."""
+
+    count: int = 0
+    total_wait: float = 0.0
+    total_run: float = 0.0
+    max_run: float = 0.0
+    last_run: float = 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        """Summarise the totals in milliseconds."""
+        count = max(self.count, 1)
+        return {
+            "count": self.count,
+            "mean_wait_ms": self.total_wait / count * 1000,
+            "mean_run_ms": self.total_run / count * 1000,
+            "max_run_ms": self.max_run * 1000,
+            "last_run_ms": self.last_run * 1000,
+        }
+
+
+class ComExecutor:
+    """Runs submitted work on a single thread that owns the COM apartment.
+
+    COM objects may only be used from the thread that created them, so every
+    call against the HWP application goes through this executor. The UI
+    thread only submits work and gets a future back.
+
+    While ``tracer`` is enabled each operation is recorded as a span,
+    linked by a flow arrow to the span that submitted it.
+    """
+
+    def __init__(self, name: str = "hwp-com", tracer: Optional["Tracer"] = None):
+        self.name = name
+        self.tracer = tracer
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats: Dict[str, OperationStats] = {}
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Queue ``func(*args, **kwargs)`` and return a future for its result."""
+        future: Future = Future()
+        flow = None
+        if self.tracer is not None and self.tracer.enabled:
+            flow = self.tracer.flow_start()
+        self._ensure_started()
+        self._queue.put((future, func, args, kwargs, perf_counter(), flow))
+        return future
+
+    def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``func`` on the executor thread and wait for its result."""
+        if self.in_executor_thread():
+            return func(*args, **kwargs)
+        return self.submit(func, *args, **kwargs).result()
+
+    def in_executor_thread(self) -> bool:
+        """Check whether the caller is the executor thread."""
+        return threading.current_thread() is self._thread
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of operations waiting to run."""
+        return self._queue.qsize()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Latency summary per operation name."""
+        with self._lock:
+            return {name: stats.as_dict() for name, stats in self._stats.items()}
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = 5.0) -> None:
+        """Stop the executor thread after the queued work is done."""
+        with self._lock:
+            thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        if wait and not self.in_executor_thread():
+            thread.join(timeout)
+
+    def _ensure_started(self) -> None:
+        """Start the executor thread on first use."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._worker, name=self.name, daemon=True
+                )
+                self._thread.start()
+
+    def _worker(self) -> None:
+        """Executor loop."""
+        with com_apartment():
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    with self._lock:
+                        self._thread = None
+                    break
+
+                future, func, args, kwargs, queued_at, flow = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                name = _operation_name(func)
+                started = perf_counter()
+                try:
+                    with self._span(name, started - queued_at, flow):
+                        result = func(*args, **kwargs)
+                except BaseException as e:
+                    print(f"Error in HWP operation {name}: {e}")
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+                finally:
+                    self._record(name, started - queued_at, perf_counter() - started)
+
+    @contextmanager
+    def _span(self, name: str, wait: float, flow: Optional[int]) -> Iterator[None]:
+        """Trace one operation, ending the flow from where it was submitted."""
+        tracer = self.tracer
+        if tracer is None or not tracer.enabled:
+            yield
+            return
+        with tracer.span(name, "executor", wait_ms=round(wait * 1000, 3)):
+            if flow is not None:
+                tracer.flow_end(flow)
+            yield
+
+    def _record(self, name: str, wait: float, run: float) -> None:
+        """Add one operation's latency to the totals."""
+        with self._lock:
+            stats = self._stats.setdefault(name, OperationStats())
+            stats.count += 1
+            stats.total_wait += wait
+            stats.total_run += run
+            stats.max_run = max(stats.max_run, run)
+            stats.last_run = run
+
+
+def _operation_name(func: Callable[..., Any]) -> str:
+    """Name used to group an operation's statistics."""
+    return getattr(func, "__name__", None) or type(func).__name__
@@ -1,31 +1,109 @@
 """Configuration management for HWP Helper."""
 
+import atexit
+import copy
+import marshal
+import os
+import threading
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from time import monotonic
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
+
+
+class _Dumper(SafeDumper):
+    """Dumper writing shared values in full instead of as YAML aliases."""
+
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
 
 
 class ConfigManager:
-    """Manages application configuration and settings."""
+    """Manages application configuration and settings.
+    
+    Changes are written behind: ``set`` and ``update`` only mark the
+    settings dirty and a background thread writes them once no change has
+    been made for ``save_delay`` seconds, so bursts of changes cost a single
+    write. The file is replaced atomically. ``flush`` waits for pending
+    changes to be written and runs at interpreter exit. A failed write
+    leaves the changes pending: ``flush`` reports it and the writer tries
+    again ``save_delay`` seconds later.
     
-    def __init__(self, config_file: str = "setting.yaml"):
-        self.config_file = Path(config_file)
+    The YAML file is the source of truth, but its parsed contents are also
+    kept in a marshal cache beside it. The cache is keyed on the YAML
+    file's mtime and size, and it lets an unchanged configuration load
+    without parsing YAML.
+    """
+    
+    CACHE_VERSION = 1
+    
+    def __init__(self, config_file: str = "setting.yaml", save_delay: float = 0.5):
+        # Resolved now: the writer may run after the working directory changed
+        self.config_file = Path(config_file).resolve()
+        self.cache_file = self.config_file.with_name(self.config_file.name + ".cache")
+        self.save_delay = save_delay
         self._settings: Dict[str, Any] = {}
+        self._cond = threading.Condition()
+        self._version = 0
+        self._saved_version = 0
+        self._failed_version = 0
+        self._changed_at = 0.0
+        self._flush_requested = False
+        self._closed = False
+        self._writer: Optional[threading.Thread] = None
+        self._io_lock = threading.Lock()
         self.load_config()
+        atexit.register(self.flush)
     
     def load_config(self) -> None:
         """Load configuration from file."""
         if self.config_file.exists():
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self._settings = yaml.safe_load(f) or {}
+            key = self._file_key()
+            settings = self._read_cache(key)
+            if settings is None:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    settings = yaml.load(f, Loader=SafeLoader) or {}
+                self._write_cache(key, settings)
+            self._settings = settings
         else:
             self._settings = self._get_default_settings()
             self.save_config()
     
     def save_config(self) -> None:
-        """Save current configuration to file."""
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            yaml.safe_dump(self._settings, f, allow_unicode=True)
+        """Schedule the current configuration to be written to file."""
+        self._mark_dirty()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write pending changes now and wait until they are on disk.
+        
+        Returns ``False`` if they could not be written or the timeout passed.
+        """
+        with self._cond:
+            version = self._version
+            if self._saved_version >= version:
+                return True
+            if self._closed:
+                # No writer after close, write on the caller's thread
+                return self._write_pending()
+            self._flush_requested = True
+            self._failed_version = 0
+            self._cond.notify_all()
+            self._cond.wait_for(
+                lambda: max(self._saved_version, self._failed_version) >= version, timeout
+            )
+            return self._saved_version >= version
+    
+    def close(self) -> None:
+        """Write pending changes and stop the writer thread."""
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
@@ -33,23 +111,139 @@ class ConfigManager:
     
     def set(self, key: str, value: Any) -> None:
         """Set a configuration value."""
-        self._settings[key] = value
+        with self._cond:
+            self._settings[key] = value
+        self._mark_dirty()
     
     def update(self, settings: Dict[str, Any]) -> None:
         """Update multiple configuration values."""
-        self._settings.update(settings)
+        with self._cond:
+            self._settings.update(settings)
+        self._mark_dirty()
     
     @property
     def settings(self) -> Dict[str, Any]:
         """Get all settings."""
         return self._settings.copy()
     
+    def _mark_dirty(self) -> None:
+        """Record a change and wake the writer."""
+        with self._cond:
+            self._version += 1
+            self._changed_at = monotonic()
+            if self._closed:
+                self._write_pending()
+                return
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_behind, name="config-writer", daemon=True
+                )
+                self._writer.start()
+            self._cond.notify_all()
+    
+    def _write_behind(self) -> None:
+        """Writer loop: wait for changes to settle, then write them."""
+        with self._cond:
+            while True:
+                self._cond.wait_for(
+                    lambda: self._version > self._saved_version or self._closed
+                )
+                if self._version == self._saved_version:
+                    self._writer = None
+                    return
+                
+                # Debounce until changes stop or a flush is requested
+                while not (self._flush_requested or self._closed):
+                    remaining = self._changed_at + self.save_delay - monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                
+                if not self._write_pending():
+                    if self._closed:
+                        self._writer = None
+                        return
+                    # Try again once another save delay has passed
+                    self._changed_at = monotonic()
+    
+    def _write_pending(self) -> bool:
+        """Write the settings atomically; called with the lock held.
+        
+        Returns whether the write succeeded; on failure the changes stay
+        pending.
+        """
+        version = self._version
+        settings = copy.deepcopy(self._settings)
+        self._flush_requested = False
+        
+        # The file is written without the lock so set() never waits on I/O
+        self._cond.release()
+        try:
+            with self._io_lock:
+                written = self._write(settings)
+        finally:
+            self._cond.acquire()
+        if written:
+            self._saved_version = max(self._saved_version, version)
+        else:
+            self._failed_version = max(self._failed_version, version)
+        self._cond.notify_all()
+        return written
+    
+    def _write(self, settings: Dict[str, Any]) -> bool:
+        """Replace the configuration file with ``settings``; returns whether it worked."""
+        temp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                yaml.dump(settings, f, Dumper=_Dumper, allow_unicode=True)
+            os.replace(temp_file, self.config_file)
+        except OSError as e:
+            print(f"Error saving configuration: {e}")
+            return False
+        self._write_cache(self._file_key(), settings)
+        return True
+    
+    def _file_key(self) -> Tuple[int, int]:
+        """Modification time and size of the configuration file."""
+        stat = self.config_file.stat()
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _read_cache(self, key: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """Get the cached settings if they belong to the current file."""
+        try:
+            # marshal.load reads a file in small pieces, loads on bytes is faster
+            version, cached_key, settings = marshal.loads(self.cache_file.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if version != self.CACHE_VERSION or tuple(cached_key) != key:
+            return None
+        return settings
+    
+    def _write_cache(self, key: Tuple[int, int], settings: Dict[str, Any]) -> None:
+        """Store parsed settings for the file with ``key``."""
+        temp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        try:
+            temp_file.write_bytes(marshal.dumps((self.CACHE_VERSION, key, settings)))
+            os.replace(temp_file, self.cache_file)
+        except (OSError, ValueError) as e:
+            # Values marshal cannot store, such as dates, are only kept in YAML
+            print(f"Error saving configuration cache: {e}")
+            temp_file.unlink(missing_ok=True)
+    
     def _get_default_settings(self) -> Dict[str, Any]:
         """Get default configuration settings."""
         return {
             "app_width": 674,
+            "app_liveness_ttl": 5.0,
             "tab": 0,
+            "connect_timeout": 60.0,
+            "embedded_previews": False,
             "font_styles": {},
             "last_category": None,
+            "latency_metrics": False,
+            "prewarm_hwp": False,
+            "record_calls": False,
+            "render_workers": 1,
+            "tracing": False,
             "window_always_on_top": False,
         }
@@ -6,7 +6,7 @@ from typing import Dict, Any
 
 from .config import ConfigManager
 from .app_manager import HwpAppManager
-from ..utils.window_utils import get_screen_size, set_window_position
+from ..services.template_service import TemplateService
 
 
 class HwpHelper:
@@ -15,10 +15,21 @@ class HwpHelper:
     def __init__(self, page: ft.Page):
         self.page = page
         self.config = ConfigManager()
-        self.app_manager = HwpAppManager()
+        self.app_manager = HwpAppManager(
+            liveness_ttl=self.config.get("app_liveness_ttl", 5.0),
+            config=self.config,
+            connect_timeout=self.config.get("connect_timeout", 60.0),
+        )
+        self.app_manager.metrics.enabled = self.config.get("latency_metrics", False)
+        self.app_manager.tracer.enabled = self.config.get("tracing", False)
+        self.app_manager.recorder.enabled = self.config.get("record_calls", False)
         
         self._setup_page()
         self._create_essential_folders()
+        self.template_service = TemplateService(
+            workers=self.config.get("render_workers", 1),
+            embedded_previews=self.config.get("embedded_previews", False),
+        )
     
     def _setup_page(self) -> None:
         """Setup the main page properties."""
@@ -38,8 +49,14 @@ class HwpHelper:
             "app": self.app_manager.app,
             "config": self.config,
             "app_manager": self.app_manager,
+            "template_service": self.template_service,
         }
     
+    def prewarm(self) -> None:
+        """Start connecting to HWP in the background if enabled in settings."""
+        if self.config.get("prewarm_hwp", False):
+            self.app_manager.connect_async()
+    
     def on_closing(self) -> None:
         """Handle application closing."""
         # Save current tab state
@@ -49,14 +66,16 @@ class HwpHelper:
         # Save window always on top state
         self.config.set("window_always_on_top", self.page.window_always_on_top)
         
-        # Save configuration
-        self.config.save_config()
+        # Write pending configuration changes
+        self.config.close()
         
         # Clean up COM resources
         self.app_manager.cleanup()
     
     def set_fullscreen(self) -> None:
         """Set application to fullscreen mode."""
+        from ..utils.window_utils import get_screen_size, set_window_position
+        
         self._ensure_hwp_ready()
         
         app_width = self.config.get("app_width", 674)
@@ -67,10 +86,7 @@ class HwpHelper:
         
         # Position HWP window
         if self.app_manager.app:
-            set_window_position(
-                self.app_manager.app.get_hwnd(),
-                x, y, hwp_width, height
-            )
+            set_window_position(self._hwp_hwnd(), x, y, hwp_width, height)
         
         # Position helper window
         self.page.window_left = x + hwp_width
@@ -81,6 +97,8 @@ class HwpHelper:
     
     def set_halfscreen(self) -> None:
         """Set application to half-screen mode."""
+        from ..utils.window_utils import get_screen_size, set_window_position
+        
         self._ensure_hwp_ready()
         
         app_width = self.config.get("app_width", 800)
@@ -92,10 +110,7 @@ class HwpHelper:
         
         # Position HWP window
         if self.app_manager.app:
-            set_window_position(
-                self.app_manager.app.get_hwnd(),
-                x, y, hwp_width, height
-            )
+            set_window_position(self._hwp_hwnd(), x, y, hwp_width, height)
         
         # Position helper window
         self.page.window_left = x + hwp_width
@@ -104,6 +119,11 @@ class HwpHelper:
         self.page.window_height = height
         self.page.update()
     
+    def _hwp_hwnd(self) -> int:
+        """Get the HWP window handle, reconnecting if HWP was restarted."""
+        return self.app_manager.run(lambda app: app.get_hwnd(), foreground=False,
+                                    name="get_hwnd")
+    
     def _ensure_hwp_ready(self) -> None:
         """Ensure HWP is ready and visible."""
         self.app_manager.ensure_app_ready()
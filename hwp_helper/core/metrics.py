@@ -0,0 +1,133 @@
+"""Latency metrics for HWP operations."""
+
+import csv
+import json
+import math
+import threading
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter
+from typing import Deque, Dict, Iterator, List, Tuple, Union
+
+# Phases of an operation run through ``HwpAppManager.run``
+PHASE_ACQUIRE = "acquire"
+PHASE_FOCUS = "focus"
+PHASE_ACTION = "action"
+PHASE_TOTAL = "total"
+PHASES = (PHASE_ACQUIRE, PHASE_FOCUS, PHASE_ACTION, PHASE_TOTAL)
+
+PERCENTILES = (50, 95, 99)
+
+CSV_FIELDS = ["operation", "phase", "count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(p / 100 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(rank, len(sorted_values) - 1))]
+
+
+def _row_order(key: Tuple[str, str]) -> Tuple[str, int]:
+    """Sort by operation, then phases in pipeline order."""
+    name, phase = key
+    return name, PHASES.index(phase) if phase in PHASES else len(PHASES)
+
+
+class OperationSample:
+    """Phase timings of one operation run, recorded when it finishes."""
+
+    __slots__ = ("name", "phases", "_start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.phases: Dict[str, float] = {}
+        self._start = perf_counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase; repeated phases, as on a retry, add up."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + perf_counter() - start
+
+    def total(self) -> float:
+        """Seconds since the sample started."""
+        return perf_counter() - self._start
+
+
+class LatencyMetrics:
+    """Rolling per-operation, per-phase latency windows.
+
+    The last ``window`` samples of every (operation, phase) pair are kept
+    and summarised into percentiles on demand. When ``enabled`` is false
+    ``HwpAppManager.run`` skips sampling entirely, so the only cost left is
+    checking the flag.
+    """
+
+    def __init__(self, enabled: bool = False, window: int = 1000):
+        self.enabled = enabled
+        self.window = window
+        self._samples: Dict[Tuple[str, str], Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def sample(self, name: str) -> OperationSample:
+        """Start timing one run of operation ``name``."""
+        return OperationSample(name)
+
+    def record(self, sample: OperationSample) -> None:
+        """Add a finished sample, with its total time, to the windows."""
+        phases = dict(sample.phases)
+        phases[PHASE_TOTAL] = sample.total()
+        with self._lock:
+            for phase, seconds in phases.items():
+                key = (sample.name, phase)
+                window = self._samples.get(key)
+                if window is None:
+                    window = self._samples[key] = deque(maxlen=self.window)
+                window.append(seconds)
+
+    def clear(self) -> None:
+        """Forget every sample."""
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self) -> List[Dict[str, Union[str, int, float]]]:
+        """One row per (operation, phase) with count, mean and percentiles in ms."""
+        with self._lock:
+            windows = {key: sorted(values) for key, values in self._samples.items()}
+
+        rows = []
+        for name, phase in sorted(windows, key=_row_order):
+            values = windows[name, phase]
+            row: Dict[str, Union[str, int, float]] = {
+                "operation": name,
+                "phase": phase,
+                "count": len(values),
+                "mean_ms": round(sum(values) / len(values) * 1000, 3),
+            }
+            for p in PERCENTILES:
+                row[f"p{p}_ms"] = round(percentile(values, p) * 1000, 3)
+            row["max_ms"] = round(values[-1] * 1000, 3)
+            rows.append(row)
+        return rows
+
+    def export_json(self, path: Union[str, Path] = "latency_metrics.json") -> Path:
+        """Write the summary as JSON and return its path."""
+        path = Path(path)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+        return path
+
+    def export_csv(self, path: Union[str, Path] = "latency_metrics.csv") -> Path:
+        """Write the summary as CSV and return its path."""
+        path = Path(path)
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.summary())
+        return path
@@ -0,0 +1,267 @@
+"""Recording and replaying the calls operations make against the HWP app.
+
+While ``CallRecorder`` is enabled, ``HwpAppManager.run`` hands operations
+the app through an ``AppProxy``. Every call, property read and property
+write is then kept as a ``CallRecord`` with its arguments, result and
+timing. The manager's liveness probes are recorded too, as the
+``liveness_probe`` operation. ``export`` writes the records as JSON lines with short keys::
+
+    {"o": "insert_template", "k": "call", "p": "insert_file", "a": ["a.hwp"], "t": 0.0012, "d": 0.0831}
+
+``CallReplayer`` runs such a log again against a real or simulated app and
+reports the calls whose results or errors differ from the recording.
+Objects returned by one call and passed to a later one, such as
+``api.HParameterSet.HCharShape.HSet``, are logged as references to the path
+they came from and resolved again on replay.
+"""
+
+import json
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from os import PathLike
+from pathlib import Path
+from time import perf_counter, sleep
+from typing import Any, Deque, Dict, Iterable, List, Optional, Union
+
+from .app_proxy import KIND_GET, KIND_SET, AppCall, AppProxy, Listener, is_plain
+
+# Markers of encoded arguments
+_REF = "$ref"
+_SHAPE = "$shape"
+_REPR = "$repr"
+
+
+def encode_value(value: Any) -> Any:
+    """JSON form of an argument or result."""
+    if isinstance(value, AppProxy):
+        return {_REF: value._path}
+    if is_plain(value):
+        return list(value) if isinstance(value, tuple) else value
+    if isinstance(value, PathLike):
+        return str(value)
+    if hasattr(value, "todict"):
+        return {_SHAPE: type(value).__name__, "props": value.todict()}
+    return {_REPR: repr(value)}
+
+
+def _decode_shape(name: str, properties: Dict[str, Any]) -> Any:
+    """Rebuild a ``hwpapi.classes`` shape, or a simulated one.
+
+    Shapes recorded against the simulated engine have no ``hwpapi`` class
+    and are rebuilt as simulated shapes even where ``hwpapi`` is installed.
+    """
+    try:
+        from hwpapi import classes
+    except ImportError:
+        classes = None
+    shape_class = getattr(classes, name, None)
+    if shape_class is None:
+        from .simulated import _SimulatedShape
+
+        return _SimulatedShape(properties)
+    return shape_class().fromdict(properties)
+
+
+@dataclass
+class CallRecord:
+    """One call against the app, as logged.
+
+    ``start`` is the offset from the start of the recording in seconds.
+    ``result`` is only kept for plain values and ``error`` is the repr of
+    the exception raised, if any.
+    """
+
+    operation: str
+    kind: str
+    path: str
+    args: List[Any] = field(default_factory=list)
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    start: float = 0.0
+    duration: float = 0.0
+    result: Any = None
+    error: Optional[str] = None
+
+    def to_json(self) -> Dict[str, Any]:
+        """Compact dict, leaving out empty fields."""
+        data: Dict[str, Any] = {"o": self.operation, "k": self.kind, "p": self.path}
+        if self.args:
+            data["a"] = self.args
+        if self.kwargs:
+            data["kw"] = self.kwargs
+        data["t"] = round(self.start, 6)
+        data["d"] = round(self.duration, 6)
+        if self.result is not None:
+            data["r"] = self.result
+        if self.error is not None:
+            data["e"] = self.error
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "CallRecord":
+        return cls(data["o"], data["k"], data["p"], data.get("a", []), data.get("kw", {}),
+                   data.get("t", 0.0), data.get("d", 0.0), data.get("r"), data.get("e"))
+
+
+def load_calls(path: Union[str, Path]) -> List[CallRecord]:
+    """Read a log written by ``CallRecorder.export``."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [CallRecord.from_json(json.loads(line)) for line in f if line.strip()]
+
+
+def round_trips(records: Iterable[CallRecord]) -> Dict[str, int]:
+    """Number of round trips made by each operation."""
+    return dict(Counter(record.operation for record in records))
+
+
+class CallRecorder:
+    """Keeps the calls made against the app while ``enabled``.
+
+    Like the tracer, records go into a ring buffer of ``capacity`` entries
+    so recording can stay on through a long session.
+    """
+
+    def __init__(self, enabled: bool = False, capacity: int = 100_000):
+        self.enabled = enabled
+        self._records: Deque[CallRecord] = deque(maxlen=capacity)
+        self._origin = perf_counter()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def listener(self, operation: str) -> Listener:
+        """Listener for an ``AppProxy`` recording calls under ``operation``."""
+        def record(call: AppCall) -> None:
+            self._records.append(CallRecord(
+                operation, call.kind, call.path,
+                [encode_value(arg) for arg in call.args],
+                {key: encode_value(value) for key, value in call.kwargs.items()},
+                call.start - self._origin, call.duration,
+                encode_value(call.result) if is_plain(call.result) else None,
+                repr(call.error) if call.error is not None else None,
+            ))
+        return record
+
+    def records(self) -> List[CallRecord]:
+        """Recorded calls, oldest first."""
+        return list(self._records)
+
+    def clear(self) -> None:
+        """Drop every record and restart the clock."""
+        self._records.clear()
+        self._origin = perf_counter()
+
+    def export(self, path: Union[str, Path] = "calls.jsonl") -> Path:
+        """Write the records as JSON lines and return the path."""
+        path = Path(path)
+        with open(path, 'w', encoding='utf-8') as f:
+            for record in self.records():
+                f.write(json.dumps(record.to_json(), ensure_ascii=False, separators=(",", ":")))
+                f.write("\n")
+        return path
+
+
+@dataclass
+class ReplayReport:
+    """Outcome of replaying a call log."""
+
+    calls: int = 0
+    errors: int = 0
+    mismatches: List[str] = field(default_factory=list)
+    recorded_seconds: float = 0.0
+    seconds: float = 0.0
+    round_trips: Dict[str, int] = field(default_factory=dict)
+
+    def format(self) -> str:
+        """Human readable summary."""
+        lines = [f"{self.calls} calls, {self.errors} errors, {len(self.mismatches)} mismatches; "
+                 f"{self.seconds:.2f}s replayed, {self.recorded_seconds:.2f}s recorded"]
+        lines += [f"  {name}: {count} round trips" for name, count in self.round_trips.items()]
+        lines += [f"  mismatch: {mismatch}" for mismatch in self.mismatches]
+        return "\n".join(lines)
+
+
+class CallReplayer:
+    """Runs a call log against ``app``.
+
+    With ``pace`` the gaps between recorded calls are kept, so a session
+    is replayed at the speed the user worked at.
+    """
+
+    def __init__(self, app: Any, pace: bool = False):
+        self.app = app
+        self.pace = pace
+        self._results: Dict[str, Any] = {}
+
+    def resolve(self, path: str) -> Any:
+        """Object at ``path``, starting from the latest call result on the way."""
+        parts = path.split(".") if path else []
+        for i in range(len(parts), 0, -1):
+            prefix = ".".join(parts[:i])
+            if prefix in self._results:
+                target, rest = self._results[prefix], parts[i:]
+                break
+        else:
+            target, rest = self.app, parts
+        for name in rest:
+            target = getattr(target, name)
+        return target
+
+    def _decode(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            if _REF in value:
+                return self.resolve(value[_REF])
+            if _SHAPE in value:
+                return _decode_shape(value[_SHAPE], value["props"])
+            if _REPR in value:
+                return value[_REPR]
+        return value
+
+    def _replay(self, record: CallRecord) -> Any:
+        # The owner is looked up rather than the whole path, which for a
+        # call such as ``actions.CharShape`` also names its last result
+        parent, _, name = record.path.rpartition(".")
+        if record.kind == KIND_GET:
+            return getattr(self.resolve(parent), name)
+        if record.kind == KIND_SET:
+            setattr(self.resolve(parent), name, self._decode(record.args[0]))
+            return None
+        result = getattr(self.resolve(parent), name)(
+            *[self._decode(arg) for arg in record.args],
+            **{key: self._decode(value) for key, value in record.kwargs.items()}
+        )
+        self._results[record.path] = result
+        return result
+
+    def run(self, records: List[CallRecord]) -> ReplayReport:
+        """Replay ``records`` in order and compare with what was recorded."""
+        report = ReplayReport(
+            recorded_seconds=sum(record.duration for record in records),
+            round_trips=round_trips(records),
+        )
+        self._results.clear()
+        first = records[0].start if records else 0.0
+        start = perf_counter()
+        for record in records:
+            if self.pace:
+                delay = record.start - first - (perf_counter() - start)
+                if delay > 0:
+                    sleep(delay)
+            report.calls += 1
+            error = None
+            try:
+                result = self._replay(record)
+            except Exception as e:
+                report.errors += 1
+                error, result = repr(e), None
+            if (error is None) != (record.error is None):
+                report.mismatches.append(
+                    f"{record.operation} {record.path}: recorded {record.error or 'success'}, "
+                    f"replayed {error or 'success'}"
+                )
+            elif record.result is not None and encode_value(result) != record.result:
+                report.mismatches.append(
+                    f"{record.operation} {record.path}: recorded {record.result!r}, "
+                    f"replayed {encode_value(result)!r}"
+                )
+        report.seconds = perf_counter() - start
+        return report
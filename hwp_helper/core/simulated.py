@@ -0,0 +1,401 @@
+"""In-process stand-in for the HWP automation objects.
+
+The simulated engine mimics the parts of ``hwpapi.core.App`` this project
+uses, adding a configurable delay to every call to stand in for the
+cross-process COM round trip, and can fail calls with ``com_error`` like a
+crashed or busy HWP would. ``SimulatedEngines`` stands in for the running
+HWP processes an app is connected to. Together they let the rendering,
+acquisition and operation code run and be measured on machines without HWP.
+"""
+
+import random
+import shutil
+import threading
+from collections import Counter
+from pathlib import Path
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..utils.com_utils import com_error
+
+# HRESULT of a call into a HWP process that has gone away
+RPC_E_SERVER_UNAVAILABLE = -2147023174
+
+
+class _SimulatedParameterSet:
+    """Parameter set that accepts any attribute."""
+
+
+class _SimulatedShape:
+    """Shape object with ``todict``, like ``hwpapi.classes.CharShape``."""
+
+    def __init__(self, properties: Dict[str, Any]):
+        self._properties = dict(properties)
+
+    def todict(self) -> Dict[str, Any]:
+        return dict(self._properties)
+
+
+class _SimulatedCharShape(_SimulatedShape):
+    """Char shape built from keyword arguments, like ``hwpapi.classes.CharShape(**kwargs)``."""
+
+    def __init__(self, **properties: Any):
+        super().__init__(properties)
+
+
+class _SimulatedHSet:
+    """Raw parameter set; each item write is a COM call."""
+
+    def __init__(self, app: "SimulatedApp"):
+        self._app = app
+        self.items: Dict[str, Any] = {}
+
+    def SetItem(self, key: str, value: Any) -> None:
+        self._app._round_trip("HSet.SetItem")
+        self._app.property_writes += 1
+        self.items[key] = value
+
+    def Item(self, key: str) -> Any:
+        self._app._round_trip("HSet.Item")
+        return self.items.get(key)
+
+
+class _SimulatedParameterSets:
+    """Raw parameter sets, like ``api.HParameterSet``."""
+
+    def __init__(self, app: "SimulatedApp"):
+        self.HCharShape = type("HCharShape", (), {"HSet": _SimulatedHSet(app)})()
+        self.HParaShape = type("HParaShape", (), {"HSet": _SimulatedHSet(app)})()
+
+
+class _SimulatedHAction:
+    """Raw action runner, like ``api.HAction``."""
+
+    def __init__(self, app: "SimulatedApp"):
+        self._app = app
+
+    def GetDefault(self, name: str, hset: _SimulatedHSet) -> bool:
+        self._app._round_trip("HAction.GetDefault")
+        hset.items = dict(self._app._shape_for(name))
+        return True
+
+    def Execute(self, name: str, hset: _SimulatedHSet) -> bool:
+        self._app._round_trip(f"HAction.Execute.{name}")
+        self._app._shape_for(name).update(hset.items)
+        return True
+
+
+class _SimulatedAction:
+    """A single HWP action with a parameter set."""
+
+    def __init__(self, app: "SimulatedApp", name: str):
+        self._app = app
+        self.name = name
+        self.pset = _SimulatedParameterSet()
+
+    def run(self) -> bool:
+        """Run the action."""
+        self._app._round_trip(f"actions.{self.name}")
+        if self.name == "BreakPara":
+            self._app.paragraphs += 1
+        return True
+
+
+class _SimulatedActions:
+    """Factory for simulated actions, like ``app.actions``."""
+
+    def __init__(self, app: "SimulatedApp"):
+        self._app = app
+
+    def __getattr__(self, name: str) -> Any:
+        return lambda: _SimulatedAction(self._app, name)
+
+
+class _SimulatedApi:
+    """Subset of the raw HWP automation object, like ``app.api``."""
+
+    def __init__(self, app: "SimulatedApp"):
+        self._app = app
+        self.HAction = _SimulatedHAction(app)
+        self.HParameterSet = _SimulatedParameterSets(app)
+
+    @property
+    def PageCount(self) -> int:
+        self._app._round_trip("api.PageCount")
+        return 1
+
+    @property
+    def Path(self) -> str:
+        self._app._round_trip("api.Path")
+        return str(self._app.path) if self._app.path else ""
+
+    @property
+    def IsModified(self) -> bool:
+        self._app._round_trip("api.IsModified")
+        return self._app.modified
+
+    def GetPos(self) -> Tuple[int, int, int]:
+        self._app._round_trip("api.GetPos")
+        return 0, self._app.paragraphs - 1, 0
+
+    def SetMessageBoxMode(self, mode: int) -> int:
+        self._app._round_trip("api.SetMessageBoxMode")
+        return 0
+
+    @property
+    def XHwpWindows(self) -> Any:
+        self._app._round_trip("api.XHwpWindows")
+        window = type("XHwpWindow", (), {"WindowHandle": self._app.hwnd})()
+        return type("XHwpWindows", (), {"Active_XHwpWindow": window})()
+
+
+class SimulatedApp:
+    """Fake HWP application with per-call latency.
+
+    ``calls`` counts the simulated COM round trips made against the instance
+    and ``property_writes`` the shape properties written. ``char_shape`` and
+    ``para_shape`` hold the shapes of the current selection.
+    ``replace_seconds`` is the extra time one ``replace_all`` pass takes over
+    the whole document, and ``replacements`` counts the passes run.
+
+    Calls named in ``fail_on`` (``"replace_all"``, ``"actions.BreakPara"``,
+    ``"api.PageCount"``...) always raise ``com_error``, and any call does so
+    with probability ``failure_rate``; ``failures`` counts them. After
+    ``quit`` every call fails, as it would against a closed HWP.
+    ``call_counts`` counts the round trips by call name. ``hwnd`` is the
+    window handle, the same for every instance so replays match.
+    """
+
+    charshape_class = _SimulatedCharShape
+
+    def __init__(self, latency: float = 0.0, paragraphs: int = 1,
+                 page_size: Tuple[int, int] = (595, 842),
+                 char_shape: Optional[Dict[str, Any]] = None,
+                 para_shape: Optional[Dict[str, Any]] = None,
+                 replace_seconds: float = 0.0,
+                 failure_rate: float = 0.0, fail_on: Iterable[str] = (),
+                 seed: Optional[int] = None):
+        self.latency = latency
+        self.paragraphs = paragraphs
+        self.page_size = page_size
+        self.char_shape: Dict[str, Any] = dict(char_shape or {})
+        self.para_shape: Dict[str, Any] = dict(para_shape or {})
+        self.replace_seconds = replace_seconds
+        self.path: Optional[Path] = None
+        self.modified = False
+        self.replacements = 0
+        self.page_margins: Dict[str, Any] = {}
+        self.failure_rate = failure_rate
+        self.fail_on = set(fail_on)
+        self.alive = True
+        self.hwnd = 0x10010
+        self.calls = 0
+        self.call_counts: Counter = Counter()
+        self.failures = 0
+        self.property_writes = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.actions = _SimulatedActions(self)
+        self.api = _SimulatedApi(self)
+
+    def _round_trip(self, name: str) -> None:
+        """Account for one call into the engine, failing it if injected."""
+        with self._lock:
+            self.calls += 1
+            self.call_counts[name] += 1
+            failed = (not self.alive or name in self.fail_on
+                      or (self.failure_rate > 0 and self._random.random() < self.failure_rate))
+            if failed:
+                self.failures += 1
+        if self.latency:
+            sleep(self.latency)
+        if failed:
+            raise com_error(RPC_E_SERVER_UNAVAILABLE, f"Simulated failure of {name}", None, None)
+
+    def _shape_for(self, action: str) -> Dict[str, Any]:
+        """Selection shape changed by a shape action."""
+        return self.char_shape if action == "CharShape" else self.para_shape
+
+    def get_charshape(self) -> _SimulatedShape:
+        """Read the character shape of the selection."""
+        self._round_trip("get_charshape")
+        return _SimulatedShape(self.char_shape)
+
+    def get_parashape(self) -> _SimulatedShape:
+        """Read the paragraph shape of the selection."""
+        self._round_trip("get_parashape")
+        return _SimulatedShape(self.para_shape)
+
+    def set_charshape(self, charshape: Any) -> bool:
+        """Write every property of a character shape, like hwpapi does."""
+        return self._set_shape("CharShape", charshape.todict())
+
+    def set_parashape(self, parashape: Any) -> bool:
+        """Write every property of a paragraph shape, like hwpapi does."""
+        return self._set_shape("ParagraphShape", parashape.todict())
+
+    def _set_shape(self, action: str, properties: Dict[str, Any]) -> bool:
+        for _ in properties:
+            self._round_trip("pset write")
+        self.property_writes += len(properties)
+        self._round_trip(f"actions.{action}")
+        self._shape_for(action).update(properties)
+        return True
+
+    def open(self, path: Any) -> bool:
+        """Open a document."""
+        self._round_trip("open")
+        self.path = Path(path)
+        self.modified = False
+        return True
+
+    def replace_all(self, *args: Any, **kwargs: Any) -> bool:
+        """Run a find-and-replace pass over the whole document."""
+        self._round_trip("replace_all")
+        self.replacements += 1
+        self.modified = True
+        if self.replace_seconds:
+            sleep(self.replace_seconds)
+        return True
+
+    def insert_file(self, path: Any) -> bool:
+        """Insert a document at the cursor."""
+        self._round_trip("insert_file")
+        if not Path(path).is_file():
+            return False
+        self.paragraphs += 1
+        self.modified = True
+        return True
+
+    def move(self, target: str = "NextPara") -> bool:
+        """Move the cursor."""
+        self._round_trip(f"move.{target}")
+        return True
+
+    def setup_page(self, **margins: Any) -> bool:
+        """Set the page margins of the document."""
+        self._round_trip("setup_page")
+        self.page_margins.update(margins)
+        self.modified = True
+        return True
+
+    def get_text(self) -> str:
+        """Get the text at the cursor."""
+        self._round_trip("get_text")
+        return "\r\n"
+
+    def save(self, path: Any = None) -> bool:
+        """Save the document, rendering a page image when saving as PNG.
+
+        Saving under another name copies the opened file there.
+        """
+        self._round_trip("save")
+        if path is not None and Path(path).suffix.lower() == ".png":
+            from PIL import Image
+
+            path = Path(path)
+            image = Image.new("RGB", self.page_size, "white")
+            image.paste((0, 0, 0), (60, 60, self.page_size[0] // 2, 120))
+            image.save(path.parent / f"{path.stem}001.png")
+        else:
+            if path is not None and self.path is not None and Path(path) != self.path:
+                shutil.copyfile(self.path, path)
+                self.path = Path(path)
+            self.modified = False
+        return True
+
+    def get_hwnd(self) -> int:
+        """Get the handle of the HWP window."""
+        return self.api.XHwpWindows.Active_XHwpWindow.WindowHandle
+
+    def save_block(self, path: Any) -> bool:
+        """Save the selection as a document, a copy of the opened file here."""
+        self._round_trip("save_block")
+        if self.path is not None and self.path.is_file():
+            shutil.copyfile(self.path, path)
+        else:
+            Path(path).write_bytes(b"")
+        return True
+
+    def quit(self) -> None:
+        """Quit the application."""
+        self._round_trip("quit")
+        self.alive = False
+
+
+class SimulatedEngines:
+    """Running HWP processes, like ``hwpapi.core.Engines``.
+
+    Each running engine is a ``SimulatedApp`` created with ``app_options``.
+    ``launch`` stands in for starting ``hwp.exe``: the engine shows up
+    ``startup`` seconds later. ``connect`` is a connector for
+    ``HwpAppManager`` returning the first running engine, or ``None``; each
+    lookup is one round trip, like enumerating the running objects.
+    ``calls`` adds those lookups to the calls made against every engine.
+    """
+
+    def __init__(self, running: int = 0, startup: float = 0.0,
+                 clock: Callable[[], float] = monotonic, **app_options: Any):
+        self.startup = startup
+        self.app_options = app_options
+        self.launches = 0
+        self.lookups = 0
+        self._clock = clock
+        self._created: List[SimulatedApp] = []
+        self._running: List[SimulatedApp] = [self._create() for _ in range(running)]
+        self._starting: List[float] = []
+
+    def _create(self) -> SimulatedApp:
+        app = SimulatedApp(**self.app_options)
+        self._created.append(app)
+        return app
+
+    def _poll(self) -> None:
+        """Move engines that finished starting to the running list."""
+        now = self._clock()
+        ready = [at for at in self._starting if at <= now]
+        for at in ready:
+            self._starting.remove(at)
+            self._running.append(self._create())
+
+    def __len__(self) -> int:
+        self._poll()
+        return len(self._running)
+
+    def __getitem__(self, index: int) -> SimulatedApp:
+        self._poll()
+        return self._running[index]
+
+    def __iter__(self) -> Iterator[SimulatedApp]:
+        self._poll()
+        return iter(list(self._running))
+
+    @property
+    def calls(self) -> int:
+        """Round trips made looking up and calling the engines."""
+        return self.lookups + sum(app.calls for app in self._created)
+
+    @property
+    def failures(self) -> int:
+        """Calls failed across every engine."""
+        return sum(app.failures for app in self._created)
+
+    def launch(self, path: Any = None) -> "SimulatedEngines":
+        """Start an engine, like ``subprocess.Popen`` of ``hwp.exe``."""
+        self.launches += 1
+        self._starting.append(self._clock() + self.startup)
+        return self
+
+    def connect(self) -> Optional[SimulatedApp]:
+        """The first running engine, or ``None`` if HWP is not running."""
+        self.lookups += 1
+        latency = self.app_options.get("latency", 0.0)
+        if latency:
+            sleep(latency)
+        self._poll()
+        return self._running[0] if self._running else None
+
+    def close(self, index: int = 0) -> None:
+        """Close a running engine, as if the user quit HWP."""
+        self._poll()
+        self._running.pop(index).alive = False
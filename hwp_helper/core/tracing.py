@@ -0,0 +1,132 @@
+"""Chrome trace-event recording of UI, service and COM spans.
+
+Spans are kept as complete (``"X"``) trace events in a bounded ring
+buffer, so tracing can stay on indefinitely; the oldest events are dropped
+first. ``export`` writes them as a JSON file that opens in Perfetto or
+``chrome://tracing``. Work submitted to the COM executor is linked to the
+span that submitted it with flow events.
+"""
+
+import itertools
+import json
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from time import perf_counter
+from typing import Any, ContextManager, Deque, Dict, Iterator, List, Optional, Union
+
+from .app_proxy import KIND_CALL, AppCall, AppProxy
+
+# Trace event categories
+CAT_UI = "ui"
+CAT_EXECUTOR = "executor"
+CAT_OPERATION = "operation"
+CAT_PHASE = "phase"
+CAT_COM = "com"
+
+_NO_SPAN = nullcontext()
+
+
+def _micros(seconds: float) -> float:
+    return seconds * 1e6
+
+
+class Tracer:
+    """Records trace events while ``enabled``.
+
+    When disabled ``span`` returns a shared no-op context manager and
+    nothing else is recorded.
+    """
+
+    def __init__(self, enabled: bool = False, capacity: int = 100_000):
+        self.enabled = enabled
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._threads: Dict[int, str] = {}
+        self._flow_ids = itertools.count(1)
+        self._pid = os.getpid()
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of events kept."""
+        return self._events.maxlen or 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def span(self, name: str, cat: str = CAT_OPERATION, **args: Any) -> ContextManager[None]:
+        """Context manager recording a span around its body."""
+        if not self.enabled:
+            return _NO_SPAN
+        return self._span(name, cat, args)
+
+    @contextmanager
+    def _span(self, name: str, cat: str, args: Dict[str, Any]) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.complete(name, cat, start, perf_counter() - start, args)
+
+    def complete(self, name: str, cat: str, start: float, duration: float,
+                 args: Optional[Dict[str, Any]] = None) -> None:
+        """Record a span that has already finished."""
+        event = self._event(name, cat, "X", start)
+        event["dur"] = _micros(duration)
+        if args:
+            event["args"] = args
+        self._events.append(event)
+
+    def flow_start(self, name: str = "submit") -> int:
+        """Start a flow arrow from the current span; returns its id."""
+        flow_id = next(self._flow_ids)
+        event = self._event(name, CAT_EXECUTOR, "s", perf_counter())
+        event["id"] = flow_id
+        self._events.append(event)
+        return flow_id
+
+    def flow_end(self, flow_id: int, name: str = "submit") -> None:
+        """End a flow arrow at the span enclosing this point."""
+        event = self._event(name, CAT_EXECUTOR, "f", perf_counter())
+        event["id"] = flow_id
+        event["bp"] = "e"
+        self._events.append(event)
+
+    def _event(self, name: str, cat: str, phase: str, start: float) -> Dict[str, Any]:
+        tid = threading.get_ident()
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        return {"name": name, "cat": cat, "ph": phase, "ts": _micros(start),
+                "pid": self._pid, "tid": tid}
+
+    def on_app_call(self, call: AppCall) -> None:
+        """Record a call made through an ``AppProxy``."""
+        name = call.path if call.kind == KIND_CALL else f"{call.kind} {call.path}"
+        args = {"error": repr(call.error)} if call.error is not None else None
+        self.complete(name, CAT_COM, call.start, call.duration, args)
+
+    def wrap(self, app: Any) -> Any:
+        """The app wrapped so every call against it is traced."""
+        return AppProxy(app, self.on_app_call)
+
+    def clear(self) -> None:
+        """Drop every recorded event."""
+        self._events.clear()
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Recorded events, preceded by thread name metadata."""
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid,
+             "args": {"name": name}}
+            for tid, name in list(self._threads.items())
+        ]
+        return metadata + list(self._events)
+
+    def export(self, path: Union[str, Path] = "trace.json") -> Path:
+        """Write the events as a Chrome trace file and return its path."""
+        path = Path(path)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": self.events(), "displayTimeUnit": "ms"}, f,
+                      ensure_ascii=False, default=repr)
+        return path
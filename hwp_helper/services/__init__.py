@@ -1,7 +1,17 @@
 """Services layer for business logic."""
 
 from .template_service import TemplateService
+from .template_catalog import TemplateCatalog, TemplateEntry
 from .hwp_operations import HwpOperationService
 from .file_service import FileService
+from .style_service import StyleService
+from .style_registry import SavedStyle, StyleRegistry
+from .review_rules import ReviewPlan, ReviewReport, ReviewRule
+from .batch_service import BatchRunner, FileResult
 
-__all__ = ["TemplateService", "HwpOperationService", "FileService"]
+__all__ = [
+    "TemplateService", "TemplateCatalog", "TemplateEntry",
+    "HwpOperationService", "FileService", "StyleService",
+    "SavedStyle", "StyleRegistry", "ReviewPlan", "ReviewReport",
+    "ReviewRule", "BatchRunner", "FileResult"
+]
@@ -0,0 +1,172 @@
+"""Apply a pipeline of operations to every document in a folder."""
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .engine_pool import EnginePool
+from .font_inventory import read_font_usage
+from .hwp_operations import DEFAULT_PAGE_MARGINS, KOICA_PAGE_MARGINS
+from .review_rules import (
+    COLOR_DOUBLE_SPACE_RULES, UNCOLOR_DOUBLE_SPACE_RULES, ReviewPlan, kopub_font_rules,
+)
+from ..utils.com_utils import com_error
+
+if TYPE_CHECKING:
+    from hwpapi.core import App
+
+REPORT_NAME = "batch_report.jsonl"
+
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+
+
+def _process_font(app: "App", path: Path) -> Any:
+    # The operations before this one do not change fonts, so the inventory
+    # of the source file still holds.
+    return ReviewPlan(kopub_font_rules(), usage=read_font_usage(path)).run(app)
+
+
+OPERATIONS: Dict[str, Callable[["App", Path], Any]] = {
+    "process_font": _process_font,
+    "color_double_space": lambda app, path: ReviewPlan(COLOR_DOUBLE_SPACE_RULES).run(app),
+    "uncolor_double_space": lambda app, path: ReviewPlan(UNCOLOR_DOUBLE_SPACE_RULES).run(app),
+    "setup_koica_page": lambda app, path: app.setup_page(**KOICA_PAGE_MARGINS),
+    "setup_page_margins": lambda app, path: app.setup_page(**DEFAULT_PAGE_MARGINS),
+}
+
+
+@dataclass
+class FileResult:
+    """Outcome of processing one document; one line of the batch report.
+
+    ``operations`` is the pipeline the document went through.
+    """
+
+    name: str
+    status: str
+    seconds: float = 0.0
+    steps: Dict[str, float] = field(default_factory=dict)
+    error: str = ""
+    mtime: int = 0
+    size: int = 0
+    operations: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_OK
+
+
+class BatchRunner:
+    """Runs operations on the ``*.hwp`` files of a folder across an engine pool.
+
+    Each document is opened, passed through the operations in order and
+    saved under the same name in ``output``. Every finished document is
+    appended to ``batch_report.jsonl`` in ``output`` as it completes, which
+    doubles as the checkpoint: on resume, documents recorded as done with
+    the same operations, whose source has not changed since, are skipped.
+    """
+
+    def __init__(self, source: Path, output: Path, operations: Sequence[str],
+                 app_factory: Callable[[], "App"], workers: int = 1,
+                 pattern: str = "*.hwp"):
+        unknown = [name for name in operations if name not in OPERATIONS]
+        if unknown:
+            raise ValueError(f"Unknown operations: {', '.join(unknown)}")
+        self.source = Path(source)
+        self.output = Path(output)
+        self.operations = list(operations)
+        self.pool = EnginePool(app_factory, workers)
+        self.pattern = pattern
+        self.report_path = self.output / REPORT_NAME
+
+    def documents(self) -> List[Path]:
+        """Source documents in name order."""
+        return sorted(path for path in self.source.glob(self.pattern) if path.is_file())
+
+    def load_checkpoint(self) -> Dict[str, FileResult]:
+        """Latest recorded result per document name."""
+        done: Dict[str, FileResult] = {}
+        if not self.report_path.exists():
+            return done
+        with open(self.report_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    result = FileResult(**json.loads(line))
+                except (ValueError, TypeError):
+                    # a line cut short by an interrupted run
+                    continue
+                done[result.name] = result
+        return done
+
+    def pending(self, resume: bool = True) -> Tuple[List[Path], int]:
+        """Documents still to process and the number skipped as done."""
+        documents = self.documents()
+        if not resume:
+            return documents, 0
+        done = self.load_checkpoint()
+        pending = []
+        for path in documents:
+            if not self._is_done(path, done.get(path.name)):
+                pending.append(path)
+        return pending, len(documents) - len(pending)
+
+    def _is_done(self, path: Path, result: Optional[FileResult]) -> bool:
+        """Whether ``result`` records the current pipeline run on the current source."""
+        if result is None or not result.ok or result.operations != self.operations:
+            return False
+        stat = path.stat()
+        return (result.mtime, result.size) == (stat.st_mtime_ns, stat.st_size)
+
+    def run(self, resume: bool = True) -> Iterator[FileResult]:
+        """Process pending documents, yielding each result as it is recorded."""
+        self.output.mkdir(parents=True, exist_ok=True)
+        pending, _ = self.pending(resume)
+        if not resume:
+            self.report_path.unlink(missing_ok=True)
+
+        results = self.pool.map_unordered(self._process, pending)
+        try:
+            with open(self.report_path, 'a', encoding='utf-8') as report:
+                for path, result, error in results:
+                    if error is not None:
+                        result = self._result(path, STATUS_FAILED, error=str(error))
+                    report.write(json.dumps(asdict(result), ensure_ascii=False) + "\n")
+                    report.flush()
+                    os.fsync(report.fileno())
+                    yield result
+        finally:
+            results.close()
+
+    def _process(self, app: "App", path: Path) -> FileResult:
+        """Open, transform and save one document.
+
+        Errors are not printed here; they are carried in the result.
+        ``com_error`` is raised on to the pool, which replaces the engine.
+        """
+        steps: Dict[str, float] = {}
+        start = perf_counter()
+        try:
+            app.open(path)
+            for name in self.operations:
+                step_start = perf_counter()
+                OPERATIONS[name](app, path)
+                steps[name] = perf_counter() - step_start
+            app.save(self.output / path.name)
+        except com_error:
+            raise
+        except Exception as e:
+            return self._result(path, STATUS_FAILED, perf_counter() - start, steps, str(e))
+        return self._result(path, STATUS_OK, perf_counter() - start, steps)
+
+    def _result(self, path: Path, status: str, seconds: float = 0.0,
+                steps: Optional[Dict[str, float]] = None, error: str = "") -> FileResult:
+        stat = path.stat()
+        return FileResult(
+            name=path.name, status=status, seconds=seconds, steps=steps or {},
+            error=error, mtime=stat.st_mtime_ns, size=stat.st_size,
+            operations=list(self.operations),
+        )
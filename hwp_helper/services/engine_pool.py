@@ -0,0 +1,104 @@
+"""Pool of hidden HWP engines."""
+
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from ..utils.com_utils import com_apartment, com_error
+
+
+_STOP = object()
+
+
+class EnginePool:
+    """Runs jobs across worker threads that each own one HWP engine.
+
+    COM objects are bound to the apartment that created them, so every
+    worker initialises COM on its own thread, creates its own engine there
+    and quits it before the thread ends. Engines are never shared.
+
+    A job failing with ``com_error`` may have taken its engine down, so
+    the worker quits that engine and starts a new one before the next job.
+    """
+
+    def __init__(self, app_factory: Callable[[], Any], workers: int = 1):
+        self.app_factory = app_factory
+        self.workers = max(1, int(workers))
+
+    def map_unordered(self, func: Callable[[Any, Any], Any],
+                      items: Iterable[Any]) -> Iterator[Tuple[Any, Any, Optional[BaseException]]]:
+        """Run ``func(app, item)`` for every item and yield results as they finish.
+
+        Each result is ``(item, return_value, error)``. Closing the iterator
+        early stops the workers after their current job.
+        """
+        items = list(items)
+        if not items:
+            return
+
+        jobs: "queue.Queue[Any]" = queue.Queue()
+        results: "queue.Queue[Tuple[Any, Any, Optional[BaseException]]]" = queue.Queue()
+        stop = threading.Event()
+
+        for item in items:
+            jobs.put(item)
+
+        threads: List[threading.Thread] = []
+        for i in range(min(self.workers, len(items))):
+            jobs.put(_STOP)
+            thread = threading.Thread(
+                target=self._worker, args=(func, jobs, results, stop),
+                name=f"hwp-engine-{i}", daemon=True
+            )
+            thread.start()
+            threads.append(thread)
+
+        try:
+            for _ in range(len(items)):
+                yield results.get()
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    def _worker(self, func: Callable[[Any, Any], Any], jobs: "queue.Queue[Any]",
+                results: "queue.Queue[Tuple[Any, Any, Optional[BaseException]]]",
+                stop: threading.Event) -> None:
+        """Worker loop: create an engine and process jobs until told to stop."""
+        with com_apartment():
+            app, startup_error = self._start_engine()
+            try:
+                while not stop.is_set():
+                    item = jobs.get()
+                    if item is _STOP:
+                        break
+                    if startup_error is not None:
+                        results.put((item, None, startup_error))
+                        continue
+                    try:
+                        results.put((item, func(app, item), None))
+                    except com_error as e:
+                        results.put((item, None, e))
+                        self._quit(app)
+                        app, startup_error = self._start_engine()
+                    except Exception as e:
+                        results.put((item, None, e))
+            finally:
+                self._quit(app)
+
+    def _start_engine(self) -> Tuple[Any, Optional[BaseException]]:
+        """Create an engine, returning it or the error that prevented it."""
+        try:
+            return self.app_factory(), None
+        except Exception as e:
+            print(f"Error starting HWP engine: {e}")
+            return None, e
+
+    @staticmethod
+    def _quit(app: Any) -> None:
+        """Quit an engine, ignoring errors from one that already went away."""
+        if app is not None:
+            try:
+                app.quit()
+            except Exception:
+                pass
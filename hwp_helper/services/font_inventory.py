@@ -0,0 +1,35 @@
+"""Find the fonts a document uses, for skipping review rules that cannot match.
+
+The KoPub replacements themselves are ``review_rules.kopub_font_rules``,
+run as a ``ReviewPlan`` that takes this module's usage sets and returns a
+``ReviewReport``.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Set, Tuple, Union
+
+from ..utils.hwp_reader import HwpDocument, HwpFormatError
+
+if TYPE_CHECKING:
+    from hwpapi.core import App
+
+
+def read_font_usage(path: Union[str, Path]) -> Optional[Set[Tuple[str, bool]]]:
+    """Get the ``(face name, bold)`` pairs used in a saved file, or ``None`` if it cannot be read."""
+    try:
+        return HwpDocument(path).font_usage()
+    except HwpFormatError as e:
+        print(f"Error reading fonts of {path}: {e}")
+        return None
+
+
+def document_font_usage(app: "App") -> Optional[Set[Tuple[str, bool]]]:
+    """Font usage of the open document, read from its saved file.
+
+    Returns ``None`` when the document has never been saved or has unsaved
+    changes, since the file would not reflect what is on screen.
+    """
+    path = app.api.Path
+    if not path or app.api.IsModified:
+        return None
+    return read_font_usage(path)
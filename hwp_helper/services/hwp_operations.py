@@ -1,26 +1,60 @@
 """HWP operation service for business logic."""
 
-from typing import Any
+import asyncio
+from concurrent.futures import Future
+from typing import Any, Callable
 from functools import wraps
 
 from ..core.app_manager import HwpAppManager
 
+# Page margins in millimetres
+DEFAULT_PAGE_MARGINS = dict(top=20, bottom=15, left=20, right=20, header=15, footer=5, gutter=0)
+KOICA_PAGE_MARGINS = dict(top=30, bottom=15, left=20, right=15, header=0, footer=15, gutter=0)
+
 
 def ensure_app_ready(func):
     """Decorator to ensure HWP app is ready before operation."""
     @wraps(func)
     def wrapper(self, *args, **kwargs):
-        app = self.app_manager.ensure_app_ready()
-        return func(self, app, *args, **kwargs)
+        return self.app_manager.run(
+            lambda app: func(self, app, *args, **kwargs), name=func.__name__
+        )
+    wrapper.is_hwp_operation = True
     return wrapper
 
 
+def with_async_variants(cls):
+    """Class decorator adding an awaitable ``<name>_async`` for each operation.
+    
+    The awaitable variant submits the operation to the COM executor and
+    waits for the result without blocking the event loop.
+    """
+    def make_async(name: str):
+        async def method(self, *args, **kwargs):
+            return await asyncio.wrap_future(
+                self.submit(getattr(self, name), *args, **kwargs)
+            )
+        method.__name__ = f"{name}_async"
+        method.__doc__ = f"Awaitable version of ``{name}``."
+        return method
+    
+    for name, attr in list(vars(cls).items()):
+        if getattr(attr, "is_hwp_operation", False):
+            setattr(cls, f"{name}_async", make_async(name))
+    return cls
+
+
+@with_async_variants
 class HwpOperationService:
     """Service for HWP-specific operations."""
     
     def __init__(self, app_manager: HwpAppManager):
         self.app_manager = app_manager
     
+    def submit(self, func: Callable[..., Any], *args, **kwargs) -> Future:
+        """Run an operation on the COM executor thread."""
+        return self.app_manager.executor.submit(func, *args, **kwargs)
+    
     @ensure_app_ready
     def insert_template(self, app, template_path: str, move_count: int = 0) -> None:
         """Insert a template file and move cursor."""
@@ -45,22 +79,14 @@ class HwpOperationService:
         app.set_cell_border(bottom=8, bottom_width=0.5)
     
     @ensure_app_ready
-    def setup_page_margins(self, app, top: int = 20, bottom: int = 15, 
-                          left: int = 20, right: int = 20, header: int = 15, 
-                          footer: int = 5, gutter: int = 0) -> Any:
-        """Setup page margins."""
-        return app.setup_page(
-            top=top, bottom=bottom, left=left, right=right,
-            header=header, footer=footer, gutter=gutter
-        )
+    def setup_page_margins(self, app, **margins: int) -> Any:
+        """Setup page margins, defaulting to ``DEFAULT_PAGE_MARGINS``."""
+        return app.setup_page(**{**DEFAULT_PAGE_MARGINS, **margins})
     
     @ensure_app_ready
     def setup_koica_page(self, app) -> Any:
         """Setup KOICA document page margins."""
-        return app.setup_page(
-            top=30, bottom=15, left=20, right=15, 
-            header=0, footer=15, gutter=0
-        )
+        return app.setup_page(**KOICA_PAGE_MARGINS)
     
     # Font and character operations
     @ensure_app_ready
@@ -0,0 +1,285 @@
+"""Review rules compiled into a minimal sequence of find/replace passes.
+
+A review rule finds text (optionally by regular expression) carrying one
+char shape and gives it another. Each ``replace_all`` call makes HWP walk
+the whole document, so rules are compiled into a ``ReviewPlan`` first:
+
+* rules repeated in a rule set run once, at their first position;
+* consecutive rules matching the same text and shape, without changing
+  the text or the matched properties, are merged into one pass setting
+  all of their properties;
+* rules whose source font does not occur in the document (see
+  ``font_inventory``) are skipped.
+"""
+
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from ..core.app_proxy import unwrap
+
+if TYPE_CHECKING:
+    from hwpapi.core import App
+
+DOUBLE_SPACE_COLOR = "#ffaa11"
+NO_SHADE_COLOR = 4294967295
+
+# Seconds one ``replace_all`` pass over a typical report takes in HWP, about
+# 50 ms; the estimate used until a review run has timed a pass
+PASS_SECONDS = 0.05
+
+# (bold face, faces rendered bold with the bold attribute) per family
+KOPUB_FONT_FAMILIES = [
+    ("KoPubWorld돋움체 Bold", ("KoPubWorld돋움체 Medium", "KoPubWorld돋움체 Light")),
+    ("KoPubWorld바탕체 Bold", ("KoPubWorld바탕체 Medium", "KoPubWorld바탕체 Light")),
+    ("KoPub돋움체 Bold", ("KoPub돋움체 Medium", "KoPub돋움체 Light")),
+    ("KoPub바탕체 Bold", ("KoPub바탕체 Medium", "KoPub바탕체 Light")),
+]
+
+
+def charshape_class(app: "App") -> Callable[..., Any]:
+    """Type building the char shapes ``replace_all`` takes on ``app``.
+
+    An engine class may bring its own as ``charshape_class``, as the
+    simulated one does; HWP gets ``hwpapi.classes.CharShape``. The class
+    is looked up rather than the instance, which would ask HWP over COM.
+    """
+    shape_class = getattr(type(unwrap(app)), "charshape_class", None)
+    if shape_class is None:
+        from hwpapi.classes import CharShape
+
+        shape_class = CharShape
+    return shape_class
+
+
+@dataclass(frozen=True)
+class ReviewRule:
+    """Give text matching ``find`` and ``old_charshape`` the ``new_charshape``.
+
+    Shapes are ``hwpapi.classes.CharShape`` keyword arguments. An empty
+    ``find`` matches by shape alone; ``replace`` defaults to ``find``.
+    """
+
+    name: str
+    find: str = ""
+    replace: Optional[str] = None
+    old_charshape: Dict[str, Any] = field(default_factory=dict)
+    new_charshape: Dict[str, Any] = field(default_factory=dict)
+    regex: bool = False
+
+    @property
+    def replacement(self) -> str:
+        """Text written in place of the match."""
+        return self.find if self.replace is None else self.replace
+
+    @property
+    def match_key(self) -> Hashable:
+        """What the rule matches."""
+        return self.find, self.regex, tuple(sorted(self.old_charshape.items()))
+
+    @property
+    def key(self) -> Hashable:
+        """What the rule matches and what it changes."""
+        return self.match_key, self.replacement, tuple(sorted(self.new_charshape.items()))
+
+    def can_match(self, usage: Optional[Set[Tuple[str, bool]]]) -> bool:
+        """Whether the source font of the rule occurs in a font ``usage``."""
+        font = self.old_charshape.get("font")
+        if usage is None or font is None:
+            return True
+        bold = self.old_charshape.get("bold")
+        return any(name == font and (bold is None or used_bold == bold)
+                   for name, used_bold in usage)
+
+
+@dataclass
+class ReviewPass:
+    """One ``replace_all`` call applying one or more rules."""
+
+    rules: List[ReviewRule]
+    new_charshape: Dict[str, Any]
+
+    @property
+    def rule(self) -> ReviewRule:
+        """The rule the pass matches like."""
+        return self.rules[0]
+
+    def can_absorb(self, rule: ReviewRule) -> bool:
+        """Whether ``rule`` gives the same result run in this pass."""
+        first = self.rule
+        if rule.match_key != first.match_key or rule.replacement != first.find:
+            return False
+        if first.replacement != first.find:
+            return False
+        if set(self.new_charshape) & set(first.old_charshape):
+            # text changed by this pass no longer matches the next rule
+            return False
+        return all(self.new_charshape.get(key, value) == value
+                   for key, value in rule.new_charshape.items())
+
+    def run(self, app: "App") -> Any:
+        """Send the pass to HWP."""
+        CharShape = charshape_class(app)
+        args = (self.rule.find, self.rule.replacement) if self.rule.find else ()
+        kwargs = {"find_reg_exp": True} if self.rule.regex else {}
+        return app.replace_all(
+            *args,
+            old_charshape=CharShape(**self.rule.old_charshape),
+            new_charshape=CharShape(**self.new_charshape),
+            **kwargs,
+        )
+
+
+@dataclass
+class RuleReport:
+    """What one rule did during a review run."""
+
+    name: str
+    hits: int = 0
+    seconds: float = 0.0
+    skipped: bool = False
+
+
+@dataclass
+class ReviewReport:
+    """Outcome of running a review plan."""
+
+    rules: List[RuleReport]
+    passes: int
+    elapsed: float
+    pass_seconds: float = PASS_SECONDS
+
+    @property
+    def saved(self) -> float:
+        """Estimated seconds saved over one pass per rule.
+
+        Every rule merged into another's pass or skipped saves one pass of
+        ``pass_seconds``, so a run that skipped every rule still reports it.
+        """
+        return (len(self.rules) - self.passes) * self.pass_seconds
+
+    @property
+    def hits(self) -> int:
+        """Hits over all rules."""
+        return sum(rule.hits for rule in self.rules)
+
+    @property
+    def changed(self) -> int:
+        """Rules whose pass changed something.
+
+        Unlike ``hits`` this means the same whether the engine reports match
+        counts or, like HWP, only whether a pass replaced anything.
+        """
+        return sum(1 for rule in self.rules if rule.hits)
+
+    def format(self) -> str:
+        """Per-rule table of hits and timings."""
+        lines = [f"{'rule':<40} {'hits':>5} {'ms':>9}"]
+        for rule in self.rules:
+            timing = "skipped" if rule.skipped else f"{rule.seconds * 1000:.1f}"
+            lines.append(f"{rule.name:<40} {rule.hits:>5} {timing:>9}")
+        lines.append(f"{len(self.rules)} rules in {self.passes} passes, {self.elapsed:.2f}s")
+        return "\n".join(lines)
+
+
+def _hits(result: Any) -> int:
+    """Matches reported by ``replace_all``.
+
+    HWP reports only whether a pass replaced anything, which counts as one
+    hit; engines returning a count are taken at their word.
+    """
+    if isinstance(result, bool) or result is None:
+        return int(bool(result))
+    if isinstance(result, int):
+        return result
+    return 1
+
+
+class ReviewPlan:
+    """Compiled review rules.
+
+    ``pass_seconds`` is the average pass time of the latest run that made
+    any passes, shared by all plans; reports estimate the time saved with
+    the value measured before their run.
+    """
+
+    pass_seconds = PASS_SECONDS
+
+    def __init__(self, rules: Sequence[ReviewRule],
+                 usage: Optional[Set[Tuple[str, bool]]] = None):
+        self.rules = list(rules)
+        self.usage = usage
+        self.passes: List[ReviewPass] = []
+        self.skipped: List[ReviewRule] = []
+        # pass running each rule, None for skipped rules
+        self._assigned: List[Optional[ReviewPass]] = []
+
+        seen: Dict[Hashable, ReviewPass] = {}
+        for rule in self.rules:
+            review_pass = None
+            if not rule.can_match(usage):
+                self.skipped.append(rule)
+            elif rule.key in seen:
+                review_pass = seen[rule.key]
+                review_pass.rules.append(rule)
+            elif self.passes and self.passes[-1].can_absorb(rule):
+                review_pass = self.passes[-1]
+                review_pass.rules.append(rule)
+                review_pass.new_charshape.update(rule.new_charshape)
+            else:
+                review_pass = ReviewPass([rule], dict(rule.new_charshape))
+                self.passes.append(review_pass)
+            if review_pass is not None:
+                seen[rule.key] = review_pass
+            self._assigned.append(review_pass)
+
+    def run(self, app: "App") -> ReviewReport:
+        """Run every pass, timing each and sharing its time among its rules."""
+        results: Dict[int, Tuple[int, float]] = {}
+        start = perf_counter()
+        for review_pass in self.passes:
+            pass_start = perf_counter()
+            hits = _hits(review_pass.run(app))
+            results[id(review_pass)] = hits, (perf_counter() - pass_start) / len(review_pass.rules)
+        elapsed = perf_counter() - start
+        pass_seconds = ReviewPlan.pass_seconds
+        if self.passes:
+            ReviewPlan.pass_seconds = elapsed / len(self.passes)
+
+        reports = []
+        for rule, review_pass in zip(self.rules, self._assigned):
+            if review_pass is None:
+                reports.append(RuleReport(rule.name, skipped=True))
+            else:
+                hits, seconds = results[id(review_pass)]
+                reports.append(RuleReport(rule.name, hits, seconds))
+        return ReviewReport(rules=reports, passes=len(self.passes), elapsed=elapsed,
+                            pass_seconds=pass_seconds)
+
+
+COLOR_DOUBLE_SPACE_RULES = [
+    ReviewRule("연속 공백 색칠", "  ", regex=True,
+               new_charshape={"shade_color": DOUBLE_SPACE_COLOR}),
+]
+
+UNCOLOR_DOUBLE_SPACE_RULES = [
+    ReviewRule("공백 색 지우기", " ", regex=True,
+               old_charshape={"shade_color": DOUBLE_SPACE_COLOR},
+               new_charshape={"shade_color": NO_SHADE_COLOR}),
+]
+
+
+def kopub_font_rules(families: Sequence[Tuple[str, Sequence[str]]] = KOPUB_FONT_FAMILIES) -> List[ReviewRule]:
+    """Rules turning bold-attributed KoPub text into the family's bold face."""
+    rules = []
+    for bold_font, fonts in families:
+        for font in fonts:
+            rules.append(ReviewRule(
+                f"{font} bold", old_charshape={"font": font, "bold": True},
+                new_charshape={"font": bold_font, "bold": False},
+            ))
+            rules.append(ReviewRule(
+                f"{bold_font} bold", old_charshape={"font": bold_font, "bold": True},
+                new_charshape={"font": bold_font, "bold": False},
+            ))
+    return rules
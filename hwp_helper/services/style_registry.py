@@ -0,0 +1,130 @@
+"""Registry of saved font styles."""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+
+def _parse_charshape(properties: Dict[str, Any]) -> Any:
+    from hwpapi.classes import CharShape
+    return CharShape().fromdict(properties)
+
+
+def _parse_parashape(properties: Dict[str, Any]) -> Any:
+    from hwpapi.classes import ParaShape
+    return ParaShape().fromdict(properties)
+
+
+def _shape_key(properties: Dict[str, Any]) -> Hashable:
+    """Hashable key identifying a shape dict by its contents."""
+    try:
+        return tuple(sorted(properties.items()))
+    except TypeError:
+        return repr(sorted(properties.items()))
+
+
+@dataclass(frozen=True)
+class SavedStyle:
+    """A saved style with its parsed shapes."""
+
+    style_id: str
+    char_dict: Dict[str, Any]
+    para_dict: Dict[str, Any]
+    charshape: Any
+    parashape: Any
+
+    @property
+    def label(self) -> str:
+        """Short description shown next to the style."""
+        return f"{self.charshape.hangul_font} {self.charshape.fontsize}pt"
+
+
+class _InternTable:
+    """Shape dicts and their parsed objects shared between styles."""
+
+    def __init__(self, parse: Callable[[Dict[str, Any]], Any]):
+        self.parse = parse
+        # key -> [shape dict, parsed shape, number of styles using it]
+        self._shapes: Dict[Hashable, List[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    def acquire(self, properties: Dict[str, Any]) -> Tuple[Dict[str, Any], Any]:
+        """Get the shared dict and parsed shape equal to ``properties``."""
+        key = _shape_key(properties)
+        shape = self._shapes.get(key)
+        if shape is None:
+            properties = dict(properties)
+            shape = self._shapes[key] = [properties, self.parse(properties), 0]
+        shape[2] += 1
+        return shape[0], shape[1]
+
+    def release(self, properties: Dict[str, Any]) -> None:
+        """Drop a reference taken by ``acquire``."""
+        key = _shape_key(properties)
+        shape = self._shapes.get(key)
+        if shape is not None:
+            shape[2] -= 1
+            if shape[2] <= 0:
+                del self._shapes[key]
+
+
+class StyleRegistry:
+    """Saved styles, parsed once and keyed by id.
+
+    Styles with identical char or para shapes share one dict and one parsed
+    shape object, which is released when the last style using it is
+    removed.
+    """
+
+    def __init__(self, styles: Optional[Mapping[str, Sequence[Dict[str, Any]]]] = None,
+                 parse_charshape: Callable[[Dict[str, Any]], Any] = _parse_charshape,
+                 parse_parashape: Callable[[Dict[str, Any]], Any] = _parse_parashape):
+        self._styles: Dict[str, SavedStyle] = {}
+        self._char_shapes = _InternTable(parse_charshape)
+        self._para_shapes = _InternTable(parse_parashape)
+        for style_id, (char_dict, para_dict) in (styles or {}).items():
+            self.add(style_id, char_dict, para_dict)
+
+    def __len__(self) -> int:
+        return len(self._styles)
+
+    def __iter__(self) -> Iterator[SavedStyle]:
+        return iter(list(self._styles.values()))
+
+    def __contains__(self, style_id: str) -> bool:
+        return style_id in self._styles
+
+    @property
+    def shape_count(self) -> int:
+        """Number of distinct shapes held."""
+        return len(self._char_shapes) + len(self._para_shapes)
+
+    def get(self, style_id: str) -> Optional[SavedStyle]:
+        """Get a style by id."""
+        return self._styles.get(style_id)
+
+    def add(self, style_id: str, char_dict: Dict[str, Any],
+            para_dict: Dict[str, Any]) -> SavedStyle:
+        """Add or replace a style."""
+        self.remove(style_id)
+        char_dict, charshape = self._char_shapes.acquire(char_dict)
+        para_dict, parashape = self._para_shapes.acquire(para_dict)
+        style = SavedStyle(style_id, char_dict, para_dict, charshape, parashape)
+        self._styles[style_id] = style
+        return style
+
+    def remove(self, style_id: str) -> Optional[SavedStyle]:
+        """Remove a style by id."""
+        style = self._styles.pop(style_id, None)
+        if style is not None:
+            self._char_shapes.release(style.char_dict)
+            self._para_shapes.release(style.para_dict)
+        return style
+
+    def to_config(self) -> Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """The styles in the ``font_styles`` setting format."""
+        return {
+            style.style_id: (style.char_dict, style.para_dict)
+            for style in self._styles.values()
+        }
@@ -0,0 +1,82 @@
+"""Apply saved character and paragraph styles."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from ..core.app_manager import HwpAppManager
+
+if TYPE_CHECKING:
+    from hwpapi.core import App
+
+# (action, parameter set) pairs used to apply each kind of shape
+CHAR_SHAPE_ACTION = ("CharShape", "HCharShape")
+PARA_SHAPE_ACTION = ("ParagraphShape", "HParaShape")
+
+
+def shape_diff(target: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the properties of ``target`` whose value differs from ``current``.
+
+    Properties HWP does not report for the selection, for example because
+    it mixes several values, count as different.
+    """
+    missing = object()
+    return {
+        key: value for key, value in target.items()
+        if value is not None and current.get(key, missing) != value
+    }
+
+
+@dataclass
+class ApplyResult:
+    """What applying a style sent to HWP."""
+
+    char_properties: int = 0
+    para_properties: int = 0
+    actions: int = 0
+
+
+class StyleService:
+    """Applies saved styles by sending only the properties that differ.
+
+    The current shapes of the selection are read once, compared with the
+    style, and the differing properties of each shape are written into one
+    parameter set and executed as a single action. Nothing is sent for a
+    shape that already matches.
+    """
+
+    def __init__(self, app_manager: HwpAppManager):
+        self.app_manager = app_manager
+
+    def apply_style(self, charshape: Optional[Dict[str, Any]] = None,
+                    parashape: Optional[Dict[str, Any]] = None) -> ApplyResult:
+        """Apply a style to the current selection."""
+        return self.app_manager.run(
+            lambda app: self.apply(app, charshape, parashape), name="apply_style"
+        )
+
+    def apply(self, app: "App", charshape: Optional[Dict[str, Any]] = None,
+              parashape: Optional[Dict[str, Any]] = None) -> ApplyResult:
+        """Apply a style using ``app``."""
+        result = ApplyResult()
+        if charshape:
+            diff = shape_diff(charshape, app.get_charshape().todict())
+            result.char_properties = len(diff)
+            result.actions += self._execute(app, CHAR_SHAPE_ACTION, diff)
+        if parashape:
+            diff = shape_diff(parashape, app.get_parashape().todict())
+            result.para_properties = len(diff)
+            result.actions += self._execute(app, PARA_SHAPE_ACTION, diff)
+        return result
+
+    @staticmethod
+    def _execute(app: "App", action: tuple, properties: Dict[str, Any]) -> int:
+        """Run one action setting ``properties``; returns the number of actions run."""
+        if not properties:
+            return 0
+        action_name, pset_name = action
+        hset = getattr(app.api.HParameterSet, pset_name).HSet
+        app.api.HAction.GetDefault(action_name, hset)
+        for key, value in properties.items():
+            hset.SetItem(key, value)
+        app.api.HAction.Execute(action_name, hset)
+        return 1
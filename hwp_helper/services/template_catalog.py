@@ -0,0 +1,222 @@
+"""Persistent template catalog."""
+
+import json
+import os
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional
+
+
+@dataclass
+class TemplateEntry:
+    """A single template and its preview image."""
+
+    category: str
+    name: str
+    move_count: int
+    template_path: str
+    image_path: str
+    mtime: int = 0
+    size: int = 0
+    content_hash: str = ""
+
+    @property
+    def filename(self) -> str:
+        """Template file name without extension (``category_name``)."""
+        return Path(self.template_path).stem
+
+    def as_tuple(self) -> Tuple[str, Path, str, int]:
+        """Return the ``(name, image, filename, move_count)`` tuple used by the UI."""
+        return self.name, Path(self.image_path), self.filename, self.move_count
+
+
+def parse_image_stem(stem: str) -> Tuple[str, str, int]:
+    """Split a preview image stem into ``(category, name, move_count)``."""
+    parts = stem.split("_")
+    if len(parts) == 1:
+        parts = [parts[0], "None", "0"]
+    return parts[0], parts[1], int(parts[2])
+
+
+class TemplateCatalog:
+    """Index of templates persisted to a single JSON file.
+
+    The catalog is loaded once and kept in memory. It is rebuilt from the
+    ``images`` folder only when the modification time of the template or
+    image directory differs from the one recorded at the last save.
+    """
+
+    VERSION = 1
+
+    def __init__(self, catalog_file: str = "template_catalog.json",
+                 templates_dir: str = "templates", images_dir: str = "images"):
+        self.catalog_file = Path(catalog_file)
+        self.templates_dir = Path(templates_dir)
+        self.images_dir = Path(images_dir)
+        self._entries: Dict[str, TemplateEntry] = {}
+        self._dir_state: Dict[str, int] = {}
+        self._loaded = False
+
+    def load(self) -> None:
+        """Load the catalog from disk, rebuilding it if it is stale."""
+        self._loaded = True
+        try:
+            with open(self.catalog_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            self.rebuild()
+            return
+
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            self.rebuild()
+            return
+
+        try:
+            entries = [TemplateEntry(**item) for item in data.get("entries", [])]
+        except (TypeError, ValueError):
+            # entries with other fields, written by another version of the app
+            self.rebuild()
+            return
+        self._entries = {entry.filename: entry for entry in entries}
+
+        self._dir_state = data.get("dirs", {})
+        if self._dir_state != self._current_dir_state():
+            self.rebuild()
+
+    def validate(self) -> None:
+        """Rebuild the catalog if the template or image folder changed."""
+        if not self._loaded:
+            self.load()
+        elif self._dir_state != self._current_dir_state():
+            self.rebuild()
+
+    def _ensure_loaded(self) -> None:
+        """Load the catalog once without checking folder changes.
+
+        Mutations go through here rather than ``validate`` because the
+        caller has just changed the folders itself.
+        """
+        if not self._loaded:
+            self.load()
+
+    def rebuild(self) -> None:
+        """Rebuild the catalog by scanning the image folder.
+
+        Entries whose preview is still present keep their recorded file
+        stats so that templates changed since their last render are still
+        detected as changed.
+        """
+        known = {entry.image_path: entry for entry in self._entries.values()}
+        self._loaded = True
+        self._entries = {}
+        if self.images_dir.exists():
+            for image in self.images_dir.glob("*"):
+                entry = known.get(str(image)) or self._entry_from_image(image)
+                self._entries[entry.filename] = entry
+        self.save()
+
+    def save(self) -> None:
+        """Write the catalog to disk atomically."""
+        self._dir_state = self._current_dir_state()
+        data = {
+            "version": self.VERSION,
+            "dirs": self._dir_state,
+            "entries": [asdict(entry) for entry in self._entries.values()],
+        }
+        temp_file = self.catalog_file.with_name(self.catalog_file.name + ".tmp")
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_file, self.catalog_file)
+        except OSError as e:
+            print(f"Error saving template catalog: {e}")
+
+    def get(self, filename: str) -> Optional[TemplateEntry]:
+        """Get an entry by template file name."""
+        self.validate()
+        return self._entries.get(filename)
+
+    def entries(self) -> List[TemplateEntry]:
+        """Get all catalog entries."""
+        self.validate()
+        return list(self._entries.values())
+
+    def get_categories(self) -> Dict[str, List[Tuple[str, Path, str, int]]]:
+        """Group entries with a preview image by category."""
+        self.validate()
+        categories: Dict[str, List[Tuple[str, Path, str, int]]] = {}
+        for entry in self._entries.values():
+            if entry.image_path:
+                categories.setdefault(entry.category, []).append(entry.as_tuple())
+        return categories
+
+    def add(self, entry: TemplateEntry, save: bool = True) -> None:
+        """Add or replace an entry."""
+        self._ensure_loaded()
+        self._entries[entry.filename] = entry
+        if save:
+            self.save()
+
+    def remove(self, filename: str, save: bool = True) -> Optional[TemplateEntry]:
+        """Remove an entry by template file name."""
+        self._ensure_loaded()
+        entry = self._entries.pop(filename, None)
+        if save:
+            self.save()
+        return entry
+
+    def rename(self, old_filename: str, entry: TemplateEntry) -> None:
+        """Replace an entry with its renamed version."""
+        self._ensure_loaded()
+        old_entry = self._entries.pop(old_filename, None)
+        if old_entry is not None and not entry.content_hash:
+            entry.content_hash = old_entry.content_hash
+        self._entries[entry.filename] = entry
+        self.save()
+
+    def clear(self, save: bool = True) -> None:
+        """Remove all entries."""
+        self._loaded = True
+        self._entries = {}
+        if save:
+            self.save()
+
+    def make_entry(self, template_path: Path, image_path: Optional[Path]) -> TemplateEntry:
+        """Create an entry for a template, reading its file stats."""
+        if image_path is not None:
+            category, name, move_count = parse_image_stem(image_path.stem)
+        else:
+            category, _, name = template_path.stem.partition("_")
+            name, move_count = name or "None", 0
+        mtime, size = self._stat(template_path)
+        return TemplateEntry(
+            category=category,
+            name=name,
+            move_count=move_count,
+            template_path=str(template_path),
+            image_path=str(image_path) if image_path is not None else "",
+            mtime=mtime,
+            size=size,
+        )
+
+    def _entry_from_image(self, image: Path) -> TemplateEntry:
+        """Create an entry from a preview image path."""
+        category, name, _ = parse_image_stem(image.stem)
+        filename = f"{category}_{name}" if name != "None" else category
+        return self.make_entry(self.templates_dir / f"{filename}.hwp", image)
+
+    def _current_dir_state(self) -> Dict[str, int]:
+        """Get the modification times of the watched folders."""
+        return {
+            "templates": self._stat(self.templates_dir)[0],
+            "images": self._stat(self.images_dir)[0],
+        }
+
+    @staticmethod
+    def _stat(path: Path) -> Tuple[int, int]:
+        """Get ``(mtime_ns, size)`` of a path, or zeros if it is missing."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return 0, 0
+        return stat.st_mtime_ns, stat.st_size
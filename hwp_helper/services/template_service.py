@@ -1,82 +1,225 @@
 """Template management service."""
 
 import shutil
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from time import sleep
-from typing import Dict, List, Tuple, Iterator, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple, Iterator, Optional
 
-from hwpapi.core import App
+from .engine_pool import EnginePool
+from .template_catalog import TemplateCatalog, TemplateEntry
+from ..utils.com_utils import com_error
+from ..utils.file_utils import prettify_filename, hash_file
+from ..utils.hwp_reader import read_move_count
+from ..utils.preview_utils import save_preview
 
-from ..utils.file_utils import prettify_filename
-from ..utils.image_utils import crop_background
+if TYPE_CHECKING:
+    from hwpapi.core import App
+
+
+@dataclass
+class UpdateReport:
+    """Counts of what a template update did."""
+
+    skipped: int = 0
+    rendered: int = 0
+    removed: int = 0
+    failed: int = 0
+
+
+@dataclass
+class ChangeSet:
+    """Catalog entries changed by a template operation.
+    
+    ``renamed`` holds ``(old, new)`` pairs of entries replaced by a new
+    version, whether renamed or re-rendered.
+    """
+
+    added: List[TemplateEntry] = field(default_factory=list)
+    removed: List[TemplateEntry] = field(default_factory=list)
+    renamed: List[Tuple[TemplateEntry, TemplateEntry]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.renamed)
+
+    @classmethod
+    def between(cls, before: Dict[str, TemplateEntry],
+                after: Dict[str, TemplateEntry]) -> "ChangeSet":
+        """Compare two ``{filename: entry}`` snapshots of the catalog."""
+        changes = cls()
+        for filename, entry in before.items():
+            new_entry = after.get(filename)
+            if new_entry is None:
+                changes.removed.append(entry)
+            elif new_entry != entry:
+                changes.renamed.append((entry, new_entry))
+        changes.added = [entry for filename, entry in after.items() if filename not in before]
+        return changes
 
 
 class TemplateService:
-    """Service for managing HWP templates."""
+    """Service for managing HWP templates.
     
-    def __init__(self):
+    With HWP available, previews are rendered by exporting the template as
+    an image. ``embedded_previews`` uses the smaller thumbnail HWP stores in
+    the file instead, skipping the export; without HWP it is always used.
+    """
+    
+    def __init__(self, catalog: Optional[TemplateCatalog] = None,
+                 app_factory: Optional[Callable[[], "App"]] = None, workers: int = 1,
+                 embedded_previews: bool = False):
         self.templates_dir = Path("templates")
         self.images_dir = Path("images")
         self.temp_dir = Path("temp")
+        self.catalog = catalog or TemplateCatalog(
+            templates_dir=str(self.templates_dir), images_dir=str(self.images_dir)
+        )
+        self.app_factory = app_factory or self._create_render_app
+        self.workers = workers
+        self.embedded_previews = embedded_previews
+        self.last_report = UpdateReport()
+        self.last_changes = ChangeSet()
     
     def get_categories(self) -> Dict[str, List[Tuple[str, Path, str, int]]]:
-        """Get template categories from image files."""
-        if not self.images_dir.exists():
-            return {}
-        
-        images = list(self.images_dir.glob("*"))
-        categories = {}
-        
-        for image in images:
-            parts = image.stem.split("_")
-            if len(parts) == 1:
-                parts = [parts[0], "None", "0"]
-            
-            key, value, n = parts[0], parts[1], parts[2]
-            filename = f"{key}_{value}" if value != "None" else key
-            
-            components = categories.get(key, [])
-            components.append((value, image, filename, int(n)))
-            categories[key] = components
-        
-        return categories
+        """Get template categories from the template catalog."""
+        return self.catalog.get_categories()
     
-    def update_templates(self) -> Iterator[Tuple[int, int]]:
-        """Update all templates from templates folder."""
+    def update_templates(self, incremental: bool = False) -> Iterator[Tuple[int, int]]:
+        """Update templates from templates folder.
+        
+        In incremental mode only new or changed templates are rendered and
+        previews of removed templates are deleted. Rendering is spread over
+        ``workers`` hidden HWP instances and progress is reported as each
+        template finishes. The counts of the run are stored in ``last_report``
+        and the catalog changes in ``last_changes``.
+        """
+        report = UpdateReport()
+        self.last_report = report
+        self.last_changes = ChangeSet()
+        before = self._snapshot()
         
         # Clean up old files
-        if self.images_dir.exists():
+        if not incremental and self.images_dir.exists():
             shutil.rmtree(self.images_dir)
         if self.temp_dir.exists():
             shutil.rmtree(self.temp_dir)
         
         # Create directories
         self.temp_dir.mkdir()
-        self.images_dir.mkdir()
+        self.images_dir.mkdir(exist_ok=True)
         
         # Get all template files
-        if not self.templates_dir.exists():
-            return
+        hwp_files = []
+        if self.templates_dir.exists():
+            hwp_files = list(self.templates_dir.glob("*.hwp"))
         
-        hwp_files = list(self.templates_dir.glob("*.hwp"))
-        total_files = len(hwp_files)
+        if incremental:
+            pending = self._sync_catalog(hwp_files, report)
+        else:
+            self.catalog.clear(save=False)
+            pending = hwp_files
         
+        total_files = len(pending)
         if total_files == 0:
+            shutil.rmtree(self.temp_dir)
+            self.catalog.save()
+            self.last_changes = ChangeSet.between(before, self._snapshot())
             return
         
         # Process templates
-        app = App(new_app=True, is_visible=False)
+        pool = EnginePool(self.app_factory, self.workers)
+        results = pool.map_unordered(self._update_single_template, pending)
         try:
-            for i, hwp_file in enumerate(hwp_files):
-                self._update_single_template(app, hwp_file)
+            for i, (hwp_file, image_path, _) in enumerate(results):
+                self._record_template(hwp_file, image_path, report)
                 yield i, total_files
         finally:
-            app.quit()
+            results.close()
             if self.temp_dir.exists():
                 shutil.rmtree(self.temp_dir)
+            self.catalog.save()
+            self.last_changes = ChangeSet.between(before, self._snapshot())
+    
+    def _snapshot(self) -> Dict[str, TemplateEntry]:
+        """Copy of the catalog entries by file name."""
+        return {entry.filename: entry for entry in self.catalog.entries()}
+    
+    def _sync_catalog(self, hwp_files: List[Path], report: UpdateReport) -> List[Path]:
+        """Drop removed templates from the catalog and return those to render."""
+        entries = {entry.filename: entry for entry in self.catalog.entries()}
+        current = {hwp_file.stem for hwp_file in hwp_files}
+        for filename, entry in entries.items():
+            if filename not in current:
+                self._remove_preview(entry)
+                self.catalog.remove(filename, save=False)
+                report.removed += 1
+        
+        pending = []
+        for hwp_file in hwp_files:
+            entry = entries.get(hwp_file.stem)
+            if entry is not None and self._is_unchanged(hwp_file, entry):
+                report.skipped += 1
+                continue
+            if entry is not None:
+                self._remove_preview(entry)
+                self.catalog.remove(entry.filename, save=False)
+            pending.append(hwp_file)
+        return pending
     
-    def _update_single_template(self, app: App, hwp_path: Path) -> Optional[Path]:
-        """Update a single template file."""
+    def _is_unchanged(self, hwp_path: Path, entry: TemplateEntry) -> bool:
+        """Check whether a template matches its catalog entry."""
+        if not entry.image_path or not Path(entry.image_path).exists():
+            return False
+        
+        stat = hwp_path.stat()
+        if (stat.st_mtime_ns, stat.st_size) == (entry.mtime, entry.size):
+            return True
+        
+        # Touched but possibly not modified: compare content
+        if entry.content_hash and entry.content_hash == hash_file(hwp_path):
+            self.catalog.add(
+                replace(entry, mtime=stat.st_mtime_ns, size=stat.st_size), save=False
+            )
+            return True
+        return False
+    
+    def _record_template(self, hwp_path: Path, image_path: Optional[Path],
+                         report: UpdateReport) -> None:
+        """Store a freshly rendered template in the catalog."""
+        if image_path is None:
+            report.failed += 1
+            return
+        entry = self.catalog.make_entry(hwp_path, image_path)
+        entry.content_hash = hash_file(hwp_path)
+        self.catalog.add(entry, save=False)
+        report.rendered += 1
+    
+    @staticmethod
+    def _remove_preview(entry: TemplateEntry) -> None:
+        """Delete the preview image of a catalog entry."""
+        if entry.image_path:
+            Path(entry.image_path).unlink(missing_ok=True)
+    
+    @staticmethod
+    def _create_render_app() -> Optional["App"]:
+        """Create a hidden HWP instance for rendering templates.
+        
+        Returns ``None`` when HWP cannot be started, in which case templates
+        are updated from their embedded previews only.
+        """
+        try:
+            from hwpapi.core import App
+            
+            return App(new_app=True, is_visible=False)
+        except Exception as e:
+            print(f"HWP is not available, using embedded previews: {e}")
+            return None
+    
+    def _update_single_template(self, app: Optional["App"], hwp_path: Path) -> Optional[Path]:
+        """Update a single template file and return its preview image path."""
+        if app is None:
+            return self._update_single_template_headless(hwp_path)
+        
         try:
             app.open(hwp_path)
             app.actions.MoveDocEnd().run()
@@ -101,24 +244,51 @@ class TemplateService:
             app.save()
             app.api.SetMessageBoxMode(0xf0000)
             
+            # Use the preview HWP stored on save when asked to
+            final_image_path = self.images_dir / f"{hwp_path.stem}_{n}.png"
+            if self.embedded_previews and save_preview(hwp_path, final_image_path, crop=True):
+                return final_image_path
+            
             # Save as image
             app.save(temp_image_path)
             temp_png_path = self.temp_dir / f"{temp_image_path.stem}001.png"
             
             if temp_png_path.exists():
+                from ..utils.image_utils import crop_background
+                
                 cropped = crop_background(str(temp_png_path))
                 if cropped:
-                    final_image_path = self.images_dir / f"{hwp_path.stem}_{n}.png"
                     cropped.save(final_image_path)
+                    return final_image_path
             
-            return hwp_path
+            return None
             
+        except com_error:
+            # the pool replaces the engine before the next template
+            raise
         except Exception as e:
             print(f"Error updating template {hwp_path}: {e}")
             return None
     
-    def add_template(self, app: App, category: str, name: str) -> bool:
+    def _update_single_template_headless(self, hwp_path: Path) -> Optional[Path]:
+        """Update a template from its embedded preview without HWP.
+        
+        The move count is read from the document's paragraph records. The
+        file itself is left untouched, so unlike the HWP path no trailing
+        empty paragraph is added; the count is that of the file as saved,
+        as the HWP path stores it after adding one.
+        """
+        n = read_move_count(hwp_path)
+        if n is None:
+            return None
+        final_image_path = self.images_dir / f"{hwp_path.stem}_{n}.png"
+        if save_preview(hwp_path, final_image_path, crop=True):
+            return final_image_path
+        return None
+    
+    def add_template(self, app: "App", category: str, name: str) -> bool:
         """Add a new template from selected content."""
+        self.last_changes = ChangeSet()
         
         try:
             # Create temp directory
@@ -137,6 +307,9 @@ class TemplateService:
             
             # Move file to templates
             temp_path.rename(destination)
+            entry = self.catalog.make_entry(destination, None)
+            self.catalog.add(entry)
+            self.last_changes = ChangeSet(added=[entry])
             
             # Clean up
             if self.temp_dir.exists():
@@ -144,15 +317,22 @@ class TemplateService:
             
             return True
             
+        except com_error:
+            # left to ``HwpAppManager.run`` to reconnect and retry
+            raise
         except Exception as e:
             print(f"Error adding template: {e}")
             return False
     
     def delete_template(self, template_path: str, image_path: str) -> bool:
         """Delete a template and its associated image."""
+        self.last_changes = ChangeSet()
         try:
             Path(template_path).unlink(missing_ok=True)
             Path(image_path).unlink(missing_ok=True)
+            entry = self.catalog.remove(Path(template_path).stem)
+            if entry is not None:
+                self.last_changes = ChangeSet(removed=[entry])
             return True
         except Exception:
             return False
@@ -160,6 +340,7 @@ class TemplateService:
     def rename_template(self, old_template_path: str, old_image_path: str, 
                        new_category: str, new_name: str) -> bool:
         """Rename a template and its associated image."""
+        self.last_changes = ChangeSet()
         try:
             new_filename = prettify_filename(f"{new_category}_{new_name}")
             
@@ -175,8 +356,15 @@ class TemplateService:
                 return False
             
             # Rename files
+            old_entry = self.catalog.get(Path(old_template_path).stem)
             Path(old_template_path).rename(new_template_path)
             Path(old_image_path).rename(new_image_path)
+            new_entry = self.catalog.make_entry(new_template_path, new_image_path)
+            self.catalog.rename(Path(old_template_path).stem, new_entry)
+            if old_entry is not None:
+                self.last_changes = ChangeSet(renamed=[(old_entry, new_entry)])
+            else:
+                self.last_changes = ChangeSet(added=[new_entry])
             
             return True
             
@@ -1,10 +1,13 @@
 """UI components package."""
 
 from .dialogs import AddTemplateDialog, TemplateManagementDialog, UpdateTemplatesDialog
+from .diagnostics import DiagnosticsDialog
 from .font_manager import FontStyleManager
 from .navigation import NavigationBar
+from .paged_list import PagedList
 
 __all__ = [
     "AddTemplateDialog", "TemplateManagementDialog", "UpdateTemplatesDialog",
-    "FontStyleManager", "NavigationBar"
+    "DiagnosticsDialog",
+    "FontStyleManager", "NavigationBar", "PagedList"
 ]
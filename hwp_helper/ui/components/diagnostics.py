@@ -0,0 +1,105 @@
+"""Diagnostics dialog for HWP operation latencies, tracing and call recording."""
+
+import flet as ft
+from typing import Any, Dict
+
+from ...core.metrics import LatencyMetrics, PERCENTILES
+from ...core.recorder import CallRecorder
+from ...core.tracing import Tracer
+
+
+class DiagnosticsDialog:
+    """Dialog with per-operation latency percentiles, tracing, call recording and export buttons."""
+
+    def __init__(self, page: ft.Page, context: Dict[str, Any]):
+        self.page = page
+        self.config = context["config"]
+        self.metrics: LatencyMetrics = context["app_manager"].metrics
+        self.tracer: Tracer = context["app_manager"].tracer
+        self.recorder: CallRecorder = context["app_manager"].recorder
+
+    def show(self) -> None:
+        """Show the diagnostics dialog."""
+        self.status = ft.Text()
+        self.table = ft.DataTable(columns=[
+            ft.DataColumn(ft.Text("기능")),
+            ft.DataColumn(ft.Text("단계")),
+            ft.DataColumn(ft.Text("횟수"), numeric=True),
+            *[ft.DataColumn(ft.Text(f"p{p} ms"), numeric=True) for p in PERCENTILES],
+        ])
+        self._fill_table()
+
+        def on_toggle(e):
+            self.metrics.enabled = e.control.value
+            self.config.set("latency_metrics", e.control.value)
+
+        def on_toggle_tracing(e):
+            self.tracer.enabled = e.control.value
+            self.config.set("tracing", e.control.value)
+
+        def on_toggle_recording(e):
+            self.recorder.enabled = e.control.value
+            self.config.set("record_calls", e.control.value)
+
+        def on_refresh(e):
+            self._fill_table()
+            self.page.update()
+
+        def on_clear(e):
+            self.metrics.clear()
+            self.tracer.clear()
+            self.recorder.clear()
+            on_refresh(e)
+
+        def on_export(export):
+            def handler(e):
+                try:
+                    self.status.value = f"{export().resolve()} 에 저장했습니다."
+                except OSError as error:
+                    print(f"Error exporting diagnostics: {error}")
+                    self.status.value = f"저장하지 못했습니다: {error}"
+                self.page.update()
+            return handler
+
+        def on_close(e):
+            self.dialog.open = False
+            self.page.update()
+
+        self.dialog = ft.AlertDialog(
+            title=ft.Text("응답 시간 진단"),
+            content=ft.Column([
+                ft.Row([
+                    ft.Switch(label="측정하기", value=self.metrics.enabled, on_change=on_toggle),
+                    ft.Switch(label="트레이스 기록", value=self.tracer.enabled,
+                              on_change=on_toggle_tracing),
+                    ft.Switch(label="호출 기록", value=self.recorder.enabled,
+                              on_change=on_toggle_recording),
+                ]),
+                ft.Column([self.table], scroll=ft.ScrollMode.AUTO, height=400),
+                self.status,
+            ], tight=True),
+            actions=[
+                ft.TextButton("새로고침", on_click=on_refresh),
+                ft.TextButton("초기화", on_click=on_clear),
+                ft.TextButton("JSON 저장", on_click=on_export(self.metrics.export_json)),
+                ft.TextButton("CSV 저장", on_click=on_export(self.metrics.export_csv)),
+                ft.TextButton("트레이스 저장", on_click=on_export(self.tracer.export)),
+                ft.TextButton("호출 기록 저장", on_click=on_export(self.recorder.export)),
+                ft.TextButton("닫기", on_click=on_close),
+            ]
+        )
+        self.page.dialog = self.dialog
+        self.dialog.open = True
+        self.page.update()
+
+    def _fill_table(self) -> None:
+        """Show the current latency summary."""
+        self.table.rows = [
+            ft.DataRow(cells=[
+                ft.DataCell(ft.Text(row["operation"])),
+                ft.DataCell(ft.Text(row["phase"])),
+                ft.DataCell(ft.Text(str(row["count"]))),
+                *[ft.DataCell(ft.Text(f"{row[f'p{p}_ms']:.1f}")) for p in PERCENTILES],
+            ])
+            for row in self.metrics.summary()
+        ]
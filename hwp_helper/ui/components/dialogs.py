@@ -4,6 +4,7 @@ import flet as ft
 from pathlib import Path
 from typing import Dict, Any, Optional, Callable
 
+from .paged_list import PagedList
 from ...services.template_service import TemplateService
 from ...utils.file_utils import prettify_filename
 
@@ -17,7 +18,7 @@ class AddTemplateDialog:
         self.context = context
         self.app_manager = context["app_manager"]
         self.config = context["config"]
-        self.template_service = TemplateService()
+        self.template_service = context["template_service"]
         self.on_complete = on_complete
         
         self.category_field = ft.TextField(label="구분")
@@ -30,12 +31,16 @@ class AddTemplateDialog:
 
     def show(self) -> None:
         """Show the add template dialog."""
-        def on_add(e):
-            if self._add_template():
+        def on_added(future):
+            if future.result():
                 self.dialog.open = False
                 self.page.update()
                 if self.on_complete:
-                    self.on_complete()
+                    self.on_complete(self.template_service.last_changes)
+
+        def on_add(e):
+            future = self.app_manager.executor.submit(self._add_template)
+            future.add_done_callback(on_added)
 
         def on_cancel(e):
             self.dialog.open = False
@@ -59,18 +64,19 @@ class AddTemplateDialog:
     def _add_template(self) -> bool:
         """Add the template."""
         try:
-            app = self.app_manager.get_or_create_app()
             category = self.category_field.value
             name = self.name_field.value
             
             if not category or not name:
                 return False
             
-            success = self.template_service.add_template(app, category, name)
+            success = self.app_manager.run(
+                lambda app: self.template_service.add_template(app, category, name),
+                foreground=False, name="add_template"
+            )
             if success:
                 # Save last category
                 self.config.set("last_category", category)
-                self.config.save_config()
             
             return success
             
@@ -80,13 +86,18 @@ class AddTemplateDialog:
 
 
 class TemplateManagementDialog:
-    """Dialog for managing templates (rename/delete)."""
-
-    def __init__(self, page: ft.Page, categories: Dict, 
+    """Dialog for managing templates (rename/delete).
+    
+    Templates are listed a page at a time, so the dialog stays small for
+    large libraries.
+    """
+    
+    PAGE_SIZE = 20
+
+    def __init__(self, page: ft.Page, template_service: TemplateService,
                  on_refresh: Optional[Callable] = None):
         self.page = page
-        self.categories = categories
-        self.template_service = TemplateService()
+        self.template_service = template_service
         self.on_refresh = on_refresh
 
     def show(self) -> None:
@@ -95,7 +106,7 @@ class TemplateManagementDialog:
             def confirm_delete(e):
                 self.template_service.delete_template(template_path, image_path)
                 if self.on_refresh:
-                    self.on_refresh()
+                    self.on_refresh(self.template_service.last_changes)
                 self.dialog.open = False
                 self.page.update()
             return confirm_delete
@@ -105,23 +116,26 @@ class TemplateManagementDialog:
                 self._show_rename_dialog(template_path, image_path)
             return show_rename_dialog
 
-        controls = []
-        for key, value in self.categories.items():
-            for text, image_path, filename, n in value:
-                template_path = f"templates/{filename}.hwp"
-                controls.append(
-                    ft.Row([
-                        ft.Text(text),
-                        ft.IconButton(
-                            icon=ft.Icons.EDIT,
-                            on_click=rename_template(template_path, str(image_path))
-                        ),
-                        ft.IconButton(
-                            icon=ft.Icons.DELETE,
-                            on_click=delete_template(template_path, str(image_path))
-                        )
-                    ])
+        def build_row(template) -> ft.Row:
+            text, image_path, filename, n = template
+            template_path = f"templates/{filename}.hwp"
+            return ft.Row([
+                ft.Text(text),
+                ft.IconButton(
+                    icon=ft.Icons.EDIT,
+                    on_click=rename_template(template_path, str(image_path))
+                ),
+                ft.IconButton(
+                    icon=ft.Icons.DELETE,
+                    on_click=delete_template(template_path, str(image_path))
                 )
+            ])
+
+        templates = [
+            template
+            for value in self.template_service.get_categories().values()
+            for template in value
+        ]
 
         def on_close(e):
             self.dialog.open = False
@@ -129,7 +143,7 @@ class TemplateManagementDialog:
 
         self.dialog = ft.AlertDialog(
             title=ft.Text("탬플릿 관리"),
-            content=ft.Column(controls, scroll=ft.ScrollMode.AUTO),
+            content=PagedList(templates, build_row, self.PAGE_SIZE, scroll=ft.ScrollMode.AUTO),
             actions=[ft.TextButton("닫기", on_click=on_close)]
         )
         self.page.dialog = self.dialog
@@ -156,7 +170,7 @@ class TemplateManagementDialog:
                 self.dialog.open = False
                 self.page.update()
                 if self.on_refresh:
-                    self.on_refresh()
+                    self.on_refresh(self.template_service.last_changes)
 
         def on_cancel(e):
             rename_dialog.open = False
@@ -178,14 +192,16 @@ class TemplateManagementDialog:
 class UpdateTemplatesDialog:
     """Dialog for updating all templates."""
 
-    def __init__(self, page: ft.Page, on_complete: Optional[Callable] = None):
+    def __init__(self, page: ft.Page, template_service: TemplateService,
+                 on_complete: Optional[Callable] = None):
         self.page = page
-        self.template_service = TemplateService()
+        self.template_service = template_service
         self.on_complete = on_complete
 
     def show(self) -> None:
         """Show the update templates dialog."""
         self.progress_bar = ft.ProgressBar(width=400)
+        self.incremental_check = ft.Checkbox(label="바뀐 파일만 업데이트", value=True)
         
         def start_update(e):
             self.dialog.content = ft.Column([
@@ -196,17 +212,25 @@ class UpdateTemplatesDialog:
             
             # Run the update process
             try:
-                for i, n in self.template_service.update_templates():
+                updates = self.template_service.update_templates(
+                    incremental=self.incremental_check.value
+                )
+                for i, n in updates:
                     progress = i / (n - 1) if n > 1 else 1.0
                     self.progress_bar.value = progress
                     self.page.update()
             except Exception as e:
                 print(f"Error updating templates: {e}")
             
-            self.dialog.open = False
+            report = self.template_service.last_report
+            self.dialog.content = ft.Text(
+                f"변환 {report.rendered}개, 건너뜀 {report.skipped}개, "
+                f"삭제 {report.removed}개, 실패 {report.failed}개"
+            )
+            self.dialog.actions = [ft.TextButton("닫기", on_click=on_cancel)]
             self.page.update()
             if self.on_complete:
-                self.on_complete()
+                self.on_complete(self.template_service.last_changes)
 
         def on_cancel(e):
             self.dialog.open = False
@@ -214,7 +238,10 @@ class UpdateTemplatesDialog:
 
         self.dialog = ft.AlertDialog(
             title=ft.Text("탬플릿 업데이트"),
-            content=ft.Text("templates 폴더의 한글 파일들을 탬플릿으로 변환하시겠습니까?"),
+            content=ft.Column([
+                ft.Text("templates 폴더의 한글 파일들을 탬플릿으로 변환하시겠습니까?"),
+                self.incremental_check
+            ]),
             actions=[
                 ft.TextButton("시작", on_click=start_update),
                 ft.TextButton("취소", on_click=on_cancel)
@@ -2,26 +2,33 @@
 
 import flet as ft
 from uuid import uuid1
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-from hwpapi.classes import CharShape, ParaShape
+from ...services.style_registry import SavedStyle, StyleRegistry
+from ...services.style_service import StyleService
 
 
 class FontStyleManager(ft.Container):
-    """A Flet component for managing font styles."""
+    """A Flet component for managing font styles.
+    
+    Saved styles are parsed into a ``StyleRegistry`` the first time the
+    panel is opened. Adding or deleting a style then adds or removes only
+    that style's row.
+    """
 
     def __init__(self, context: Dict[str, Any], **kwargs):
         super().__init__(**kwargs)
         self.context = context
         self.app_manager = context["app_manager"]
+        self.executor = self.app_manager.executor
+        self.style_service = StyleService(self.app_manager)
         self.config = context["config"]
         
-        self.font_styles = self.config.get("font_styles", {})
+        self.registry: Optional[StyleRegistry] = None
         self.font_style_controls = ft.Column()
+        self._rows: Dict[str, ft.Row] = {}
         
-        self._refresh_font_styles()
-        
-        self.content = ft.ExpansionPanelList([
+        self.content = ft.ExpansionPanelList(on_change=self._on_expand, controls=[
             ft.ExpansionPanel(
                 header=ft.ListTile(title=ft.Text("글자서식")),
                 content=ft.Column([
@@ -31,55 +38,81 @@ class FontStyleManager(ft.Container):
             )
         ])
 
-    def _refresh_font_styles(self) -> None:
-        """Refresh the font styles display."""
-        self.font_style_controls.controls.clear()
-        
-        for idx, font_style in self.font_styles.items():
-            charshape = CharShape().fromdict(font_style[0])
-            parashape = ParaShape().fromdict(font_style[1])
-            self.font_style_controls.controls.append(
-                self._create_font_style_button(idx, charshape, parashape)
-            )
+    def _on_expand(self, e) -> None:
+        """Build the saved style rows the first time the panel is opened."""
+        if self.registry is None:
+            self._load_styles()
+            self.update()
+
+    def _load_styles(self) -> None:
+        """Parse the saved styles and create their rows."""
+        self.registry = StyleRegistry(self.config.get("font_styles", {}))
+        self._rows = {
+            style.style_id: self._create_font_style_button(style)
+            for style in self.registry
+        }
+        self.font_style_controls.controls = list(self._rows.values())
 
     def _add_style(self, e) -> None:
         """Add current font style to saved styles."""
-        app = self.app_manager.get_or_create_app()
-        charshape, parashape = app.get_charshape(), app.get_parashape()
+        self.executor.submit(self._save_current_style)
+
+    def _save_current_style(self) -> None:
+        """Read the current shapes from HWP and save them as a style."""
+        char_dict, para_dict = self.app_manager.run(
+            lambda app: (app.get_charshape().todict(), app.get_parashape().todict()),
+            foreground=False, name="save_style"
+        )
         
-        idx = str(uuid1())
-        self.font_styles[idx] = (charshape.todict(), parashape.todict())
-        self.config.set("font_styles", self.font_styles)
+        if self.registry is None:
+            self._load_styles()
+        style = self.registry.add(str(uuid1()), char_dict, para_dict)
+        self._save_styles()
         
-        self._refresh_font_styles()
-        self.update()
+        row = self._rows[style.style_id] = self._create_font_style_button(style)
+        self.font_style_controls.controls.append(row)
+        self._update_rows()
 
-    def _create_font_style_button(self, idx: str, charshape: CharShape, 
-                                 parashape: ParaShape) -> ft.Row:
+    def _delete_style(self, style_id: str) -> None:
+        """Delete a saved style and its row."""
+        self.registry.remove(style_id)
+        self._save_styles()
+        
+        row = self._rows.pop(style_id, None)
+        if row is not None:
+            self.font_style_controls.controls.remove(row)
+        self._update_rows()
+
+    def _save_styles(self) -> None:
+        """Store the saved styles in the configuration."""
+        self.config.set("font_styles", self.registry.to_config())
+
+    def _update_rows(self) -> None:
+        """Send the changed rows to the page if the panel is shown."""
+        if self.font_style_controls.page:
+            self.font_style_controls.update()
+
+    def _create_font_style_button(self, style: SavedStyle) -> ft.Row:
         """Create a button row for a font style."""
+        char_dict, para_dict = style.char_dict, style.para_dict
+        apply_style = self.style_service.apply_style
+
         def apply_char(e):
-            app = self.app_manager.ensure_app_ready()
-            app.set_charshape(charshape)
+            self.executor.submit(apply_style, charshape=char_dict)
 
         def apply_para(e):
-            app = self.app_manager.ensure_app_ready()
-            app.set_parashape(parashape)
+            self.executor.submit(apply_style, parashape=para_dict)
 
         def apply_both(e):
-            app = self.app_manager.ensure_app_ready()
-            app.set_charshape(charshape)
-            app.set_parashape(parashape)
+            self.executor.submit(apply_style, char_dict, para_dict)
 
         def delete_style(e):
-            del self.font_styles[idx]
-            self.config.set("font_styles", self.font_styles)
-            self._refresh_font_styles()
-            self.update()
+            self._delete_style(style.style_id)
 
         return ft.Row([
             ft.ElevatedButton(content=ft.Text("둘다적용"), on_click=apply_both),
             ft.ElevatedButton(content=ft.Text("글자적용"), on_click=apply_char),
             ft.ElevatedButton(content=ft.Text("문단적용"), on_click=apply_para),
             ft.ElevatedButton(content=ft.Text("삭제하기"), on_click=delete_style),
-            ft.Text(f"{charshape.hangul_font} {charshape.fontsize}pt")
+            ft.Text(style.label)
         ])
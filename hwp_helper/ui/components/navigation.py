@@ -3,6 +3,16 @@
 import flet as ft
 from typing import Dict, Any
 
+from ...core.app_manager import (
+    STAGE_CONNECTED, STAGE_DISCONNECTED, STAGE_FAILED
+)
+
+STATUS_COLORS = {
+    STAGE_CONNECTED: ft.Colors.GREEN,
+    STAGE_DISCONNECTED: ft.Colors.GREY,
+    STAGE_FAILED: ft.Colors.RED,
+}
+
 
 class NavigationBar(ft.Container):
     """Navigation bar with buttons for various actions."""
@@ -12,8 +22,11 @@ class NavigationBar(ft.Container):
         self.context = context
         self.helper = context["helper"]
         self._page = context["page"]
+        self.executor = context["app_manager"].executor
         
+        self.status_icon = ft.Icon(ft.Icons.CIRCLE, size=12)
         self.content = ft.Row([
+            self.status_icon,
             ft.IconButton(
                 icon=ft.Icons.VISIBILITY,
                 on_click=self._show_hwp,
@@ -34,19 +47,38 @@ class NavigationBar(ft.Container):
                 on_click=self._toggle_always_on_top,
                 tooltip="항상 위"
             ),
+            ft.IconButton(
+                icon=ft.Icons.SPEED,
+                on_click=self._show_diagnostics,
+                tooltip="응답 시간 진단"
+            ),
         ])
+        context["app_manager"].add_status_listener(self._on_status)
+
+    def _on_status(self, stage: str, message: str) -> None:
+        """Show the HWP connection status."""
+        self.status_icon.color = STATUS_COLORS.get(stage, ft.Colors.AMBER)
+        self.status_icon.tooltip = message or "한글 연결 안 됨"
+        if self.status_icon.page:
+            self.status_icon.update()
 
     def _show_hwp(self, e) -> None:
         """Show the HWP application window."""
-        self.helper.app_manager.bring_to_foreground()
+        self.executor.submit(self.helper.app_manager.run, lambda app: None,
+                             name="show_hwp")
 
     def _set_fullscreen(self, e) -> None:
         """Set the application to fullscreen."""
-        self.helper.set_fullscreen()
+        self.executor.submit(self.helper.set_fullscreen)
 
     def _set_halfscreen(self, e) -> None:
         """Set the application to half-screen."""
-        self.helper.set_halfscreen()
+        self.executor.submit(self.helper.set_halfscreen)
+
+    def _show_diagnostics(self, e) -> None:
+        """Show operation latency diagnostics."""
+        from .diagnostics import DiagnosticsDialog
+        DiagnosticsDialog(self._page, self.context).show()
 
     def _toggle_always_on_top(self, e) -> None:
         """Toggle the 'always on top' state of the window."""
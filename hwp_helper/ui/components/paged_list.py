@@ -0,0 +1,67 @@
+"""Paged list component for long lists of controls."""
+
+import flet as ft
+from typing import Any, Callable, Sequence
+
+
+class PagedList(ft.Column):
+    """Shows a long list one page at a time.
+
+    Controls are only created for the items of the current page, so the
+    control tree and each update stay the same size however many items
+    there are.
+    """
+
+    def __init__(self, items: Sequence[Any], build_item: Callable[[Any], ft.Control],
+                 page_size: int = 50, **kwargs):
+        super().__init__(**kwargs)
+        self.items = items
+        self.build_item = build_item
+        self.page_size = page_size
+        self.page_index = 0
+
+        self._item_column = ft.Column()
+        self._label = ft.Text()
+        self._prev_button = ft.IconButton(
+            icon=ft.Icons.CHEVRON_LEFT,
+            on_click=lambda e: self.show_page(self.page_index - 1)
+        )
+        self._next_button = ft.IconButton(
+            icon=ft.Icons.CHEVRON_RIGHT,
+            on_click=lambda e: self.show_page(self.page_index + 1)
+        )
+        self._pager = ft.Row([self._prev_button, self._label, self._next_button])
+        self.controls = [self._item_column, self._pager]
+        self._render()
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages."""
+        return max(1, -(-len(self.items) // self.page_size))
+
+    def show_page(self, index: int) -> None:
+        """Show the page at ``index``."""
+        self.page_index = min(max(index, 0), self.page_count - 1)
+        self._render()
+        self._update()
+
+    def set_items(self, items: Sequence[Any]) -> None:
+        """Replace the items, staying on the current page if it still exists."""
+        self.items = items
+        self.show_page(self.page_index)
+
+    def _render(self) -> None:
+        """Create the controls of the current page."""
+        start = self.page_index * self.page_size
+        self._item_column.controls = [
+            self.build_item(item) for item in self.items[start:start + self.page_size]
+        ]
+        self._label.value = f"{self.page_index + 1} / {self.page_count}"
+        self._prev_button.disabled = self.page_index == 0
+        self._next_button.disabled = self.page_index >= self.page_count - 1
+        self._pager.visible = self.page_count > 1
+
+    def _update(self) -> None:
+        """Send the change to the page if the list is shown."""
+        if self.page:
+            self.update()
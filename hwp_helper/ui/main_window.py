@@ -1,24 +1,58 @@
 """Main application window."""
 
+import threading
 import flet as ft
 from typing import Dict, Any
 
 from .components.navigation import NavigationBar
-from .pages.features import FeaturesPage
-from .pages.templates import TemplatesPage
-from ..utils.window_utils import get_screen_size
 from ..utils.file_utils import get_path
 
 
 class MainWindow:
-    """Main application window manager."""
+    """Main application window manager.
+    
+    Pages are built the first time they are shown and cached afterwards.
+    Once the features page is on screen the templates page is built in the
+    background so switching to it later is instant.
+    """
 
-    def __init__(self, helper):
+    def __init__(self, helper, prebuild_pages: bool = True):
         self.helper = helper
         self.page = helper.page
         self.context = helper.get_context()
+        self._pages: Dict[str, ft.Control] = {}
+        self._pages_lock = threading.Lock()
         self._setup_window()
         self._create_ui()
+        if prebuild_pages:
+            self.page.run_thread(self._get_page, "templates")
+
+    @property
+    def features_page(self) -> ft.Control:
+        """The features page, built on first access."""
+        return self._get_page("features")
+
+    @property
+    def templates_page(self) -> ft.Control:
+        """The templates page, built on first access."""
+        return self._get_page("templates")
+
+    def _get_page(self, name: str) -> ft.Control:
+        """Get a page, building it the first time it is needed."""
+        with self._pages_lock:
+            if name not in self._pages:
+                self._pages[name] = self._build_page(name)
+            return self._pages[name]
+
+    def _build_page(self, name: str) -> ft.Control:
+        """Create a page by name."""
+        if name == "features":
+            from .pages.features import FeaturesPage
+            return FeaturesPage(self.context)
+        if name == "templates":
+            from .pages.templates import TemplatesPage
+            return TemplatesPage(self.context)
+        raise ValueError(f"Unknown page: {name}")
 
     def _setup_window(self) -> None:
         """Setup window properties."""
@@ -28,14 +62,19 @@ class MainWindow:
             self.page.window_icon = icon_path
         
         # Set initial window position and size
-        x, y, width, height = get_screen_size()
-        app_width = self.helper.config.get("app_width", 674)
-        app_x, app_y = x + width - app_width, y
-        
-        self.page.window_left = app_x
-        self.page.window_top = app_y
-        self.page.window_width = app_width
-        self.page.window_height = height
+        try:
+            from ..utils.window_utils import get_screen_size
+        except ImportError:  # pywin32 is only installed on Windows
+            get_screen_size = None
+        if get_screen_size is not None:
+            x, y, width, height = get_screen_size()
+            app_width = self.helper.config.get("app_width", 674)
+            app_x, app_y = x + width - app_width, y
+            
+            self.page.window_left = app_x
+            self.page.window_top = app_y
+            self.page.window_width = app_width
+            self.page.window_height = height
         
         # Set window event handlers
         self.page.on_window_event = self._on_window_event
@@ -49,14 +88,8 @@ class MainWindow:
         # Create navigation bar
         nav_bar = NavigationBar(self.context)
         
-        # Create pages
-        features_page = FeaturesPage(self.context)
-        templates_page = TemplatesPage(self.context)
-        
-        # For now, just show features page (simplified navigation)
-        self.current_page = features_page
-        self.features_page = features_page
-        self.templates_page = templates_page
+        # Only the features page is needed for the first frame
+        self.current_page = self.features_page
         
         # Create navigation buttons
         nav_buttons = ft.Row([
@@ -6,6 +6,8 @@ from typing import Dict, Any, List, Tuple, Callable
 from ..components.font_manager import FontStyleManager
 from ...services.hwp_operations import HwpOperationService
 from ...callbacks.hwp_callbacks import color_double_space, uncolor_double_space, process_font
+from ...services.review_rules import ReviewReport
+from ...core.tracing import CAT_UI
 
 
 class FeaturesPage(ft.Container):
@@ -57,12 +59,17 @@ class FeaturesPage(ft.Container):
             grid.controls.append(
                 ft.ElevatedButton(
                     content=ft.Text(name),
-                    on_click=lambda e, cmd=command: cmd(),
+                    on_click=lambda e, name=name, cmd=command: self._run_feature(name, cmd),
                     tooltip=tooltip_text,
                 )
             )
         return section
 
+    def _run_feature(self, name: str, command: Callable) -> None:
+        """Run a feature on the COM executor, traced from the click."""
+        with self.context["app_manager"].tracer.span(name.split("\n")[0], CAT_UI):
+            self.hwp_ops.submit(command)
+
     def _get_char_features(self) -> List[Tuple[str, Callable, str, str]]:
         """Get character formatting features."""
         return [
@@ -162,12 +169,21 @@ class FeaturesPage(ft.Container):
 
     def _color_double_space(self) -> None:
         """Color double spaces in the document."""
-        color_double_space(self.context["app_manager"])
+        self._show_review(color_double_space(self.context["app_manager"]))
 
     def _uncolor_double_space(self) -> None:
         """Remove color from double spaces."""
-        uncolor_double_space(self.context["app_manager"])
+        self._show_review(uncolor_double_space(self.context["app_manager"]))
 
     def _process_font(self) -> None:
         """Process font formatting."""
-        process_font(self.context["app_manager"])
+        self._show_review(process_font(self.context["app_manager"]))
+
+    def _show_review(self, report: ReviewReport) -> None:
+        """Report rule hits and the passes a review run took."""
+        skipped = sum(rule.skipped for rule in report.rules)
+        message = (f"규칙 {len(report.rules)}개를 {report.passes}회 탐색으로 적용했습니다 "
+                   f"({report.elapsed:.1f}초, 변경된 규칙 {report.changed}개, 생략 {skipped}개).")
+        if report.saved:
+            message += f" 약 {report.saved:.1f}초 절약했습니다."
+        self.page.open(ft.SnackBar(ft.Text(message)))
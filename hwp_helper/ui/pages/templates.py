@@ -1,24 +1,39 @@
 """Templates page for managing and using HWP templates."""
 
+import asyncio
 import flet as ft
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Set
 
 from ..components.dialogs import AddTemplateDialog, TemplateManagementDialog
-from ...services.template_service import TemplateService
+from ..components.paged_list import PagedList
 from ...services.hwp_operations import HwpOperationService
+from ...services.template_service import ChangeSet
+from ...core.tracing import CAT_UI
+
+# Template buttons shown at once in an expanded category
+PAGE_SIZE = 50
 
 
 class TemplatesPage(ft.Container):
-    """Page for template management and usage."""
+    """Page for template management and usage.
+    
+    Only category headers are created up front. A category's buttons are
+    created when its panel is expanded, a page at a time, and released
+    again when it is collapsed.
+    """
 
     def __init__(self, context: Dict[str, Any]):
         super().__init__()
         self.context = context
         self._page = context["page"]
-        self.template_service = TemplateService()
+        self.template_service = context["template_service"]
         self.hwp_ops = HwpOperationService(context["app_manager"])
         
         self.template_content = ft.Column(scroll=ft.ScrollMode.AUTO)
+        self._categories: Dict[str, list] = {}
+        self._expanded: Set[str] = set()
+        self._panels: Dict[str, ft.ExpansionPanel] = {}
+        self._panel_list: Optional[ft.ExpansionPanelList] = None
         self._populate_templates()
         
         self.content = ft.Column([
@@ -38,38 +53,66 @@ class TemplatesPage(ft.Container):
     def _populate_templates(self) -> None:
         """Populate the templates display."""
         self.template_content.controls.clear()
-        categories = self.template_service.get_categories()
-        panels = []
+        self._categories = self.template_service.get_categories()
+        self._expanded &= set(self._categories)
+        self._panels = {key: self._create_panel(key) for key in self._categories}
         
-        for key, value in categories.items():
-            buttons = []
-            for text, image_path, filename, n in value:
-                template_path = f"templates/{filename}.hwp"
-                buttons.append(
-                    ft.ElevatedButton(
-                        content=ft.Text(text),
-                        on_click=self._create_template_handler(template_path, n),
-                    )
-                )
-            
-            panels.append(
-                ft.ExpansionPanel(
-                    header=ft.ListTile(title=ft.Text(key)),
-                    content=ft.Column(buttons)
-                )
+        if self._panels:
+            self._panel_list = ft.ExpansionPanelList(
+                list(self._panels.values()), on_change=self._on_panel_change
             )
-        
-        if panels:
-            self.template_content.controls.append(ft.ExpansionPanelList(panels))
+            self.template_content.controls.append(self._panel_list)
         else:
+            self._panel_list = None
             self.template_content.controls.append(
                 ft.Text("템플릿이 없습니다. 템플릿을 추가해주세요.")
             )
 
+    def _create_panel(self, key: str) -> ft.ExpansionPanel:
+        """Create the panel of a category, with buttons only if it is expanded."""
+        expanded = key in self._expanded
+        return ft.ExpansionPanel(
+            header=ft.ListTile(title=ft.Text(key)),
+            content=self._create_category_list(key) if expanded else ft.Column(),
+            expanded=expanded,
+            data=key
+        )
+
+    def _create_category_list(self, key: str) -> PagedList:
+        """Create the paged buttons of a category."""
+        return PagedList(
+            self._categories.get(key, []), self._create_template_button, PAGE_SIZE
+        )
+
+    def _on_panel_change(self, e) -> None:
+        """Create or release a category's buttons as its panel toggles."""
+        panel = e.control.controls[int(e.data)]
+        key = panel.data
+        if key in self._expanded:
+            self._expanded.discard(key)
+            panel.content = ft.Column()
+        else:
+            self._expanded.add(key)
+            panel.content = self._create_category_list(key)
+        panel.expanded = key in self._expanded
+        panel.update()
+
+    def _create_template_button(self, template) -> ft.ElevatedButton:
+        """Create the insert button of a template."""
+        text, image_path, filename, n = template
+        template_path = f"templates/{filename}.hwp"
+        return ft.ElevatedButton(
+            content=ft.Text(text),
+            on_click=self._create_template_handler(template_path, n),
+        )
+
     def _create_template_handler(self, template_path: str, move_count: int):
         """Create a handler function for template insertion."""
-        def handler(e):
-            self.hwp_ops.insert_template(template_path, move_count)
+        async def handler(e):
+            tracer = self.context["app_manager"].tracer
+            with tracer.span("insert template", CAT_UI, path=template_path):
+                future = self.hwp_ops.submit(self.hwp_ops.insert_template, template_path, move_count)
+            await asyncio.wrap_future(future)
         return handler
 
     def _add_template(self, e) -> None:
@@ -83,15 +126,65 @@ class TemplatesPage(ft.Container):
 
     def _manage_templates(self, e) -> None:
         """Show template management dialog."""
-        categories = self.template_service.get_categories()
         dialog = TemplateManagementDialog(
             self._page,
-            categories,
+            self.template_service,
             on_refresh=self.refresh
         )
         dialog.show()
 
-    def refresh(self) -> None:
-        """Refresh the templates display."""
-        self._populate_templates()
-        self.update()
+    def refresh(self, changes: Optional[ChangeSet] = None) -> None:
+        """Refresh the templates display.
+        
+        With a change set only the panels of the affected categories are
+        patched; without one the whole display is rebuilt. Expanded panels
+        stay expanded either way.
+        """
+        if changes is None or not self._apply_changes(changes):
+            self._populate_templates()
+            self.update()
+
+    def _apply_changes(self, changes: ChangeSet) -> bool:
+        """Patch the panels touched by ``changes``.
+        
+        Returns ``False`` when the display has to be rebuilt instead because
+        the first category was added or the last one removed.
+        """
+        touched = set()
+        for entry in changes.removed + [old for old, _ in changes.renamed]:
+            items = self._categories.get(entry.category, [])
+            filename = entry.filename
+            for i, template in enumerate(items):
+                if template[2] == filename:
+                    del items[i]
+                    touched.add(entry.category)
+                    break
+        for entry in changes.added + [new for _, new in changes.renamed]:
+            if entry.image_path:
+                self._categories.setdefault(entry.category, []).append(entry.as_tuple())
+                touched.add(entry.category)
+        
+        if not touched:
+            return True
+        if self._panel_list is None or not any(self._categories.values()):
+            return False
+        
+        panels_changed = False
+        for key in touched:
+            panel = self._panels.get(key)
+            if not self._categories.get(key):
+                self._categories.pop(key, None)
+                self._expanded.discard(key)
+                if panel is not None:
+                    self._panel_list.controls.remove(self._panels.pop(key))
+                    panels_changed = True
+            elif panel is None:
+                self._panels[key] = self._create_panel(key)
+                self._panel_list.controls.append(self._panels[key])
+                panels_changed = True
+            elif key in self._expanded:
+                panel.content.set_items(self._categories[key])
+        
+        if panels_changed and self._panel_list.page:
+            self._panel_list.update()
+        return True
@@ -1,14 +1,37 @@
-"""Utility modules for HWP Helper."""
-
-from .file_utils import prettify_filename, get_path
-from .image_utils import crop_background
-from .window_utils import (
-    set_forewindow, show_window, get_screen_size,
-    get_window_position, set_window_position
-)
-
-__all__ = [
-    "prettify_filename", "get_path", "crop_background",
-    "set_forewindow", "show_window", "get_screen_size",
-    "get_window_position", "set_window_position"
-]
+"""Utility modules for HWP Helper.
+
+Utilities are imported from their modules on first access, so using one of
+them does not load the dependencies (PIL, NumPy, pywin32) of the others.
+"""
+
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "prettify_filename": "file_utils",
+    "get_path": "file_utils",
+    "hash_file": "file_utils",
+    "crop_background": "image_utils",
+    "crop_image": "image_utils",
+    "extract_preview": "preview_utils",
+    "save_preview": "preview_utils",
+    "HwpDocument": "hwp_reader",
+    "HwpFormatError": "hwp_reader",
+    "get_hwnd": "window_utils",
+    "is_foreground_window": "window_utils",
+    "set_forewindow": "window_utils",
+    "show_window": "window_utils",
+    "get_screen_size": "window_utils",
+    "get_window_position": "window_utils",
+    "set_window_position": "window_utils",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,31 @@
+"""COM threading utilities."""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    from pywintypes import com_error
+except ImportError:  # pywin32 is only installed on Windows
+    class com_error(Exception):
+        """Stand-in for ``pywintypes.com_error`` where pywin32 is missing."""
+
+
+@contextmanager
+def com_apartment() -> Iterator[None]:
+    """Initialise a COM apartment for the current thread.
+
+    COM objects such as the HWP automation object may only be used from the
+    thread that created them, and each thread has to initialise COM first.
+    On platforms without pywin32 this is a no-op.
+    """
+    try:
+        import pythoncom
+    except ImportError:
+        yield
+        return
+
+    pythoncom.CoInitialize()
+    try:
+        yield
+    finally:
+        pythoncom.CoUninitialize()
@@ -3,6 +3,7 @@
 import os
 import sys
 import re
+import hashlib
 from pathlib import Path
 from typing import Optional
 
@@ -26,3 +27,12 @@ def get_path(path: str) -> Optional[str]:
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     
     return os.path.join(base_dir, path)
+
+
+def hash_file(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Get the SHA-1 hex digest of a file's content."""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,259 @@
+"""Pure-Python reader for HWP 5.0 document metadata.
+
+HWP 5.0 files are OLE compound documents. ``DocInfo`` and each
+``BodyText/Section*`` stream hold a sequence of records, optionally
+raw-deflate compressed. Each record starts with a 32-bit header packing the
+tag id, nesting level and payload size. Records are parsed from
+``memoryview`` slices of the decompressed stream so payloads are never
+copied.
+"""
+
+import re
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from .ole import OleError, OleFile
+
+# Record tags (HWPTAG_BEGIN + n)
+TAG_ID_MAPPINGS = 0x10 + 1
+TAG_FACE_NAME = 0x10 + 3
+TAG_CHAR_SHAPE = 0x10 + 5
+TAG_PARA_HEADER = 0x10 + 50
+TAG_PARA_TEXT = 0x10 + 51
+TAG_PARA_CHAR_SHAPE = 0x10 + 52
+
+LANGUAGES = ("hangul", "latin", "hanja", "japanese", "other", "symbol", "user")
+
+# Control characters that take 8 WCHARs in PARA_TEXT; the others take one
+_WIDE_CONTROLS = frozenset(range(1, 10)) | {11, 12} | frozenset(range(14, 24))
+_TAB = 9
+_LINE_BREAK = 10
+
+_SECTION = re.compile(r"^BodyText/Section(\d+)$")
+
+
+class HwpFormatError(ValueError):
+    """Raised when a file cannot be read as an HWP 5.0 document."""
+
+
+@dataclass(frozen=True)
+class CharShapeInfo:
+    """Font-related part of a DocInfo char shape record."""
+
+    face_ids: Tuple[int, ...]
+    height: int
+    italic: bool
+    bold: bool
+
+
+def iter_records(data: Union[bytes, memoryview]) -> Iterator[Tuple[int, int, memoryview]]:
+    """Yield ``(tag, level, payload)`` for each record in a stream."""
+    view = memoryview(data)
+    offset, end = 0, len(view)
+    unpack = struct.Struct("<I").unpack_from
+    while offset + 4 <= end:
+        header = unpack(view, offset)[0]
+        offset += 4
+        size = header >> 20
+        if size == 0xFFF:
+            size = unpack(view, offset)[0]
+            offset += 4
+        yield header & 0x3FF, (header >> 10) & 0x3FF, view[offset:offset + size]
+        offset += size
+
+
+def decode_para_text(payload: memoryview) -> str:
+    """Decode a PARA_TEXT payload, dropping inline and extended controls."""
+    if len(payload) % 2:
+        payload = payload[:-1]
+    chars = payload.cast("H")
+    parts: List[str] = []
+    run_start = i = 0
+    n = len(chars)
+    while i < n:
+        code = chars[i]
+        if code >= 32:
+            i += 1
+            continue
+        if run_start < i:
+            parts.append(bytes(payload[run_start * 2:i * 2]).decode("utf-16-le", "replace"))
+        if code == _TAB:
+            parts.append("\t")
+        elif code == _LINE_BREAK:
+            parts.append("\n")
+        i += 8 if code in _WIDE_CONTROLS else 1
+        run_start = i
+    if run_start < n:
+        parts.append(bytes(payload[run_start * 2:n * 2]).decode("utf-16-le", "replace"))
+    return "".join(parts)
+
+
+class HwpDocument:
+    """Metadata of an HWP 5.0 document read without HWP."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        try:
+            self._ole = OleFile(self.path)
+            header = self._ole.read("FileHeader")
+        except (OSError, OleError, KeyError) as e:
+            raise HwpFormatError(f"Not an HWP 5.0 document: {self.path}") from e
+
+        if not header.startswith(b"HWP Document File"):
+            raise HwpFormatError(f"Not an HWP 5.0 document: {self.path}")
+        properties = struct.unpack_from("<I", header, 36)[0]
+        if properties & 0b110:
+            raise HwpFormatError(f"Encrypted or distribution document: {self.path}")
+        self.compressed = bool(properties & 1)
+
+        self._doc_info: Optional[bytes] = None
+        self._sections: Optional[List[bytes]] = None
+
+    def _stream(self, name: str) -> bytes:
+        """Read a record stream, decompressing it if needed."""
+        data = self._ole.read(name)
+        if self.compressed:
+            try:
+                data = zlib.decompress(data, -15)
+            except zlib.error as e:
+                raise HwpFormatError(f"Corrupt stream {name}: {e}") from e
+        return data
+
+    @property
+    def doc_info(self) -> bytes:
+        """Decompressed ``DocInfo`` stream."""
+        if self._doc_info is None:
+            self._doc_info = self._stream("DocInfo")
+        return self._doc_info
+
+    @property
+    def sections(self) -> List[bytes]:
+        """Decompressed ``BodyText/Section*`` streams in order."""
+        if self._sections is None:
+            names = []
+            for name in self._ole.listdir():
+                match = _SECTION.match(name)
+                if match:
+                    names.append((int(match.group(1)), name))
+            self._sections = [self._stream(name) for _, name in sorted(names)]
+        return self._sections
+
+    def body_records(self) -> Iterator[Tuple[int, int, memoryview]]:
+        """Yield the records of every body section."""
+        for section in self.sections:
+            yield from iter_records(section)
+
+    def paragraph_lengths(self) -> List[int]:
+        """Character counts of the top-level paragraphs, end mark included."""
+        return [
+            struct.unpack_from("<I", payload)[0] & 0x7FFFFFFF
+            for tag, level, payload in self.body_records()
+            if tag == TAG_PARA_HEADER and level == 0
+        ]
+
+    @property
+    def paragraph_count(self) -> int:
+        """Number of top-level paragraphs."""
+        return len(self.paragraph_lengths())
+
+    @property
+    def move_count(self) -> int:
+        """Paragraph index of the last paragraph of the document as saved.
+
+        This is the value HWP reports through ``GetPos`` after moving to the
+        end of the document, so inserting the file and moving this many
+        paragraphs ends on its last paragraph.
+        """
+        return max(self.paragraph_count - 1, 0)
+
+    def paragraphs(self) -> List[str]:
+        """Text of the top-level paragraphs."""
+        texts: List[str] = []
+        for tag, level, payload in self.body_records():
+            if tag == TAG_PARA_HEADER and level == 0:
+                texts.append("")
+            elif tag == TAG_PARA_TEXT and level == 1 and texts:
+                texts[-1] = decode_para_text(payload)
+        return texts
+
+    @property
+    def text(self) -> str:
+        """Text of the top-level paragraphs joined with newlines."""
+        return "\n".join(self.paragraphs())
+
+    def face_names(self) -> Dict[str, List[str]]:
+        """Face names declared in ``DocInfo`` per language."""
+        counts: List[int] = []
+        names: List[str] = []
+        for tag, _, payload in iter_records(self.doc_info):
+            if tag == TAG_ID_MAPPINGS:
+                counts = list(struct.unpack_from("<7i", payload, 4))
+            elif tag == TAG_FACE_NAME:
+                length = struct.unpack_from("<H", payload, 1)[0]
+                names.append(bytes(payload[3:3 + length * 2]).decode("utf-16-le", "replace"))
+
+        faces: Dict[str, List[str]] = {}
+        start = 0
+        for language, count in zip(LANGUAGES, counts or [len(names)]):
+            faces[language] = names[start:start + count]
+            start += count
+        return faces
+
+    @property
+    def fonts(self) -> List[str]:
+        """Distinct face names used in the document declarations."""
+        return sorted({name for names in self.face_names().values() for name in names})
+
+    def char_shapes(self) -> List[CharShapeInfo]:
+        """Char shape records declared in ``DocInfo``."""
+        shapes = []
+        for tag, _, payload in iter_records(self.doc_info):
+            if tag == TAG_CHAR_SHAPE:
+                face_ids = struct.unpack_from("<7H", payload, 0)
+                height, attributes = struct.unpack_from("<iI", payload, 42)
+                shapes.append(CharShapeInfo(
+                    face_ids=face_ids,
+                    height=height,
+                    italic=bool(attributes & 1),
+                    bold=bool(attributes & 2),
+                ))
+        return shapes
+
+    def char_shape_ids(self) -> Set[int]:
+        """Ids of the char shapes applied to text anywhere in the body.
+
+        Covers nested paragraphs such as table cells, headers and notes.
+        """
+        ids: Set[int] = set()
+        for tag, _, payload in self.body_records():
+            if tag == TAG_PARA_CHAR_SHAPE:
+                # (start position, char shape id) pairs
+                ids.update(struct.unpack_from(f"<{len(payload) // 4}I", payload)[1::2])
+        return ids
+
+    def font_usage(self) -> Set[Tuple[str, bool]]:
+        """``(face name, bold)`` pairs applied to text in the body."""
+        faces = self.face_names()
+        shapes = self.char_shapes()
+        usage: Set[Tuple[str, bool]] = set()
+        for shape_id in self.char_shape_ids():
+            if shape_id >= len(shapes):
+                continue
+            shape = shapes[shape_id]
+            for language, face_id in zip(LANGUAGES, shape.face_ids):
+                names = faces.get(language, [])
+                if face_id < len(names):
+                    usage.add((names[face_id], shape.bold))
+        return usage
+
+
+def read_move_count(path: Union[str, Path]) -> Optional[int]:
+    """Get the template move count of a file, or ``None`` if it cannot be read."""
+    try:
+        return HwpDocument(path).move_count
+    except HwpFormatError as e:
+        print(f"Error reading {path}: {e}")
+        return None
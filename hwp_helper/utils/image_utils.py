@@ -1,28 +1,116 @@
 """Image processing utilities."""
 
-from PIL import Image, ImageChops
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Tuple
 
+import numpy as np
 
-def crop_background(image_path: str) -> Optional[Image.Image]:
+if TYPE_CHECKING:
+    from PIL import Image
+
+# A pixel is content when a channel differs from the background by more than this
+_THRESHOLD = 100
+# Number of rows or columns checked at once when refining the bounding box
+_CHUNK = 64
+
+
+def crop_background(image_path: str) -> Optional["Image.Image"]:
     """Crop background of an image and return the cropped image."""
+    from PIL import Image
+    
     try:
-        img = Image.open(image_path)
-        bg = Image.new(img.mode, img.size, img.getpixel((0, 0)))
-        diff = ImageChops.difference(img, bg)
-        diff = ImageChops.add(diff, diff, 2.0, -100)
-        bbox = diff.getbbox()
-        
-        if not bbox:
-            return None
-            
-        # Ensure minimum width
-        if bbox[2] - bbox[0] < 300:
-            bbox = (bbox[0], bbox[1], bbox[0] + 300, bbox[3])
-        
-        # Add padding
-        bbox = (bbox[0]-2, bbox[1]-2, bbox[2]+2, bbox[3]+2)
-        return img.crop(bbox)
-        
+        return crop_image(Image.open(image_path))
     except Exception:
         return None
+
+
+def crop_image(img: "Image.Image") -> Optional["Image.Image"]:
+    """Crop an open image to its content, or ``None`` if it is all background."""
+    bbox = find_content_bbox(img)
+
+    if not bbox:
+        return None
+
+    # Ensure minimum width
+    if bbox[2] - bbox[0] < 300:
+        bbox = (bbox[0], bbox[1], bbox[0] + 300, bbox[3])
+
+    # Add padding
+    bbox = (bbox[0]-2, bbox[1]-2, bbox[2]+2, bbox[3]+2)
+    return img.crop(bbox)
+
+
+def find_content_bbox(img: "Image.Image") -> Optional[Tuple[int, int, int, int]]:
+    """Find the box around pixels that differ from the top-left background colour.
+
+    The box is first located on a strided, downsampled view of the image and
+    then refined at full resolution by scanning only the margins between the
+    image edges and the coarse box, so the interior is never checked pixel
+    by pixel.
+    """
+    pixels = np.asarray(img)
+    if img.mode == "1":
+        pixels = pixels.astype(np.uint8) * 255
+    if pixels.ndim == 3 and img.mode in ("RGBA", "LA", "PA"):
+        # Like Image.getbbox, only the alpha band counts for these modes
+        pixels = pixels[..., -1]
+
+    height, width = pixels.shape[:2]
+    background = pixels[0, 0]
+    step = max(1, max(height, width) // 512)
+
+    coarse = _content_mask(pixels[::step, ::step], background)
+    rows = np.flatnonzero(coarse.any(axis=1))
+    if rows.size == 0:
+        # Content thinner than the sampling step can only be found by a full scan
+        top = _scan(pixels, background, 0, height)
+        if top is None:
+            return None
+        bottom = _scan(pixels, background, top, height, reverse=True)
+        columns = pixels[top:bottom + 1].swapaxes(0, 1)
+        left = _scan(columns, background, 0, width)
+        right = _scan(columns, background, left, width, reverse=True)
+        return left, top, right + 1, bottom + 1
+
+    cols = np.flatnonzero(coarse.any(axis=0))
+    top = _scan(pixels, background, 0, rows[0] * step + 1)
+    bottom = _scan(pixels, background, rows[-1] * step, height, reverse=True)
+    columns = pixels[top:bottom + 1].swapaxes(0, 1)
+    left = _scan(columns, background, 0, cols[0] * step + 1)
+    right = _scan(columns, background, cols[-1] * step, width, reverse=True)
+    return int(left), int(top), int(right) + 1, int(bottom) + 1
+
+
+def _content_mask(pixels: np.ndarray, background: np.ndarray) -> np.ndarray:
+    """Mark the pixels that differ from the background.
+
+    Each band is compared against its own ``[background - threshold,
+    background + threshold]`` range directly in uint8, which avoids widening
+    the pixels to compute an absolute difference.
+    """
+    if pixels.ndim == 2:
+        return _band_mask(pixels, int(background))
+    mask = _band_mask(pixels[..., 0], int(background[0]))
+    for band in range(1, pixels.shape[-1]):
+        mask |= _band_mask(pixels[..., band], int(background[band]))
+    return mask
+
+
+def _band_mask(band: np.ndarray, background: int) -> np.ndarray:
+    """Mark the values of one band outside the background range."""
+    low, high = background - _THRESHOLD, background + _THRESHOLD
+    mask = band < low if low > 0 else np.zeros(band.shape, dtype=bool)
+    if high < 255:
+        mask |= band > high
+    return mask
+
+
+def _scan(pixels: np.ndarray, background: np.ndarray, start: int, stop: int,
+          reverse: bool = False) -> Optional[int]:
+    """Get the first (or last) row in ``[start, stop)`` that has content."""
+    starts = range(start, stop, _CHUNK)
+    for chunk_start in (reversed(starts) if reverse else starts):
+        chunk = pixels[chunk_start:min(chunk_start + _CHUNK, stop)]
+        hits = np.flatnonzero(_content_mask(chunk, background).any(axis=1))
+        if hits.size:
+            return chunk_start + int(hits[-1] if reverse else hits[0])
+    return None
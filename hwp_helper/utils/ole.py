@@ -0,0 +1,163 @@
+"""Minimal reader for OLE compound documents.
+
+HWP 5.0 files are stored as OLE compound documents (Compound File Binary
+Format). This module implements just enough of the format to list and read
+streams, so HWP files can be inspected without HWP or third-party packages.
+"""
+
+import struct
+from pathlib import Path
+from typing import Dict, List, Union
+
+SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+_FREESECT = 0xFFFFFFFF
+_ENDOFCHAIN = 0xFFFFFFFE
+_NOSTREAM = 0xFFFFFFFF
+
+_STORAGE = 1
+_STREAM = 2
+_ROOT = 5
+
+
+class OleError(ValueError):
+    """Raised when a file is not a readable compound document."""
+
+
+class _DirEntry:
+    """A directory entry (storage or stream)."""
+
+    __slots__ = ("name", "type", "left", "right", "child", "start", "size")
+
+    def __init__(self, data: memoryview, major_version: int):
+        name_length = struct.unpack_from("<H", data, 64)[0]
+        self.name = bytes(data[:max(name_length - 2, 0)]).decode("utf-16-le")
+        self.type = data[66]
+        self.left, self.right, self.child = struct.unpack_from("<III", data, 68)
+        self.start = struct.unpack_from("<I", data, 116)[0]
+        self.size = struct.unpack_from("<Q", data, 120)[0]
+        if major_version == 3:
+            self.size &= 0xFFFFFFFF
+
+
+class OleFile:
+    """Read-only view of an OLE compound document."""
+
+    def __init__(self, source: Union[str, Path, bytes]):
+        if isinstance(source, (str, Path)):
+            source = Path(source).read_bytes()
+        self._data = memoryview(source)
+        if len(self._data) < 512 or bytes(self._data[:8]) != SIGNATURE:
+            raise OleError("Not an OLE compound document")
+
+        header = self._data[:512]
+        major_version = struct.unpack_from("<H", header, 0x1A)[0]
+        self.sector_size = 1 << struct.unpack_from("<H", header, 0x1E)[0]
+        self.mini_sector_size = 1 << struct.unpack_from("<H", header, 0x20)[0]
+        (num_fat_sectors, first_dir_sector, _, self.mini_cutoff,
+         first_minifat_sector, _, first_difat_sector,
+         num_difat_sectors) = struct.unpack_from("<IIIIIIII", header, 0x2C)
+
+        self._fat = self._read_fat(header, num_fat_sectors,
+                                   first_difat_sector, num_difat_sectors)
+        directory = self._read_chain(first_dir_sector)
+        self._entries = [
+            _DirEntry(directory[i:i + 128], major_version)
+            for i in range(0, len(directory) - 127, 128)
+        ]
+        if not self._entries or self._entries[0].type != _ROOT:
+            raise OleError("Missing root directory entry")
+
+        root = self._entries[0]
+        self._mini_stream = self._read_chain(root.start, root.size)
+        minifat = self._read_chain(first_minifat_sector)
+        self._minifat = list(struct.unpack(f"<{len(minifat) // 4}I", minifat))
+
+        self._paths: Dict[str, _DirEntry] = {}
+        self._walk(root.child, "")
+
+    def listdir(self) -> List[str]:
+        """List the paths of all streams, joined with ``/``."""
+        return [path for path, entry in self._paths.items() if entry.type == _STREAM]
+
+    def exists(self, path: str) -> bool:
+        """Check whether a stream or storage exists."""
+        return path in self._paths
+
+    def read(self, path: str) -> bytes:
+        """Read the whole content of a stream."""
+        entry = self._paths.get(path)
+        if entry is None or entry.type != _STREAM:
+            raise KeyError(path)
+        if entry.size < self.mini_cutoff:
+            return self._read_mini_chain(entry.start, entry.size)
+        return self._read_chain(entry.start, entry.size)
+
+    def _walk(self, index: int, prefix: str) -> None:
+        """Collect entry paths from the red-black tree of a storage."""
+        stack = [index]
+        seen = set()
+        while stack:
+            index = stack.pop()
+            if index == _NOSTREAM or index in seen or index >= len(self._entries):
+                continue
+            seen.add(index)
+            entry = self._entries[index]
+            path = f"{prefix}{entry.name}"
+            self._paths[path] = entry
+            if entry.type == _STORAGE:
+                self._walk(entry.child, f"{path}/")
+            stack.extend((entry.left, entry.right))
+
+    def _sector(self, sector: int) -> memoryview:
+        """Get the bytes of a regular sector."""
+        offset = (sector + 1) * self.sector_size
+        return self._data[offset:offset + self.sector_size]
+
+    def _read_fat(self, header: memoryview, num_fat_sectors: int,
+                  difat_sector: int, num_difat_sectors: int) -> List[int]:
+        """Read the sector allocation table."""
+        fat_sectors = list(struct.unpack_from("<109I", header, 0x4C))
+        per_sector = self.sector_size // 4
+        for _ in range(num_difat_sectors):
+            if difat_sector in (_FREESECT, _ENDOFCHAIN):
+                break
+            values = struct.unpack(f"<{per_sector}I", self._sector(difat_sector))
+            fat_sectors.extend(values[:-1])
+            difat_sector = values[-1]
+
+        fat: List[int] = []
+        for sector in fat_sectors[:num_fat_sectors]:
+            fat.extend(struct.unpack(f"<{per_sector}I", self._sector(sector)))
+        return fat
+
+    def _read_chain(self, sector: int, size: int = -1) -> bytes:
+        """Read a chain of regular sectors."""
+        chunks = []
+        seen = set()
+        while sector < len(self._fat) and sector not in seen:
+            seen.add(sector)
+            chunks.append(self._sector(sector))
+            sector = self._fat[sector]
+        data = b"".join(chunks)
+        return data if size < 0 else data[:size]
+
+    def _read_mini_chain(self, sector: int, size: int) -> bytes:
+        """Read a chain of mini sectors from the mini stream."""
+        chunks = []
+        seen = set()
+        step = self.mini_sector_size
+        while sector < len(self._minifat) and sector not in seen:
+            seen.add(sector)
+            chunks.append(self._mini_stream[sector * step:(sector + 1) * step])
+            sector = self._minifat[sector]
+        return b"".join(chunks)[:size]
+
+
+def is_ole_file(path: Union[str, Path]) -> bool:
+    """Check whether a file starts with the compound document signature."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(8) == SIGNATURE
+    except OSError:
+        return False
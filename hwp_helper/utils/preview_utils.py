@@ -0,0 +1,62 @@
+"""Read the preview images embedded in HWP documents."""
+
+import io
+import zipfile
+from pathlib import Path
+from typing import Optional, Union
+
+from .ole import OleError, OleFile, is_ole_file
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def extract_preview(path: Union[str, Path]) -> Optional[bytes]:
+    """Get the raw preview image stored in an HWP or HWPX file.
+
+    HWP 5.0 documents keep it in the ``PrvImage`` stream (PNG, BMP or GIF)
+    and HWPX documents in ``Preview/PrvImage.png``. Returns ``None`` when the
+    file has no preview or cannot be read.
+    """
+    path = Path(path)
+    try:
+        if is_ole_file(path):
+            ole = OleFile(path)
+            if ole.exists("PrvImage"):
+                return ole.read("PrvImage") or None
+        elif zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path) as archive:
+                return archive.read("Preview/PrvImage.png") or None
+    except (OSError, OleError, KeyError, zipfile.BadZipFile) as e:
+        print(f"Error reading preview of {path}: {e}")
+    return None
+
+
+def save_preview(path: Union[str, Path], destination: Union[str, Path],
+                 crop: bool = False) -> bool:
+    """Save the embedded preview of a document as a PNG file.
+
+    The preview shows the whole first page; with ``crop`` it is cropped to
+    the content like the images HWP exports for templates.
+    """
+    data = extract_preview(path)
+    if not data:
+        return False
+
+    if data.startswith(PNG_SIGNATURE) and not crop:
+        Path(destination).write_bytes(data)
+        return True
+
+    # BMP and GIF previews are converted, cropped ones re-encoded
+    try:
+        from PIL import Image
+
+        with Image.open(io.BytesIO(data)) as image:
+            if crop:
+                from .image_utils import crop_image
+
+                image = crop_image(image.convert("RGB")) or image
+            image.save(destination, "PNG")
+        return True
+    except Exception as e:
+        print(f"Error converting preview of {path}: {e}")
+        return False
@@ -0,0 +1,125 @@
+"""Startup timing: per-module import times and first paint.
+
+``StartupProfiler`` installs a meta path finder that times every module
+executed while it is active, like ``python -X importtime`` but inside the
+running application, so the report can also include application
+milestones such as the first painted frame.
+"""
+
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, List, Optional, Tuple, Union
+
+
+@dataclass
+class ImportTiming:
+    """Time spent importing one module, in seconds."""
+
+    name: str
+    depth: int
+    cumulative: float
+    self_time: float
+
+
+class StartupProfiler:
+    """Records import times and named milestones from ``start()`` onwards."""
+
+    def __init__(self):
+        self.started = perf_counter()
+        self.imports: List[ImportTiming] = []
+        self.marks: List[Tuple[str, float]] = []
+        self._local = threading.local()
+
+    def start(self) -> "StartupProfiler":
+        """Start timing imports."""
+        self.started = perf_counter()
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+        return self
+
+    def stop(self) -> None:
+        """Stop timing imports."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def mark(self, name: str) -> float:
+        """Record a milestone and return its time since start in seconds."""
+        elapsed = perf_counter() - self.started
+        self.marks.append((name, elapsed))
+        return elapsed
+
+    def find_spec(self, name: str, path: Any = None, target: Any = None) -> Any:
+        """Find the module with the other finders and time its execution."""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        loader = spec.loader
+        # Built-in and frozen importers are classes shared by many modules
+        if (loader is not None and not isinstance(loader, type)
+                and hasattr(loader, "exec_module")
+                and "exec_module" not in getattr(loader, "__dict__", {})):
+            self._wrap(loader, name)
+        return spec
+
+    def _wrap(self, loader: Any, name: str) -> None:
+        """Time ``loader.exec_module`` for a single module."""
+        exec_module = loader.exec_module
+
+        def timed_exec_module(module: Any) -> None:
+            try:
+                del loader.exec_module
+            except AttributeError:
+                pass
+            # [start, time spent in nested imports] of imports in progress
+            stack = self._local.__dict__.setdefault("stack", [])
+            stack.append([perf_counter(), 0.0])
+            try:
+                exec_module(module)
+            finally:
+                started, nested = stack.pop()
+                cumulative = perf_counter() - started
+                if stack:
+                    stack[-1][1] += cumulative
+                self.imports.append(ImportTiming(
+                    name, len(stack), cumulative, cumulative - nested
+                ))
+
+        try:
+            loader.exec_module = timed_exec_module
+        except AttributeError:
+            pass  # Loaders with __slots__ are not timed
+
+    def report(self, top: Optional[int] = None) -> str:
+        """Format the milestones and import times as text."""
+        lines = ["Startup profile", "", f"{'ms':>10}  milestone"]
+        for name, elapsed in self.marks:
+            lines.append(f"{elapsed * 1000:>10.1f}  {name}")
+
+        total = sum(timing.cumulative for timing in self.imports if timing.depth == 0)
+        lines += [
+            "",
+            f"{len(self.imports)} modules imported in {total * 1000:.1f} ms",
+            "",
+            f"{'self ms':>10} {'cumul ms':>10}  module",
+        ]
+        timings = sorted(self.imports, key=lambda timing: timing.self_time, reverse=True)
+        for timing in timings[:top]:
+            lines.append(
+                f"{timing.self_time * 1000:>10.2f} {timing.cumulative * 1000:>10.2f}  {timing.name}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, path: Union[str, Path] = "startup_profile.txt") -> Path:
+        """Write the report to a file."""
+        path = Path(path)
+        path.write_text(self.report(), encoding="utf-8")
+        return path
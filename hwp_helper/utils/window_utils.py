@@ -3,14 +3,25 @@
 import win32gui as wg
 import win32con
 from win32api import GetMonitorInfo, MonitorFromPoint
-from typing import Tuple
+from typing import Optional, Tuple
 
 
-def set_forewindow(app) -> bool:
+def get_hwnd(app) -> int:
+    """Get the handle of the active HWP window."""
+    return app.api.XHwpWindows.Active_XHwpWindow.WindowHandle
+
+
+def is_foreground_window(hwnd: int) -> bool:
+    """Check whether a window is already the foreground window."""
+    return wg.GetForegroundWindow() == hwnd
+
+
+def set_forewindow(app, hwnd: Optional[int] = None) -> bool:
     """Safely bring the HWP window to the foreground."""
     
     try:
-        hwnd = app.api.XHwpWindows.Active_XHwpWindow.WindowHandle
+        if hwnd is None:
+            hwnd = get_hwnd(app)
         
         # First try to show the window if it's minimized
         wg.ShowWindow(hwnd, win32con.SW_RESTORE)
@@ -43,11 +54,12 @@ def set_forewindow(app) -> bool:
         return False
 
 
-def show_window(app) -> bool:
+def show_window(app, hwnd: Optional[int] = None) -> bool:
     """Show the HWP window."""
     
     try:
-        hwnd = app.api.XHwpWindows.Active_XHwpWindow.WindowHandle
+        if hwnd is None:
+            hwnd = get_hwnd(app)
         return wg.ShowWindow(hwnd, 1)
     except (AttributeError):
         return False
@@ -1,20 +1,39 @@
-"""Main entry point for HWP Helper application."""
+"""Main entry point for HWP Helper application.
 
-import flet as ft
+Run with ``--profile-startup`` to write a per-module import time and first
+paint report to ``startup_profile.txt``.
+"""
 
-from hwp_helper.core.helper import HwpHelper
-from hwp_helper.ui.main_window import MainWindow
+import sys
+
+from hwp_helper.utils.startup_profile import StartupProfiler
+
+profiler = StartupProfiler().start() if "--profile-startup" in sys.argv else None
+
+import flet as ft  # noqa: E402
 
 
 def main(page: ft.Page) -> None:
     """Main application entry point."""
+    if profiler:
+        profiler.mark("main() called")
+    from hwp_helper.core.helper import HwpHelper
+    from hwp_helper.ui.main_window import MainWindow
 
     helper = None
     try:
         # Create helper and main window
         helper = HwpHelper(page)
+        helper.prewarm()
+        if profiler:
+            profiler.mark("helper ready")
         main_window = MainWindow(helper)
         
+        if profiler:
+            profiler.mark("first paint")
+            profiler.stop()
+            print(f"Startup profile written to {profiler.write_report()}")
+        
         # Set up page close handler
         def on_page_close(e):
             if helper:
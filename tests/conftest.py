@@ -0,0 +1,20 @@
+"""Shared fixtures for the HWP Helper tests."""
+
+from pathlib import Path
+
+import pytest
+
+SAMPLE_DOCUMENT = Path(__file__).resolve().parent.parent / "test.hwp"
+
+
+@pytest.fixture
+def sample_hwp() -> Path:
+    """A saved HWP 5.0 document with an embedded preview."""
+    return SAMPLE_DOCUMENT
+
+
+@pytest.fixture
+def workdir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Empty working directory; services use paths relative to it."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
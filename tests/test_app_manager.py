@@ -0,0 +1,151 @@
+"""Tests for connection liveness caching and the retry on com_error."""
+
+from pathlib import Path
+
+import pytest
+
+from hwp_helper.core.app_manager import HwpAppManager
+from hwp_helper.core.simulated import SimulatedEngines
+from hwp_helper.services.template_service import TemplateService
+from hwp_helper.utils.com_utils import com_error
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+def engines() -> SimulatedEngines:
+    return SimulatedEngines(running=1)
+
+
+@pytest.fixture
+def manager(engines, clock):
+    manager = HwpAppManager(connector=engines.connect, launcher=engines.launch,
+                            discover=lambda: None, clock=clock, liveness_ttl=5.0)
+    yield manager
+    manager.cleanup()
+
+
+def test_connection_is_trusted_within_ttl(manager, clock):
+    app = manager.get_or_create_app()
+    clock.now = 4.9
+
+    assert manager.get_or_create_app() is app
+    assert manager.probe_count == 0
+
+
+def test_connection_is_probed_after_ttl(manager, engines, clock):
+    app = manager.get_or_create_app()
+    clock.now = 5.0
+
+    assert manager.get_or_create_app() is app
+    assert manager.probe_count == 1
+    assert app.call_counts["api.PageCount"] == 1
+
+    # The probe refreshes the TTL
+    clock.now = 9.0
+    manager.get_or_create_app()
+    assert manager.probe_count == 1
+
+
+def test_successful_run_refreshes_ttl(manager, clock):
+    manager.get_or_create_app()
+    clock.now = 4.0
+    manager.run(lambda app: app.api.GetPos(), foreground=False)
+    clock.now = 8.0
+
+    manager.get_or_create_app()
+
+    assert manager.probe_count == 0
+
+
+def test_dead_connection_is_replaced_after_ttl(manager, engines, clock):
+    old = manager.get_or_create_app()
+    engines.close()
+    engines.launch()
+    clock.now = 5.0
+
+    new = manager.get_or_create_app()
+
+    assert new is not old
+    assert manager.probe_count == 1
+
+
+def test_run_retries_once_on_a_fresh_connection(manager, engines):
+    old = manager.get_or_create_app()
+    # HWP was restarted; the cached app is still within its TTL
+    engines.close()
+    engines.launch()
+
+    pos = manager.run(lambda app: app.api.GetPos(), foreground=False)
+
+    assert pos == (0, 0, 0)
+    assert old.failures == 1
+    assert manager.app is not old
+    assert manager.app.call_counts["api.GetPos"] == 1
+
+
+def test_run_gives_up_after_one_retry(manager):
+    manager.get_or_create_app()
+    attempts = []
+
+    def operation(app):
+        attempts.append(app)
+        raise com_error(-1, "busy", None, None)
+
+    with pytest.raises(com_error):
+        manager.run(operation, foreground=False)
+    assert len(attempts) == 2
+
+
+def test_other_errors_are_not_retried(manager):
+    manager.get_or_create_app()
+    attempts = []
+
+    def operation(app):
+        attempts.append(app)
+        raise ValueError("bad argument")
+
+    with pytest.raises(ValueError):
+        manager.run(operation, foreground=False)
+    assert len(attempts) == 1
+
+
+def test_reading_shapes_reconnects_after_a_restart(manager, engines):
+    manager.get_or_create_app()
+    engines.close()
+    engines.launch()
+
+    char_dict, para_dict = manager.run(
+        lambda app: (app.get_charshape().todict(), app.get_parashape().todict()),
+        foreground=False, name="save_style"
+    )
+
+    assert (char_dict, para_dict) == ({}, {})
+    assert manager.app is engines[0]
+
+
+def test_adding_a_template_reconnects_after_a_restart(manager, engines, workdir, sample_hwp):
+    Path("templates").mkdir()
+    engines.connect().open(sample_hwp)
+    manager.get_or_create_app()
+    engines.close()
+    engines.launch()
+    engines[0].open(sample_hwp)
+    service = TemplateService(app_factory=lambda: None)
+
+    added = manager.run(lambda app: service.add_template(app, "분류", "이름"),
+                        foreground=False, name="add_template")
+
+    assert added
+    assert Path("templates/분류_이름.hwp").read_bytes() == sample_hwp.read_bytes()
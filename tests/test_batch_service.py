@@ -0,0 +1,108 @@
+"""Tests for running and resuming batches on the simulated engine."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from hwp_helper.core.simulated import SimulatedApp, SimulatedEngines
+from hwp_helper.services.batch_service import REPORT_NAME, BatchRunner
+
+
+@pytest.fixture
+def source(tmp_path: Path, sample_hwp: Path) -> Path:
+    source = tmp_path / "source"
+    source.mkdir()
+    for name in ("a.hwp", "b.hwp", "c.hwp"):
+        shutil.copy(sample_hwp, source / name)
+    return source
+
+
+def runner(source: Path, operations, **app_options) -> BatchRunner:
+    return BatchRunner(source, source.parent / "output", operations,
+                       lambda: SimulatedApp(**app_options), workers=2)
+
+
+def test_run_processes_every_document(source):
+    results = list(runner(source, ["setup_koica_page", "color_double_space"]).run())
+
+    assert sorted(result.name for result in results) == ["a.hwp", "b.hwp", "c.hwp"]
+    assert all(result.ok for result in results)
+    assert list(results[0].steps) == ["setup_koica_page", "color_double_space"]
+    assert sorted(path.name for path in (source.parent / "output").iterdir()) == [
+        "a.hwp", "b.hwp", REPORT_NAME, "c.hwp"
+    ]
+
+
+def test_resume_skips_finished_documents(source):
+    list(runner(source, ["setup_koica_page"]).run())
+
+    batch = runner(source, ["setup_koica_page"])
+    assert batch.pending() == ([], 3)
+    assert list(batch.run()) == []
+
+
+def test_resume_reprocesses_changed_sources(source):
+    list(runner(source, ["setup_koica_page"]).run())
+    stat = (source / "b.hwp").stat()
+    os.utime(source / "b.hwp", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    results = list(runner(source, ["setup_koica_page"]).run())
+
+    assert [result.name for result in results] == ["b.hwp"]
+
+
+def test_resume_reprocesses_for_a_different_pipeline(source):
+    list(runner(source, ["setup_koica_page"]).run())
+
+    batch = runner(source, ["setup_page_margins"])
+    pending, skipped = batch.pending()
+
+    assert (len(pending), skipped) == (3, 0)
+    assert all(result.operations == ["setup_page_margins"] for result in batch.run())
+    assert runner(source, ["setup_page_margins"]).pending() == ([], 3)
+
+
+def test_restart_processes_everything_again(source):
+    list(runner(source, ["setup_koica_page"]).run())
+
+    results = list(runner(source, ["setup_koica_page"]).run(resume=False))
+
+    assert len(results) == 3
+    with open(source.parent / "output" / REPORT_NAME, encoding='utf-8') as f:
+        assert len(f.readlines()) == 3
+
+
+def test_failures_are_reported_and_retried_on_resume(source):
+    results = list(runner(source, ["color_double_space"], fail_on=["replace_all"]).run())
+
+    assert [result.status for result in results] == ["failed"] * 3
+    assert all("Simulated failure of replace_all" in result.error for result in results)
+    assert not (source.parent / "output" / "a.hwp").exists()
+    assert runner(source, ["color_double_space"]).pending()[1] == 0
+
+
+def test_documents_after_an_engine_crash_still_succeed(source):
+    engines = SimulatedEngines()
+
+    def factory():
+        engines.launch()
+        app = engines[len(engines) - 1]
+        if engines.launches == 1:
+            # the first hidden HWP dies before its first document
+            engines.close()
+        return app
+
+    batch = BatchRunner(source, source.parent / "output", ["setup_koica_page"],
+                        factory, workers=1)
+    results = list(batch.run())
+
+    assert [result.status for result in results] == ["failed", "ok", "ok"]
+    assert "Simulated failure of open" in results[0].error
+    assert batch.pending() == ([source / "a.hwp"], 2)
+
+
+def test_unknown_operations_are_rejected(source):
+    with pytest.raises(ValueError, match="Unknown operations: shrink"):
+        runner(source, ["setup_koica_page", "shrink"])
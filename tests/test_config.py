@@ -0,0 +1,171 @@
+"""Tests for the write-behind configuration."""
+
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from hwp_helper.core import config as config_module
+from hwp_helper.core.config import ConfigManager
+
+
+@pytest.fixture
+def config_path(workdir: Path) -> Path:
+    path = workdir / "setting.yaml"
+    path.write_text("app_width: 674\ntab: 0\n", encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Settings passed to every ``ConfigManager._write``, in order."""
+    calls = []
+    write = ConfigManager._write
+
+    def counting_write(self, settings):
+        calls.append(settings)
+        return write(self, settings)
+    monkeypatch.setattr(ConfigManager, "_write", counting_write)
+    return calls
+
+
+def read(path: Path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+def test_changes_coalesce_into_one_write(config_path, writes):
+    config = ConfigManager(str(config_path), save_delay=60)
+    for tab in range(20):
+        config.set("tab", tab)
+    config.update({"app_width": 800, "last_category": "분류"})
+
+    assert writes == []
+    assert config.flush(timeout=5)
+    config.close()
+
+    assert len(writes) == 1
+    assert read(config_path) == {"app_width": 800, "tab": 19, "last_category": "분류"}
+
+
+def test_changes_are_written_after_the_save_delay(config_path, writes):
+    config = ConfigManager(str(config_path), save_delay=0.05)
+    config.set("tab", 2)
+
+    deadline = time.monotonic() + 5
+    while not writes and time.monotonic() < deadline:
+        time.sleep(0.01)
+    config.close()
+
+    assert read(config_path)["tab"] == 2
+
+
+def test_file_is_replaced_atomically(config_path, monkeypatch):
+    replaced = []
+    replace = config_module.os.replace
+
+    def recording_replace(src, dst):
+        replaced.append((Path(src).name, Path(dst).name))
+        replace(src, dst)
+    monkeypatch.setattr(config_module.os, "replace", recording_replace)
+    config = ConfigManager(str(config_path), save_delay=60)
+
+    config.set("tab", 1)
+    assert config.flush(timeout=5)
+    config.close()
+
+    assert ("setting.yaml.tmp", "setting.yaml") in replaced
+    assert not config_path.with_name("setting.yaml.tmp").exists()
+
+
+def test_failed_dump_leaves_the_file_intact(config_path, monkeypatch):
+    def failing_dump(*args, **kwargs):
+        raise OSError("disk full")
+    config = ConfigManager(str(config_path), save_delay=60)
+    monkeypatch.setattr(config_module.yaml, "dump", failing_dump)
+
+    config.set("tab", 1)
+
+    assert not config.flush(timeout=5)
+    assert read(config_path) == {"app_width": 674, "tab": 0}
+    monkeypatch.undo()
+    config.close()
+
+
+def test_failed_write_stays_pending_and_is_retried(config_path, monkeypatch):
+    failing = [True]
+    write = ConfigManager._write
+
+    def flaky_write(self, settings):
+        if failing[0]:
+            return False
+        return write(self, settings)
+    monkeypatch.setattr(ConfigManager, "_write", flaky_write)
+    config = ConfigManager(str(config_path), save_delay=0.05)
+
+    config.set("tab", 3)
+    assert not config.flush(timeout=5)
+    assert read(config_path)["tab"] == 0
+
+    # The writer keeps trying in the background
+    failing[0] = False
+    deadline = time.monotonic() + 5
+    while read(config_path)["tab"] != 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert read(config_path)["tab"] == 3
+    assert config.flush(timeout=5)
+    config.close()
+
+
+def test_close_writes_pending_changes(config_path):
+    config = ConfigManager(str(config_path), save_delay=60)
+    config.set("tab", 4)
+
+    config.close()
+
+    assert read(config_path)["tab"] == 4
+
+
+def test_unchanged_file_loads_from_the_cache(config_path, monkeypatch):
+    ConfigManager(str(config_path)).close()
+    assert config_path.with_name("setting.yaml.cache").exists()
+
+    def no_yaml(*args, **kwargs):
+        raise AssertionError("YAML parsed despite a valid cache")
+    monkeypatch.setattr(config_module.yaml, "load", no_yaml)
+    config = ConfigManager(str(config_path))
+    config.close()
+
+    assert config.get("app_width") == 674
+
+
+def test_cache_is_ignored_after_the_file_changes(config_path):
+    ConfigManager(str(config_path)).close()
+
+    config_path.write_text("app_width: 1024\ntab: 1\nprewarm_hwp: true\n", encoding='utf-8')
+    config = ConfigManager(str(config_path))
+    config.close()
+
+    assert config.settings == {"app_width": 1024, "tab": 1, "prewarm_hwp": True}
+
+
+def test_missing_file_is_created_with_defaults(workdir):
+    config = ConfigManager("setting.yaml", save_delay=60)
+
+    assert config.flush(timeout=5)
+    config.close()
+
+    assert read(workdir / "setting.yaml")["app_width"] == 674
+
+
+def test_relative_path_is_kept_across_a_directory_change(workdir, monkeypatch):
+    config = ConfigManager("setting.yaml", save_delay=60)
+    config.set("tab", 5)
+    (workdir / "elsewhere").mkdir()
+    monkeypatch.chdir(workdir / "elsewhere")
+
+    config.close()
+
+    assert read(workdir / "setting.yaml")["tab"] == 5
+    assert not (workdir / "elsewhere" / "setting.yaml").exists()
@@ -0,0 +1,68 @@
+"""Tests for the pool of hidden engines."""
+
+import pytest
+
+from hwp_helper.core.simulated import SimulatedEngines
+from hwp_helper.services.engine_pool import EnginePool
+from hwp_helper.utils.com_utils import com_error
+
+
+@pytest.fixture
+def engines() -> SimulatedEngines:
+    return SimulatedEngines()
+
+
+def launcher(engines: SimulatedEngines):
+    """App factory starting a new engine for every call."""
+    def launch():
+        engines.launch()
+        return engines[len(engines) - 1]
+    return launch
+
+
+def test_results_cover_every_item(engines):
+    pool = EnginePool(launcher(engines), workers=2)
+
+    results = list(pool.map_unordered(lambda app, item: item * 2, range(5)))
+
+    assert sorted(result for _, result, _ in results) == [0, 2, 4, 6, 8]
+    assert engines.launches == 2
+    assert not any(app.alive for app in engines._created)
+
+
+def test_crashed_engine_is_replaced(engines):
+    def job(app, item):
+        if item == 1:
+            # HWP crashes while working on this item
+            app.alive = False
+        return app.api.GetPos()
+
+    pool = EnginePool(launcher(engines), workers=1)
+    results = {item: (result, error) for item, result, error in
+               pool.map_unordered(job, range(4))}
+
+    assert isinstance(results[1][1], com_error)
+    assert all(results[item] == ((0, 0, 0), None) for item in (0, 2, 3))
+    assert engines.launches == 2
+
+
+def test_other_errors_keep_the_engine(engines):
+    def job(app, item):
+        if item == 0:
+            raise ValueError("bad document")
+        return item
+
+    pool = EnginePool(launcher(engines), workers=1)
+    errors = [error for _, _, error in pool.map_unordered(job, range(3))]
+
+    assert isinstance(errors[0], ValueError) and errors[1:] == [None, None]
+    assert engines.launches == 1
+
+
+def test_engines_that_fail_to_start_fail_their_jobs():
+    def factory():
+        raise com_error(-1, "HWP is not installed", None, None)
+
+    results = list(EnginePool(factory).map_unordered(lambda app, item: item, range(2)))
+
+    assert all(isinstance(error, com_error) for _, _, error in results)
@@ -0,0 +1,49 @@
+"""Tests for reading template metadata from saved HWP files."""
+
+import pytest
+
+from hwp_helper.utils.hwp_reader import HwpDocument, HwpFormatError, read_move_count
+
+
+@pytest.fixture
+def document(sample_hwp) -> HwpDocument:
+    return HwpDocument(sample_hwp)
+
+
+def test_paragraphs(document):
+    assert document.paragraph_count == 2
+    assert document.paragraphs() == ["ㅅㄷㅆ", ""]
+
+
+def test_move_count_is_the_last_paragraph_index(document, sample_hwp):
+    # as GetPos reports at the end of the document
+    assert document.move_count == 1
+    assert read_move_count(sample_hwp) == 1
+
+
+def test_move_count_without_a_trailing_empty_paragraph(document, monkeypatch):
+    monkeypatch.setattr(document, "paragraph_lengths", lambda: [20, 5, 12])
+
+    assert document.move_count == 2
+
+
+def test_unreadable_files(tmp_path):
+    path = tmp_path / "broken.hwp"
+    path.write_bytes(b"not an HWP file")
+
+    with pytest.raises(HwpFormatError):
+        HwpDocument(path).paragraphs()
+    assert read_move_count(path) is None
+
+
+def test_face_names(document):
+    faces = document.face_names()
+
+    assert faces["hangul"] == ["바탕", "함초롬돋움", "함초롬바탕"]
+    assert document.fonts == ["바탕", "함초롬돋움", "함초롬바탕"]
+
+
+def test_font_usage_lists_faces_applied_to_text(document):
+    assert not any(shape.bold for shape in document.char_shapes())
+    # 함초롬돋움 is declared but not applied to any text
+    assert document.font_usage() == {("바탕", False), ("함초롬바탕", False)}
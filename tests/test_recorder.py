@@ -0,0 +1,156 @@
+"""Tests for recording calls and replaying the exported log."""
+
+import sys
+import types
+from pathlib import Path
+
+from hwp_helper.callbacks.hwp_callbacks import color_double_space, process_font
+from hwp_helper.core.app_manager import HwpAppManager
+from hwp_helper.core.recorder import (
+    CallRecord, CallReplayer, _decode_shape, load_calls, round_trips,
+)
+from hwp_helper.core.simulated import SimulatedApp
+from hwp_helper.services.hwp_operations import HwpOperationService
+from hwp_helper.services.style_service import StyleService
+from hwp_helper.services.template_service import TemplateService
+
+CHARSHAPE = {"FaceNameHangul": "KoPubWorld돋움체 Medium", "Height": 1100, "Bold": 0}
+
+
+def record_session(app, sample_hwp, template):
+    """Run a short editing session against ``app`` with recording on.
+
+    With no liveness TTL every operation probes the connection first.
+    """
+    manager = HwpAppManager(connector=lambda: app, liveness_ttl=0.0)
+    manager.recorder.enabled = True
+    Path("templates").mkdir(exist_ok=True)
+    templates = TemplateService(app_factory=lambda: None)
+    try:
+        manager.run(lambda app: app.open(sample_hwp), name="open")
+        HwpOperationService(manager).insert_template(str(template), move_count=2)
+        color_double_space(manager)
+        process_font(manager)
+        manager.run(lambda app: (app.get_charshape().todict(), app.get_parashape().todict()),
+                    foreground=False, name="save_style")
+        StyleService(manager).apply_style(CHARSHAPE)
+        manager.run(lambda app: templates.add_template(app, "분류", "이름"),
+                    foreground=False, name="add_template")
+        manager.run(lambda app: app.get_hwnd(), foreground=False, name="get_hwnd")
+        manager.run(lambda app: app.api.GetPos(), name="get_pos")
+    finally:
+        manager.cleanup()
+    return manager.recorder
+
+
+def test_record_json_round_trip():
+    record = CallRecord("insert_template", "call", "insert_file", ["a.hwp"],
+                        start=0.5, duration=0.01, result=True)
+
+    data = record.to_json()
+
+    assert "kw" not in data and "e" not in data
+    assert CallRecord.from_json(data) == record
+
+
+def test_simulated_shapes_decode_without_an_hwpapi_class(monkeypatch):
+    hwpapi = types.ModuleType("hwpapi")
+    hwpapi.classes = types.ModuleType("hwpapi.classes")
+    monkeypatch.setitem(sys.modules, "hwpapi", hwpapi)
+    monkeypatch.setitem(sys.modules, "hwpapi.classes", hwpapi.classes)
+
+    shape = _decode_shape("_SimulatedCharShape", {"Bold": 1})
+
+    assert shape.todict() == {"Bold": 1}
+
+
+def test_exported_log_replays_without_mismatches(workdir, sample_hwp):
+    template = workdir / "template.hwp"
+    template.write_bytes(b"x")
+    recorder = record_session(SimulatedApp(char_shape={"Height": 1000}), sample_hwp, template)
+
+    records = load_calls(recorder.export())
+
+    assert [record.to_json() for record in records] == \
+        [record.to_json() for record in recorder.records()]
+    assert set(round_trips(records)) == {
+        "open", "insert_template", "color_double_space", "process_font", "save_style",
+        "apply_style", "add_template", "get_hwnd", "get_pos", "liveness_probe",
+    }
+    assert round_trips(records)["liveness_probe"] == 8
+
+    # Review rules pass character shapes to replace_all
+    assert any("$shape" in str(record.kwargs) for record in records)
+
+    # save_block writes into the folder add_template made and removed
+    Path("temp").mkdir()
+    app = SimulatedApp(char_shape={"Height": 1000})
+    report = CallReplayer(app).run(records)
+
+    assert report.calls == len(records)
+    assert (report.errors, report.mismatches) == (0, [])
+    assert app.char_shape["Height"] == 1100
+    assert app.paragraphs == 2
+
+
+def test_replay_reports_changed_results(workdir, sample_hwp):
+    template = workdir / "template.hwp"
+    template.write_bytes(b"x")
+    records = record_session(SimulatedApp(), sample_hwp, template).records()
+    template.unlink()
+    Path("temp").mkdir()
+
+    report = CallReplayer(SimulatedApp()).run(records)
+
+    # Without the inserted paragraph the cursor also ends up elsewhere
+    assert report.mismatches == [
+        "insert_template insert_file: recorded True, replayed False",
+        "get_pos api.GetPos: recorded [0, 1, 0], replayed [0, 0, 0]",
+    ]
+
+
+def test_replay_reports_new_errors(workdir, sample_hwp):
+    template = workdir / "template.hwp"
+    template.write_bytes(b"x")
+    records = record_session(SimulatedApp(), sample_hwp, template).records()
+    Path("temp").mkdir()
+
+    report = CallReplayer(SimulatedApp(fail_on=["api.GetPos"])).run(records)
+
+    assert report.errors == 1
+    assert report.mismatches[0].startswith("get_pos api.GetPos: recorded success, replayed ")
+
+
+def test_failed_liveness_probe_is_recorded():
+    manager = HwpAppManager(connector=SimulatedApp, liveness_ttl=0.0)
+    manager.recorder.enabled = True
+    try:
+        manager.get_or_create_app()
+        manager.app.alive = False
+        manager.get_or_create_app()
+    finally:
+        manager.cleanup()
+
+    probe, = manager.recorder.records()
+    assert (probe.operation, probe.path) == ("liveness_probe", "api.PageCount")
+    assert "Simulated failure of api.PageCount" in probe.error
+
+
+def test_window_lookups_are_recorded(monkeypatch):
+    window_utils = types.ModuleType("hwp_helper.utils.window_utils")
+    window_utils.get_hwnd = lambda app: app.api.XHwpWindows.Active_XHwpWindow.WindowHandle
+    window_utils.is_foreground_window = lambda hwnd: False
+    window_utils.set_forewindow = window_utils.show_window = lambda app, hwnd: True
+    monkeypatch.setitem(sys.modules, "hwp_helper.utils.window_utils", window_utils)
+    app = SimulatedApp()
+    manager = HwpAppManager(connector=lambda: app)
+    manager.recorder.enabled = True
+    try:
+        manager.run(lambda app: app.move(), name="move")
+    finally:
+        manager.cleanup()
+
+    assert [(record.operation, record.path) for record in manager.recorder.records()] == [
+        ("move", "api.XHwpWindows.Active_XHwpWindow.WindowHandle"),
+        ("move", "move"),
+    ]
@@ -0,0 +1,86 @@
+"""Tests for compiling and running review plans."""
+
+import pytest
+
+from hwp_helper.core.simulated import SimulatedApp
+from hwp_helper.services.font_inventory import document_font_usage, read_font_usage
+from hwp_helper.services.review_rules import (
+    COLOR_DOUBLE_SPACE_RULES, PASS_SECONDS, ReviewPlan, ReviewRule, kopub_font_rules,
+)
+
+
+@pytest.fixture(autouse=True)
+def pass_seconds(monkeypatch):
+    """Start every test from the documented per-pass estimate."""
+    monkeypatch.setattr(ReviewPlan, "pass_seconds", PASS_SECONDS)
+
+
+def test_repeated_and_compatible_rules_share_passes():
+    plan = ReviewPlan(kopub_font_rules())
+
+    # each family's bold rule repeats; Medium and Light each get a pass
+    assert len(plan.rules) == 16
+    assert len(plan.passes) == 12
+
+
+def test_saved_time_when_every_rule_is_skipped():
+    app = SimulatedApp()
+
+    report = ReviewPlan(kopub_font_rules(), usage=set()).run(app)
+
+    assert (report.passes, app.replacements) == (0, 0)
+    assert report.saved == pytest.approx(16 * PASS_SECONDS)
+
+
+def test_saved_time_uses_the_pass_time_measured_before():
+    app = SimulatedApp(replace_seconds=0.01)
+    ReviewPlan(COLOR_DOUBLE_SPACE_RULES).run(app)
+    measured = ReviewPlan.pass_seconds
+    assert measured >= 0.01
+
+    report = ReviewPlan(kopub_font_rules()).run(app)
+
+    assert report.saved == pytest.approx(4 * measured)
+
+
+def test_changed_counts_rules_whose_pass_replaced_something():
+    rules = [ReviewRule("a", "x"), ReviewRule("a", "x"), ReviewRule("b", "y")]
+
+    report = ReviewPlan(rules).run(SimulatedApp())
+
+    # HWP reports a bool per pass, shared by the rules in it
+    assert report.changed == 3
+    assert [rule.hits for rule in report.rules] == [1, 1, 1]
+
+
+def test_kopub_rules_are_skipped_without_kopub_fonts(sample_hwp):
+    app = SimulatedApp()
+
+    plan = ReviewPlan(kopub_font_rules(), usage=read_font_usage(sample_hwp))
+    report = plan.run(app)
+
+    assert (len(plan.skipped), report.passes) == (16, 0)
+    assert all(rule.skipped for rule in report.rules)
+    assert app.replacements == 0
+
+
+def test_only_rules_for_used_fonts_run():
+    app = SimulatedApp()
+    usage = {("KoPub돋움체 Medium", True), ("바탕", False)}
+
+    report = ReviewPlan(kopub_font_rules(), usage=usage).run(app)
+
+    assert [rule.name for rule in report.rules if not rule.skipped] == ["KoPub돋움체 Medium bold"]
+    assert app.replacements == 1
+
+
+def test_open_document_usage_needs_a_saved_file(sample_hwp):
+    app = SimulatedApp()
+    assert document_font_usage(app) is None
+
+    app.open(sample_hwp)
+    assert document_font_usage(app) == {("바탕", False), ("함초롬바탕", False)}
+
+    # unsaved changes: the file no longer shows what is in the document
+    app.setup_page(left=20)
+    assert document_font_usage(app) is None
@@ -0,0 +1,147 @@
+"""Tests for the simulated HWP engine."""
+
+from pathlib import Path
+
+import pytest
+
+from hwp_helper.core.app_manager import HwpAppManager
+from hwp_helper.core.simulated import RPC_E_SERVER_UNAVAILABLE, SimulatedApp, SimulatedEngines
+from hwp_helper.utils.com_utils import com_error
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_calls_are_counted_by_name():
+    app = SimulatedApp()
+
+    app.move()
+    app.move()
+    app.api.GetPos()
+
+    assert app.calls == 3
+    assert app.call_counts["move.NextPara"] == 2
+    assert app.call_counts["api.GetPos"] == 1
+
+
+def test_fail_on_fails_only_the_named_calls():
+    app = SimulatedApp(fail_on=["replace_all"])
+
+    with pytest.raises(com_error) as excinfo:
+        app.replace_all()
+
+    assert excinfo.value.args[0] == RPC_E_SERVER_UNAVAILABLE
+    assert app.move()
+    assert (app.failures, app.replacements) == (1, 0)
+
+
+def test_failure_rate_is_reproducible_with_a_seed():
+    def failures(seed):
+        app = SimulatedApp(failure_rate=0.3, seed=seed)
+        failed = []
+        for _ in range(50):
+            try:
+                app.move()
+                failed.append(False)
+            except com_error:
+                failed.append(True)
+        assert app.failures == sum(failed)
+        return failed
+
+    assert failures(1) == failures(1)
+    assert 0 < sum(failures(1)) < 50
+
+
+def test_every_call_fails_after_quit():
+    app = SimulatedApp()
+    app.quit()
+
+    with pytest.raises(com_error):
+        app.api.PageCount
+    assert not app.alive
+
+
+def test_save_under_another_name_copies_the_document(tmp_path, sample_hwp):
+    app = SimulatedApp()
+    app.open(sample_hwp)
+    app.setup_page(left=20)
+
+    assert app.modified
+    app.save(tmp_path / "copy.hwp")
+
+    assert (tmp_path / "copy.hwp").read_bytes() == sample_hwp.read_bytes()
+    assert not app.modified
+
+
+def test_connect_returns_the_first_running_engine():
+    engines = SimulatedEngines(running=2)
+
+    assert engines.connect() is engines[0]
+    assert engines.connect() is engines[0]
+    assert (len(engines), engines.lookups) == (2, 2)
+
+
+def test_connect_finds_nothing_until_hwp_is_launched():
+    engines = SimulatedEngines()
+
+    assert engines.connect() is None
+    engines.launch()
+
+    assert isinstance(engines.connect(), SimulatedApp)
+    assert (engines.launches, engines.lookups) == (1, 2)
+
+
+def test_launched_engine_shows_up_after_startup():
+    clock = Clock()
+    engines = SimulatedEngines(startup=2.0, clock=clock)
+    engines.launch()
+
+    assert engines.connect() is None
+    clock.now = 2.0
+    assert engines.connect() is not None
+
+
+def test_closed_engine_fails_calls_and_is_gone():
+    engines = SimulatedEngines(running=1)
+    app = engines.connect()
+
+    engines.close()
+
+    assert engines.connect() is None
+    with pytest.raises(com_error):
+        app.api.GetPos()
+    assert engines.failures == 1
+
+
+def test_calls_include_lookups_and_every_engine():
+    engines = SimulatedEngines(running=1)
+    engines.connect().move()
+    engines.close()
+    engines.launch()
+    engines.connect().move()
+
+    assert engines.calls == 4
+
+
+def test_app_manager_waits_for_a_cold_start():
+    clock = Clock()
+    engines = SimulatedEngines(startup=1.0, clock=clock)
+    manager = HwpAppManager(connector=engines.connect, launcher=engines.launch,
+                            discover=lambda: Path("hwp.exe"), clock=clock,
+                            sleep=clock.sleep)
+    try:
+        app = manager.get_or_create_app()
+    finally:
+        manager.cleanup()
+
+    assert app is engines[0]
+    assert engines.launches == 1
+    assert clock.now >= 1.0
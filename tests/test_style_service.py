@@ -0,0 +1,59 @@
+"""Tests for applying saved styles as deltas."""
+
+from hwp_helper.core.app_manager import HwpAppManager
+from hwp_helper.core.simulated import SimulatedApp, _SimulatedShape
+from hwp_helper.services.style_service import StyleService, shape_diff
+
+CHARSHAPE = {"FaceNameHangul": "KoPubWorld돋움체 Medium", "Height": 1100,
+             "Bold": 0, "Italic": 0, "TextColor": 0, "Spacing": -5}
+PARASHAPE = {"LineSpacing": 160, "AlignType": 0, "LeftMargin": 0}
+
+
+def apply(app, charshape=None, parashape=None):
+    service = StyleService(HwpAppManager(connector=lambda: app))
+    try:
+        return service.app_manager.run(
+            lambda app: service.apply(app, charshape, parashape), foreground=False
+        )
+    finally:
+        service.app_manager.cleanup()
+
+
+def test_shape_diff_treats_unreported_properties_as_different():
+    assert shape_diff({"Height": 1000, "Bold": 1, "Italic": None},
+                      {"Height": 1000}) == {"Bold": 1}
+
+
+def test_matching_selection_writes_nothing():
+    app = SimulatedApp(char_shape=CHARSHAPE, para_shape=PARASHAPE)
+
+    result = apply(app, CHARSHAPE, PARASHAPE)
+
+    assert (result.char_properties, result.para_properties, result.actions) == (0, 0, 0)
+    assert app.property_writes == 0
+    assert app.call_counts["HAction.Execute.CharShape"] == 0
+
+
+def test_only_changed_properties_are_written():
+    app = SimulatedApp(char_shape={**CHARSHAPE, "Height": 1000, "Bold": 1},
+                       para_shape=PARASHAPE)
+
+    result = apply(app, CHARSHAPE, PARASHAPE)
+
+    assert result.char_properties == 2
+    assert result.actions == 1
+    assert app.property_writes == 2
+    assert app.char_shape == CHARSHAPE
+
+
+def test_delta_writes_fewer_properties_than_a_full_set():
+    selection = {**CHARSHAPE, "TextColor": 255}
+    full = SimulatedApp(char_shape=selection)
+    delta = SimulatedApp(char_shape=selection)
+
+    full.set_charshape(_SimulatedShape(CHARSHAPE))
+    apply(delta, CHARSHAPE)
+
+    assert full.char_shape == delta.char_shape == CHARSHAPE
+    assert full.property_writes == len(CHARSHAPE)
+    assert delta.property_writes == 1
@@ -0,0 +1,64 @@
+"""Tests for loading the persisted template catalog."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from hwp_helper.services.template_catalog import TemplateCatalog
+
+
+@pytest.fixture
+def library(workdir):
+    for folder in ("templates", "images"):
+        Path(folder).mkdir()
+    Path("templates/분류_서식.hwp").write_bytes(b"x")
+    Path("images/분류_서식_3.png").write_bytes(b"x")
+    return workdir
+
+
+def entries(catalog: TemplateCatalog):
+    return [(entry.category, entry.name, entry.move_count) for entry in catalog.entries()]
+
+
+def test_saved_catalog_loads_without_rebuilding(library, monkeypatch):
+    TemplateCatalog().rebuild()
+
+    catalog = TemplateCatalog()
+    monkeypatch.setattr(catalog, "rebuild", lambda: pytest.fail("catalog rebuilt"))
+    catalog.load()
+
+    assert entries(catalog) == [("분류", "서식", 3)]
+
+
+@pytest.mark.parametrize("content", [
+    "not json",
+    "[]",
+    json.dumps({"version": 0, "entries": []}),
+    json.dumps({"version": TemplateCatalog.VERSION, "entries": [{"filename": "분류_서식"}]}),
+])
+def test_unreadable_catalog_is_rebuilt(library, content):
+    TemplateCatalog().rebuild()
+    Path("template_catalog.json").write_text(content, encoding='utf-8')
+
+    catalog = TemplateCatalog()
+    catalog.load()
+
+    assert entries(catalog) == [("분류", "서식", 3)]
+
+
+def test_entries_with_unknown_fields_are_rebuilt(library):
+    TemplateCatalog().rebuild()
+    with open("template_catalog.json", 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    for item in data["entries"]:
+        item["pinned"] = True
+    with open("template_catalog.json", 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+    catalog = TemplateCatalog()
+    catalog.load()
+
+    assert entries(catalog) == [("분류", "서식", 3)]
+    with open("template_catalog.json", 'r', encoding='utf-8') as f:
+        assert "pinned" not in f.read()
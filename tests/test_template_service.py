@@ -0,0 +1,152 @@
+"""Tests for incremental template updates."""
+
+import os
+import shutil
+from pathlib import Path
+
+from PIL import Image
+
+from hwp_helper.core.simulated import SimulatedApp
+from hwp_helper.services.template_service import TemplateService
+
+# test.hwp's embedded thumbnail, cropped
+EMBEDDED_PREVIEW_SIZE = (304, 841)
+
+
+def add_template(sample: Path, stem: str) -> Path:
+    templates = Path("templates")
+    templates.mkdir(exist_ok=True)
+    return Path(shutil.copyfile(sample, templates / f"{stem}.hwp"))
+
+
+def update(service: TemplateService, incremental: bool = True):
+    for _ in service.update_templates(incremental=incremental):
+        pass
+    return service.last_report
+
+
+def new_service() -> TemplateService:
+    # No HWP: previews come from the documents themselves
+    return TemplateService(app_factory=lambda: None)
+
+
+class Engines:
+    """App factory keeping the simulated engines it created."""
+
+    def __init__(self):
+        self.apps = []
+
+    def __call__(self) -> SimulatedApp:
+        self.apps.append(SimulatedApp())
+        return self.apps[-1]
+
+    def count(self, name: str) -> int:
+        return sum(app.call_counts[name] for app in self.apps)
+
+
+def test_first_update_renders_every_template(workdir, sample_hwp):
+    add_template(sample_hwp, "분류_하나")
+    add_template(sample_hwp, "분류_둘")
+
+    report = update(new_service())
+
+    assert (report.rendered, report.skipped, report.removed, report.failed) == (2, 0, 0, 0)
+    assert len(list(Path("images").glob("*.png"))) == 2
+
+
+def test_unchanged_templates_are_skipped(workdir, sample_hwp):
+    add_template(sample_hwp, "분류_하나")
+    add_template(sample_hwp, "분류_둘")
+    update(new_service())
+
+    report = update(new_service())
+
+    assert (report.rendered, report.skipped, report.removed) == (0, 2, 0)
+    assert not report.failed
+
+
+def test_touched_template_with_same_content_is_skipped(workdir, sample_hwp):
+    path = add_template(sample_hwp, "분류_하나")
+    update(new_service())
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    report = update(new_service())
+
+    assert (report.rendered, report.skipped) == (0, 1)
+
+
+def test_added_and_removed_templates(workdir, sample_hwp):
+    add_template(sample_hwp, "분류_하나")
+    removed = add_template(sample_hwp, "분류_둘")
+    service = new_service()
+    update(service)
+    removed_image = Path(service.catalog.get(removed.stem).image_path)
+    removed.unlink()
+    add_template(sample_hwp, "분류_셋")
+
+    report = update(service)
+
+    assert (report.rendered, report.skipped, report.removed) == (1, 1, 1)
+    assert not removed_image.exists()
+    assert [entry.filename for entry in service.last_changes.removed] == ["분류_둘"]
+    assert [entry.filename for entry in service.last_changes.added] == ["분류_셋"]
+
+
+def test_full_update_renders_everything_again(workdir, sample_hwp):
+    add_template(sample_hwp, "분류_하나")
+    update(new_service())
+
+    report = update(new_service(), incremental=False)
+
+    assert (report.rendered, report.skipped) == (1, 0)
+
+
+def test_unchanged_templates_are_not_opened_again(workdir, sample_hwp):
+    add_template(sample_hwp, "분류_하나")
+    changed = add_template(sample_hwp, "분류_둘")
+    engines = Engines()
+    update(TemplateService(app_factory=engines))
+    assert engines.count("open") == 2
+    saves_per_template = engines.count("save") // 2
+
+    engines = Engines()
+    report = update(TemplateService(app_factory=engines))
+
+    assert report.skipped == 2
+    assert (engines.count("open"), engines.count("save")) == (0, 0)
+
+    changed.write_bytes(changed.read_bytes() + b"\0" * 512)
+    engines = Engines()
+    report = update(TemplateService(app_factory=engines))
+
+    assert (report.rendered, report.skipped) == (1, 1)
+    assert engines.count("open") == 1
+    assert engines.count("save") == saves_per_template
+    assert engines.apps[0].path == changed
+
+
+def test_engine_renders_previews_by_default(workdir, sample_hwp):
+    add_template(sample_hwp, "분류_하나")
+    engines = Engines()
+    service = TemplateService(app_factory=engines)
+
+    update(service)
+
+    assert engines.count("save") == 2  # without master pages, as an image
+    image = Path(service.catalog.get("분류_하나").image_path)
+    with Image.open(image) as preview:
+        assert preview.size != EMBEDDED_PREVIEW_SIZE
+
+
+def test_embedded_previews_skip_the_export(workdir, sample_hwp):
+    add_template(sample_hwp, "분류_하나")
+    engines = Engines()
+    service = TemplateService(app_factory=engines, embedded_previews=True)
+
+    update(service)
+
+    assert engines.count("save") == 1
+    image = Path(service.catalog.get("분류_하나").image_path)
+    with Image.open(image) as preview:
+        assert preview.size == EMBEDDED_PREVIEW_SIZE